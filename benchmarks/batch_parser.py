@@ -0,0 +1,50 @@
+"""Benchmark parsing many small program codes
+
+Parse the same small snippet many times, once with a new parser per
+snippet and once with ``Parser.parse_many``.
+
+Usage:
+    python -m benchmarks.batch_parser [--snippets 1000 10000]
+
+"""
+import time
+from argparse import ArgumentParser
+from typing import List
+
+from vega.front_end.diagnostics import Diagnostics
+from vega.front_end.parser import Parser
+
+SNIPPET: str = '''func f(a: int) -> int {
+    x: int = a * 2;
+    if (x > 10) {
+        x = x - 1;
+    }
+    return x;
+}
+'''
+
+
+def main() -> None:
+    """Run benchmark and print a result table"""
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--snippets', nargs='+', type=int,
+                        default=[1000, 10000])
+    args = parser.parse_args()
+
+    print(f'{"snippets":>10} {"mode":>8} {"seconds":>10} {"snippets/s":>12}')
+    for snippets in args.snippets:
+        sources: List[str] = [SNIPPET] * snippets
+        for mode in ('single', 'batch'):
+            start: float = time.perf_counter()
+            if mode == 'single':
+                for code in sources:
+                    Parser(code, diagnostics=Diagnostics()).parse()
+            else:
+                Parser.parse_many(sources)
+            seconds: float = time.perf_counter() - start
+            print(f'{snippets:>10} {mode:>8} {seconds:>10.4f} '
+                  f'{snippets / seconds:>12.0f}')
+
+
+if __name__ == '__main__':
+    main()
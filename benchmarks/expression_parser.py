@@ -0,0 +1,96 @@
+"""Benchmark parsing of long arithmetic expressions
+
+Generate a function assigning long expressions mixing all binary operator
+levels and time a full parse. Python function calls per token are counted
+with a profile hook in a separate run.
+
+Usage:
+    python -m benchmarks.expression_parser [--operands 100 1000]
+
+"""
+import sys
+import time
+from argparse import ArgumentParser
+from itertools import cycle
+from typing import Iterator
+from typing import List
+
+from vega.front_end.lexer import Lexer
+from vega.front_end.parser import Parser
+
+# binary operators cycled through between operands
+OPERATORS: List[str] = ['+', '*', '-', '/', '<', 'or', 'and', '==']
+
+# expression statements in the function body
+STATEMENTS: int = 20
+
+
+def function_body(operands: int) -> str:
+    """Generate program code assigning long expressions
+
+    Args:
+        operands: number of operands of each expression
+
+    Returns:
+        program code
+    """
+    operators: Iterator[str] = cycle(OPERATORS)
+    terms: List[str] = ['x']
+    for index in range(1, operands):
+        terms.append(f'{next(operators)} {index}')
+    expression: str = ' '.join(terms)
+    body: str = ''.join(f'    x = {expression};\n'
+                        for _ in range(STATEMENTS))
+    return f'func main() -> int {{\n    x: int = 0;\n{body}}}\n'
+
+
+def count_calls(code: str) -> int:
+    """Count Python function calls of one parse
+
+    Args:
+        code: program code
+
+    Returns:
+        number of calls
+    """
+    calls: List[int] = [0]
+
+    def profile(frame, event, arg):  # pylint: disable=unused-argument
+        if event == 'call':
+            calls[0] += 1
+
+    parser: Parser = Parser(code)
+    sys.setprofile(profile)
+    try:
+        parser.parse()
+    finally:
+        sys.setprofile(None)
+    return calls[0]
+
+
+def main() -> None:
+    """Run benchmark and print a result table"""
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--operands', nargs='+', type=int,
+                        default=[100, 1000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f'{"operands":>10} {"tokens":>10} {"seconds":>10} '
+          f'{"tokens/s":>12} {"calls/token":>12}')
+    for operands in args.operands:
+        code: str = function_body(operands)
+        tokens: int = sum(1 for _ in Lexer(code).tokens())
+        timings: List[float] = []
+        for _ in range(args.repeat):
+            start: float = time.perf_counter()
+            Parser(code).parse()
+            timings.append(time.perf_counter() - start)
+        best: float = min(timings)
+        calls: int = count_calls(code)
+        print(f'{operands:>10} {tokens:>10} {best:>10.4f} '
+              f'{tokens / best:>12.0f} {calls / tokens:>12.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark re-parsing after an edit to one function
+
+Generate a program of many functions, each calling the function in front
+of it, parse it once and time parsing it again after editing the body of
+the middle function, after adding a line to it and after renaming it.
+
+Usage:
+    python -m benchmarks.incremental_parser [--functions 1000 5000]
+
+"""
+import time
+from argparse import ArgumentParser
+from typing import Callable
+from typing import List
+from typing import Tuple
+
+from vega.front_end.incremental import IncrementalParser
+
+# one function, {0} is replaced by its number and {1} by the one in front
+FUNCTION: str = '''func f{0}(a: int) -> int {{
+    x: int = a * {0};
+    if (x > 10) {{
+        x = f{1}(x - 1);
+    }}
+    return x;
+}}
+'''
+
+
+def program(functions: int) -> List[str]:
+    """Generate code of the functions of a program
+
+    Args:
+        functions: number of functions
+
+    Returns:
+        code of every function
+    """
+    return [FUNCTION.format(index, max(0, index - 1))
+            for index in range(functions)]
+
+
+def edits(functions: int) -> List[Tuple[str, Callable[[str], str]]]:
+    """Edits applied to the code of the middle function
+
+    Args:
+        functions: number of functions
+
+    Returns:
+        name and edit of the function code
+    """
+    middle: int = functions // 2
+    return [
+        ('body', lambda code: code.replace(f'a * {middle}',
+                                           f'a + {middle}')),
+        ('line', lambda code: code.replace('    return x;',
+                                           '    x = x + 1;\n    return x;')),
+        ('rename', lambda code: code.replace(f'func f{middle}(',
+                                             f'func g{middle}(')),
+    ]
+
+
+def main() -> None:
+    """Run benchmark and print a result table"""
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--functions', nargs='+', type=int,
+                        default=[1000, 5000])
+    args = parser.parse_args()
+
+    print(f'{"functions":>10} {"edit":>8} {"seconds":>10} {"parsed":>8}')
+    for functions in args.functions:
+        codes: List[str] = program(functions)
+        incremental: IncrementalParser = IncrementalParser()
+        start: float = time.perf_counter()
+        incremental.parse(''.join(codes))
+        print(f'{functions:>10} {"full":>8} '
+              f'{time.perf_counter() - start:>10.4f} '
+              f'{incremental.parsed:>8}')
+        for name, edit in edits(functions):
+            edited: List[str] = list(codes)
+            edited[functions // 2] = edit(edited[functions // 2])
+            start = time.perf_counter()
+            incremental.parse(''.join(edited))
+            seconds: float = time.perf_counter() - start
+            print(f'{functions:>10} {name:>8} {seconds:>10.4f} '
+                  f'{incremental.parsed:>8}')
+            incremental.parse(''.join(codes))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""Benchmark ASCII fast path of the lexer
+
+Scan ``spec.vg`` replicated to the requested size once as pure ASCII code
+and once with a non ASCII identifier in front, which makes the Unicode aware
+path scan the whole code.
+
+Usage:
+    python -m benchmarks.lexer_ascii [--sizes 1M 10M]
+
+"""
+from argparse import ArgumentParser
+from time import perf_counter
+
+from benchmarks.lexer_io import SPEC
+from benchmarks.lexer_io import parse_size
+from vega.front_end.lexer import Lexer
+
+
+def main() -> None:
+    """Run benchmark and print a result table"""
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=['1M', '10M'])
+    args = parser.parse_args()
+
+    spec: str = SPEC.read_text()
+    print(f'{"size":>10} {"path":>8} {"tokens":>10} {"seconds":>8} '
+          f'{"tokens/s":>10}')
+    for size in [parse_size(size) for size in args.sizes]:
+        code: str = spec * (size // len(spec) + 1)
+        for path, prefix in (('ascii', ''), ('unicode', 'é\n')):
+            lexer: Lexer = Lexer(prefix + code)
+            start: float = perf_counter()
+            tokens: int = sum(1 for _ in lexer.spans())
+            seconds: float = perf_counter() - start
+            print(f'{size:>10} {path:>8} {tokens:>10} {seconds:>8.3f} '
+                  f'{tokens / seconds:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
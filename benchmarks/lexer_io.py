@@ -0,0 +1,145 @@
+"""Benchmark source reading of the lexer
+
+Compare the former per char ``read(1)`` reading of program code against the
+memory mapped buffer walked with an integer cursor. Program files are built
+by replicating ``spec.vg`` up to the requested size.
+
+Usage:
+    python -m benchmarks.lexer_io [--sizes 1K 1M 50M] [--lex-limit 1M]
+
+"""
+from argparse import ArgumentParser
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable
+from typing import List
+
+from vega.front_end.lexer import Lexer
+from vega.front_end.source import load_source
+
+SPEC: Path = Path(__file__).resolve().parent.parent / 'spec.vg'
+UNITS = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+
+
+def parse_size(size: str) -> int:
+    """Parse human readable size like 1K or 50M
+
+    Args:
+        size: size string
+
+    Returns:
+        size in bytes
+    """
+    unit: int = UNITS.get(size[-1].upper(), 1)
+    if size[-1].isdigit():
+        return int(size)
+    return int(size[:-1]) * unit
+
+
+def write_program(directory: Path, size: int) -> Path:
+    """Write program code of at least ``size`` bytes
+
+    Args:
+        directory: directory to place the program file in
+        size: minimum size in bytes
+
+    Returns:
+        path to the program file
+    """
+    spec: str = SPEC.read_text()
+    path: Path = directory / f'program_{size}.vg'
+    path.write_text(spec * (size // len(spec) + 1))
+    return path
+
+
+def read_per_char(path: Path) -> int:
+    """Walk program code with one ``read(1)`` call per char
+
+    Args:
+        path: program file
+
+    Returns:
+        number of chars read
+    """
+    count: int = 0
+    with open(path) as code:
+        while code.read(1):
+            count += 1
+    return count
+
+
+def read_buffer(path: Path) -> int:
+    """Walk memory mapped program code with an integer cursor
+
+    Args:
+        path: program file
+
+    Returns:
+        number of chars read
+    """
+    code: str = load_source(path)
+    length: int = len(code)
+    position: int = 0
+    count: int = 0
+    while position < length:
+        _ = code[position]
+        position += 1
+        count += 1
+    return count
+
+
+def lex(path: Path) -> int:
+    """Scan program code with the lexer
+
+    Args:
+        path: program file
+
+    Returns:
+        number of tokens
+    """
+    return len(Lexer(path).scan())
+
+
+def measure(function: Callable[[Path], int], path: Path) -> float:
+    """Measure runtime of one call
+
+    Args:
+        function: function to measure
+        path: program file
+
+    Returns:
+        runtime in seconds
+    """
+    start: float = perf_counter()
+    function(path)
+    return perf_counter() - start
+
+
+def main() -> None:
+    """Run benchmark and print a result table"""
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+',
+                        default=['1K', '10K', '100K', '1M', '10M', '50M'])
+    parser.add_argument('--lex-limit', default='1M',
+                        help='largest file to run the full lexer on')
+    args = parser.parse_args()
+    lex_limit: int = parse_size(args.lex_limit)
+
+    print(f'{"size":>10} {"read(1) s":>10} {"buffer s":>10} '
+          f'{"speedup":>8} {"lex s":>8}')
+    with TemporaryDirectory() as directory:
+        for size in [parse_size(size) for size in args.sizes]:
+            path: Path = write_program(Path(directory), size)
+            per_char: float = measure(read_per_char, path)
+            buffered: float = measure(read_buffer, path)
+            lexing: List[str] = ['-']
+            if size <= lex_limit:
+                lexing = [f'{measure(lex, path):8.3f}']
+            print(f'{size:>10} {per_char:>10.3f} {buffered:>10.3f} '
+                  f'{per_char / buffered:>7.1f}x {lexing[0]:>8}')
+            path.unlink()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+"""Benchmark memory of front end runtime objects
+
+Tokens, list nodes and symbols are created by the million for large
+programs. Memory is measured with ``tracemalloc`` for every token class, for
+the tokens created while scanning ``spec.vg`` replicated to the requested
+size and for symbols stored in a symbol table. Next to every slotted class
+the unslotted baseline is measured with a subclass that brings the instance
+dict back.
+
+Usage:
+    python -m benchmarks.object_memory [--count 100000] [--size 1M]
+
+"""
+import tracemalloc
+from argparse import ArgumentParser
+from typing import Callable
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from benchmarks.lexer_io import SPEC
+from benchmarks.lexer_io import parse_size
+from vega.data_structs.symbol_table import Symbol
+from vega.data_structs.symbol_table import SymbolTable
+from vega.front_end.lexer import Lexer
+from vega.language.token import Literal
+from vega.language.token import Num
+from vega.language.token import Real
+from vega.language.token import Tag
+from vega.language.token import Token
+from vega.language.token import Word
+from vega.language.types import INT
+from vega.utils.data_types.lists import Node
+
+Row = Tuple[str, int, Callable[[], object],
+            Union[Callable[[], object], None]]
+
+
+def measure(build: Callable[[], object]) -> int:
+    """Measure memory allocated by a build function
+
+    Args:
+        build: function creating the objects
+
+    Returns:
+        allocated bytes held by the created objects
+    """
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    allocated: int = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objects
+    return allocated
+
+
+def unslotted(cls: type) -> type:
+    """Subclass a slotted class without ``__slots__``
+
+    Instances of the subclass carry an instance dict and a weak reference
+    slot again, on CPython 3.11 they take as much memory as instances of the
+    class took before it got ``__slots__``.
+
+    Args:
+        cls: slotted class
+
+    Returns:
+        unslotted subclass
+    """
+    return type(f'Unslotted{cls.__name__}', (cls,), {})
+
+
+def token_builds(count: int, unslot: bool
+                 ) -> List[Tuple[str, Callable[[], object]]]:
+    """Build functions creating tokens of every token class
+
+    Args:
+        count: number of tokens to create
+        unslot: create tokens of unslotted subclasses
+
+    Returns:
+        name and build function of every token class
+    """
+    code: str = '1.5 42 text'
+    classes: List[type] = [Token, Word, Num, Real, Literal]
+    if unslot:
+        classes = [unslotted(cls) for cls in classes]
+    token, word, num, real, literal = classes
+    return [
+        ('Token', lambda: [token('+') for _ in range(count)]),
+        ('Word', lambda: [word('x', Tag.ID) for _ in range(count)]),
+        ('Num', lambda: [num(None, code, 4, 6) for _ in range(count)]),
+        ('Real', lambda: [real(None, code, 0, 3) for _ in range(count)]),
+        ('Literal', lambda: [literal(None, code, 7, 11)
+                             for _ in range(count)]),
+    ]
+
+
+def nodes(count: int, node: type) -> List[Node]:
+    """Create linked list nodes
+
+    Args:
+        count: number of nodes
+        node: node class
+
+    Returns:
+        nodes linked one after another
+    """
+    created: List[Node] = [node(None) for _ in range(count)]
+    for previous, following in zip(created, created[1:]):
+        previous.next = following
+        following.prev = previous
+    return created
+
+
+def symbols(count: int, symbol: type, prefix: str) -> SymbolTable:
+    """Store symbols in a symbol table
+
+    Args:
+        count: number of symbols
+        symbol: symbol class
+        prefix: first char of the names, names are interned only once
+
+    Returns:
+        symbol table holding the symbols
+    """
+    table: SymbolTable = SymbolTable()
+    table.enter_scope('main')
+    for index in range(count):
+        table.store(symbol(f'{prefix}symbol_{index}', False, False, INT))
+    return table
+
+
+def main() -> None:
+    """Run benchmark and print a result table"""
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=100000)
+    parser.add_argument('--size', default='1M')
+    args = parser.parse_args()
+
+    spec: str = SPEC.read_text()
+    size: int = parse_size(args.size)
+    code: str = spec * (size // len(spec) + 1)
+    tokens: int = sum(1 for _ in Lexer(code).tokens())
+    rows: List[Row] = [
+        (name, args.count, build, unslotted_build)
+        for (name, build), (_, unslotted_build) in zip(
+            token_builds(args.count, False), token_builds(args.count, True))]
+    rows.append(('scan', tokens, lambda: list(Lexer(code).tokens()), None))
+    rows.append(('Node', args.count, lambda: nodes(args.count, Node),
+                 lambda: nodes(args.count, unslotted(Node))))
+    rows.append(('Symbol', args.count,
+                 lambda: symbols(args.count, Symbol, 'a'),
+                 lambda: symbols(args.count, unslotted(Symbol), 'b')))
+
+    print(f'{"objects":>8} {"count":>10} {"bytes":>12} {"bytes/object":>13} '
+          f'{"unslotted":>10}')
+    for name, count, build, unslotted_build in rows:
+        allocated: int = measure(build)
+        baseline: str = '-' if unslotted_build is None \
+            else f'{measure(unslotted_build) / count:.1f}'
+        print(f'{name:>8} {count:>10} {allocated:>12} '
+              f'{allocated / count:>13.1f} {baseline:>10}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark parallel lexical scan
+
+Compare the serial scan with ``scan_parallel`` on ``spec.vg`` replicated to
+the requested size. All tokens are pulled from both token streams.
+
+Usage:
+    python -m benchmarks.parallel_lexer [--sizes 10M 50M] [--workers 4]
+
+"""
+from argparse import ArgumentParser
+from os import cpu_count
+from time import perf_counter
+
+from benchmarks.lexer_io import SPEC
+from benchmarks.lexer_io import parse_size
+from vega.data_structs.token_stream import TokenStream
+from vega.front_end.lexer import Lexer
+from vega.front_end.parallel_lexer import scan_parallel
+
+
+def drain(token_stream: TokenStream) -> int:
+    """Pull all tokens from a token stream
+
+    Args:
+        token_stream: token stream
+
+    Returns:
+        number of tokens
+    """
+    tokens: int = 0
+    while not token_stream.is_empty():
+        token_stream.remove()
+        tokens += 1
+    return tokens
+
+
+def main() -> None:
+    """Run benchmark and print a result table"""
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=['10M'])
+    parser.add_argument('--workers', type=int, default=cpu_count())
+    args = parser.parse_args()
+
+    spec: str = SPEC.read_text()
+    print(f'{"size":>10} {"mode":>8} {"tokens":>10} {"seconds":>8}')
+    for size in [parse_size(size) for size in args.sizes]:
+        code: str = spec * (size // len(spec) + 1)
+        for mode in ('serial', 'parallel'):
+            start: float = perf_counter()
+            if mode == 'serial':
+                token_stream: TokenStream = Lexer(code).scan()
+            else:
+                token_stream = scan_parallel(code, args.workers)
+            tokens: int = drain(token_stream)
+            seconds: float = perf_counter() - start
+            print(f'{size:>10} {mode:>8} {tokens:>10} {seconds:>8.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark two-phase parallel parsing
+
+Compare the serial parser with ``parse_parallel`` on a generated program of
+many functions, each calling the function in front of it.
+
+Usage:
+    python -m benchmarks.parallel_parser [--functions 5000] [--workers 4]
+
+"""
+from argparse import ArgumentParser
+from os import cpu_count
+from time import perf_counter
+
+from vega.front_end.diagnostics import Diagnostics
+from vega.front_end.parallel_parser import parse_parallel
+from vega.front_end.parser import Parser
+
+# one function, {0} is replaced by its number and {1} by the one in front
+FUNCTION: str = '''func f{0}(a: int) -> int {{
+    x: int = a * {0};
+    if (x > 10) {{
+        x = f{1}(x - 1);
+    }}
+    return x;
+}}
+'''
+
+
+def main() -> None:
+    """Run benchmark and print a result table"""
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--functions', nargs='+', type=int, default=[5000])
+    parser.add_argument('--workers', type=int, default=cpu_count())
+    args = parser.parse_args()
+
+    print(f'{"functions":>10} {"mode":>8} {"errors":>8} {"seconds":>8}')
+    for functions in args.functions:
+        code: str = ''.join(FUNCTION.format(index, max(0, index - 1))
+                            for index in range(functions))
+        for mode in ('serial', 'two-pass', 'parallel'):
+            diagnostics: Diagnostics = Diagnostics()
+            start: float = perf_counter()
+            if mode == 'serial':
+                Parser(code, diagnostics=diagnostics).parse()
+            else:
+                parse_parallel(code, 1 if mode == 'two-pass'
+                               else args.workers, diagnostics=diagnostics,
+                               chunk_size=1)
+            seconds: float = perf_counter() - start
+            print(f'{functions:>10} {mode:>8} {len(diagnostics):>8} '
+                  f'{seconds:>8.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark parse throughput on large function bodies
+
+Generate one function whose body holds the requested number of statement
+groups (declaration, assignment, if/else and while loop) and time a full
+parse including lexical scanning.
+
+Usage:
+    python -m benchmarks.parser_throughput [--statements 1000 10000]
+
+"""
+import time
+from argparse import ArgumentParser
+from typing import List
+
+from vega.front_end.lexer import Lexer
+from vega.front_end.parser import Parser
+
+# statements of one group, {0} is replaced by the group number
+GROUP: str = '''
+    v{0}: int = {0};
+    v{0} = v{0} + 1 * 2;
+    if (v{0} > 3) {{
+        v{0} = v{0} - 1;
+    }} else {{
+        pass;
+    }}
+    while (v{0} < 10) {{
+        v{0} = v{0} + 1;
+        break;
+    }}
+'''
+
+# statements in one group
+GROUP_STATEMENTS: int = 8
+
+
+def function_body(groups: int) -> str:
+    """Generate program code of one large function
+
+    Args:
+        groups: number of statement groups in the function body
+
+    Returns:
+        program code
+    """
+    body: str = ''.join(GROUP.format(index) for index in range(groups))
+    return f'func main() -> int {{{body}    return 0;\n}}\n'
+
+
+def main() -> None:
+    """Run benchmark and print a result table"""
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--statements', nargs='+', type=int,
+                        default=[1000, 10000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f'{"statements":>10} {"tokens":>10} {"seconds":>10} '
+          f'{"statements/s":>13} {"tokens/s":>12}')
+    for statements in args.statements:
+        code: str = function_body(max(1, statements // GROUP_STATEMENTS))
+        tokens: int = sum(1 for _ in Lexer(code).tokens())
+        timings: List[float] = []
+        for _ in range(args.repeat):
+            start: float = time.perf_counter()
+            Parser(code).parse()
+            timings.append(time.perf_counter() - start)
+        best: float = min(timings)
+        print(f'{statements:>10} {tokens:>10} {best:>10.4f} '
+              f'{statements / best:>13.0f} {tokens / best:>12.0f}')
+
+
+if __name__ == '__main__':
+    main()
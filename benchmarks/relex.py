@@ -0,0 +1,49 @@
+"""Benchmark incremental scanning
+
+Compare scanning the whole code with scanning again after a one char edit in
+the middle of ``spec.vg`` replicated to the requested number of lines.
+
+Usage:
+    python -m benchmarks.relex [--lines 1000 10000 100000]
+
+"""
+from argparse import ArgumentParser
+from time import perf_counter
+
+from benchmarks.lexer_io import SPEC
+from vega.data_structs.token_lines import TextEdit
+from vega.data_structs.token_lines import TokenLines
+from vega.front_end.lexer import Lexer
+
+
+def main() -> None:
+    """Run benchmark and print a result table"""
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--lines', nargs='+', type=int,
+                        default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    spec: str = SPEC.read_text()
+    spec_lines: int = spec.count('\n')
+    print(f'{"lines":>10} {"scan ms":>10} {"relex ms":>10}')
+    for lines in args.lines:
+        code: str = spec * (lines // spec_lines + 1)
+        start: float = perf_counter()
+        token_lines: TokenLines = Lexer(code).scan_lines()
+        scan: float = perf_counter() - start
+
+        middle: int = len(token_lines) // 2
+        # replace the number of 'i: const int = 5;' in the middle
+        while token_lines.text_of(middle - 1, middle).strip() != \
+                'i: const int = 5;':
+            middle += 1
+        edit: TextEdit = TextEdit(middle, 19, middle, 20, '7')
+        start = perf_counter()
+        Lexer.relex(token_lines, [edit])
+        relex: float = perf_counter() - start
+        print(f'{len(token_lines):>10} {scan * 1000:>10.1f} '
+              f'{relex * 1000:>10.3f}')
+
+
+if __name__ == '__main__':
+    main()
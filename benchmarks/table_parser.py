@@ -0,0 +1,56 @@
+"""Benchmark the table driven parser against the method per rule parser
+
+Time both parsers on one large function body and on a program of many
+functions. The table driven parser checks syntax and symbols only, the
+method per rule parser also builds the syntax tree.
+
+Usage:
+    python -m benchmarks.table_parser [--statements 1000] [--functions 1000]
+        [--cache DIRECTORY]
+
+"""
+import time
+from argparse import ArgumentParser
+from typing import List
+from typing import Tuple
+
+from benchmarks.incremental_parser import program
+from benchmarks.parser_throughput import GROUP_STATEMENTS
+from benchmarks.parser_throughput import function_body
+from vega.front_end.parser import Parser
+from vega.front_end.grammar import Tables
+from vega.front_end.table_parser import TableParser
+from vega.front_end.table_parser import default_tables
+
+
+def main() -> None:
+    """Run benchmark and print a result table"""
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--statements', type=int, default=1000)
+    parser.add_argument('--functions', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--cache', default=None,
+                        help='cache directory of the parse tables')
+    args = parser.parse_args()
+
+    tables: Tables = default_tables(args.cache)
+    codes: List[Tuple[str, str]] = [
+        ('body', function_body(max(1, args.statements // GROUP_STATEMENTS))),
+        ('functions', ''.join(program(args.functions))),
+    ]
+    print(f'{"code":>10} {"parser":>8} {"seconds":>10}')
+    for name, code in codes:
+        for kind in ('rules', 'table'):
+            timings: List[float] = []
+            for _ in range(args.repeat):
+                start: float = time.perf_counter()
+                if kind == 'rules':
+                    Parser(code).parse()
+                else:
+                    TableParser(code, tables=tables).parse()
+                timings.append(time.perf_counter() - start)
+            print(f'{name:>10} {kind:>8} {min(timings):>10.4f}')
+
+
+if __name__ == '__main__':
+    main()
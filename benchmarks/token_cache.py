@@ -0,0 +1,48 @@
+"""Benchmark persistent token cache
+
+Scan ``spec.vg`` replicated to the requested size without cache, with an
+empty cache writing the token file and with a filled cache loading it. All
+tokens are pulled from each token stream. The speedup is relative to the
+scan without cache.
+
+Usage:
+    python -m benchmarks.token_cache [--sizes 1M 10M]
+
+"""
+from argparse import ArgumentParser
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from benchmarks.lexer_io import SPEC
+from benchmarks.lexer_io import parse_size
+from benchmarks.parallel_lexer import drain
+from vega.data_structs.token_cache import TokenCache
+from vega.front_end.lexer import Lexer
+
+
+def main() -> None:
+    """Run benchmark and print a result table"""
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=['1M', '10M'])
+    args = parser.parse_args()
+
+    spec: str = SPEC.read_text()
+    print(f'{"size":>10} {"mode":>8} {"tokens":>10} {"seconds":>8} '
+          f'{"speedup":>8}')
+    for size in [parse_size(size) for size in args.sizes]:
+        code: str = spec * (size // len(spec) + 1)
+        with TemporaryDirectory() as directory:
+            cache: TokenCache = TokenCache(directory)
+            scan: float = 0.0
+            for mode in ('none', 'store', 'load'):
+                start: float = perf_counter()
+                tokens: int = drain(Lexer(code).scan(
+                    None if mode == 'none' else cache))
+                seconds: float = perf_counter() - start
+                scan = scan or seconds
+                print(f'{size:>10} {mode:>8} {tokens:>10} {seconds:>8.3f} '
+                      f'{scan / seconds:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark memory of a fully scanned token stream
+
+Compare the former token stream layout (a linked queue of buckets holding a
+new token per one char element) with the array column layout sharing
+flyweight tokens. Memory is measured with ``tracemalloc`` on ``spec.vg``
+replicated to the requested size.
+
+Usage:
+    python -m benchmarks.token_memory [--sizes 100K 1M]
+
+"""
+import tracemalloc
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from typing import Callable
+from typing import List
+from typing import Tuple
+
+from benchmarks.lexer_io import SPEC
+from benchmarks.lexer_io import parse_size
+from vega.data_structs.token_stream import TokenStream
+from vega.front_end.lexer import Lexer
+from vega.language.token import Token
+from vega.language.token import TokenType
+from vega.utils.data_types.lists import Queue
+
+
+@dataclass
+class Bucket:
+    """Bucket of the former token stream"""
+    token: TokenType
+    line: int
+
+
+def linked_queue(tokens: List[Tuple[TokenType, int]]) -> Queue:
+    """Build the former token stream layout
+
+    Args:
+        tokens: scanned tokens and line numbers
+
+    Returns:
+        queue of buckets with a new token per one char element
+    """
+    queue: Queue = Queue()
+    for token, line in tokens:
+        if isinstance(token.tag, str):
+            token = Token(token.tag)
+        queue.add(Bucket(token, line))
+    return queue
+
+
+def array_columns(tokens: List[Tuple[TokenType, int]]) -> TokenStream:
+    """Build the array column token stream
+
+    Args:
+        tokens: scanned tokens and line numbers
+
+    Returns:
+        token stream
+    """
+    token_stream: TokenStream = TokenStream()
+    for token, line in tokens:
+        token_stream.add(token, line=line)
+    return token_stream
+
+
+def measure(build: Callable, tokens: List[Tuple[TokenType, int]]) -> int:
+    """Measure memory allocated by a token stream layout
+
+    Args:
+        build: function building the layout
+        tokens: scanned tokens and line numbers
+
+    Returns:
+        allocated bytes held by the layout
+    """
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    layout = build(tokens)
+    allocated: int = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del layout
+    return allocated
+
+
+def main() -> None:
+    """Run benchmark and print a result table"""
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', default=['100K', '1M'])
+    args = parser.parse_args()
+
+    spec: str = SPEC.read_text()
+    print(f'{"size":>10} {"layout":>8} {"tokens":>10} {"bytes":>12} '
+          f'{"bytes/token":>12}')
+    for size in [parse_size(size) for size in args.sizes]:
+        code: str = spec * (size // len(spec) + 1)
+        tokens: List[Tuple[TokenType, int]] = list(Lexer(code).tokens())
+        for name, build in (('linked', linked_queue),
+                            ('arrays', array_columns)):
+            allocated: int = measure(build, tokens)
+            print(f'{size:>10} {name:>8} {len(tokens):>10} {allocated:>12} '
+                  f'{allocated / len(tokens):>12.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,19 +1,27 @@
 """Vega compiler"""
+import sys
 from argparse import ArgumentParser
-from argparse import FileType
+from pathlib import Path
 
+from vega.front_end.diagnostics import DEFAULT_LIMIT
 from vega.front_end.parser import Parser
-from vega.front_end.exception import BaseError
 
 if __name__ == "__main__":
     parser = ArgumentParser(description="Compile")
-    parser.add_argument('code', type=FileType('r'))
+    parser.add_argument('code', type=Path, nargs='+')
+    parser.add_argument('--max-errors', type=int, default=DEFAULT_LIMIT,
+                        help='stop after this number of errors per file')
     args = parser.parse_args()
 
-    code = args.code
-
-    parser = Parser(code)
     try:
-        parser.parse()
-    except BaseError as e:
-        print(e.message)
+        results = Parser.parse_many(args.code, limit=args.max_errors)
+    except OSError as error:
+        parser.error(f"can't open '{error.filename}': {error.strerror}")
+    failed = False
+    for path, result in zip(args.code, results):
+        if result.diagnostics:
+            failed = True
+            if len(args.code) > 1:
+                print(f'{path}:')
+            print(result.diagnostics.report)
+    sys.exit(1 if failed else 0)
@@ -1,7 +1,11 @@
 grammar Vega;
 
+program
+    :   block EOF
+    ;
+
 block
-    :   (FUNC ID LBRACKET functionParameterDeclaration? RBRACKET RETURN_TYPE functionReturnType scopeStatement)+ EOF
+    :   (FUNC ID LBRACKET functionParameterDeclaration? RBRACKET RETURN_TYPE functionReturnType scopeStatement)+
     ;
 
 functionParameterDeclaration
@@ -91,6 +91,52 @@ def describe_hash_table():
             assert len(mocked_hash_table) == 2
             assert mocked_hash_table.get(first) == second
 
+    def describe_deleting_data():
+        def deletion_in_chain(mocked_hash_table):
+            for key in ("first", "second", "third"):
+                mocked_hash_table.put(key, key)
+
+            assert mocked_hash_table.delete("second") is True
+            assert mocked_hash_table.delete("first") is True
+            assert len(mocked_hash_table) == 1
+            assert mocked_hash_table.get("second") is None
+            assert mocked_hash_table.get("third") == "third"
+
+        def deletion_takes_back_collisions(mocked_hash_table):
+            for key in ("first", "second", "third"):
+                mocked_hash_table.put(key, key)
+            assert mocked_hash_table.collisions == 2
+
+            mocked_hash_table.delete("second")
+            assert mocked_hash_table.collisions == 1
+            mocked_hash_table.delete("first")
+            assert mocked_hash_table.collisions == 0
+            mocked_hash_table.delete("third")
+            assert mocked_hash_table.collisions == 0
+
+        def deletion_not_present():
+            hash_table = HashTable()
+
+            assert hash_table.delete(42) is False
+
+        def clear(mocked_hash_table):
+            for key in ("first", "second", "third"):
+                mocked_hash_table.put(key, key)
+            mocked_hash_table.clear()
+
+            assert len(mocked_hash_table) == 0
+            assert mocked_hash_table.collisions == 0
+            assert mocked_hash_table.get("first") is None
+
+    def describe_integer_keys():
+        @pytest.mark.parametrize("key", [0, 255, 256, 70000])
+        def retrieval(key):
+            hash_table = HashTable()
+            hash_table.put(key, 'data')
+
+            assert hash_table.get(key) == 'data'
+            assert hash_table.get(key + 1) is None
+
     def describe_performance():
 
         def random_strings():
@@ -0,0 +1,47 @@
+# pylint: skip-file
+import pytest
+
+from vega.data_structs.intern_pool import POOL
+from vega.data_structs.intern_pool import InternPool
+from vega.front_end.lexer import Lexer
+from vega.language import vocabulary
+from vega.language.token import Tag
+from vega.language.token import Word
+
+
+def describe_intern_pool():
+
+    @pytest.fixture
+    def pool():
+        return InternPool()
+
+    def dense_ids(pool):
+        assert [pool.intern(name) for name in ['a', 'b', 'a', 'c']] == \
+               [0, 1, 0, 2]
+        assert len(pool) == 3
+        assert pool.lexeme(1) == 'b'
+
+    def find_does_not_intern(pool):
+        assert pool.find('a') is None
+        assert 'a' not in pool
+
+    def words(pool):
+        word = Word('foo', Tag.ID)
+        pool.put('foo', word)
+
+        assert pool.get('foo') is word
+        assert pool.get('bar') is None
+
+    def describe_process_pool():
+
+        def keywords():
+            for keyword in vocabulary.keywords:
+                assert POOL.get(keyword.lexeme) is keyword
+                assert POOL.lexeme(keyword.id) == keyword.lexeme
+
+        def shared_identifiers():
+            first, _ = next(Lexer('interned').tokens())
+            second, _ = next(Lexer('interned').tokens())
+
+            assert first is second
+            assert first.id == POOL.find('interned')
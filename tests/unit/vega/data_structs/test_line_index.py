@@ -0,0 +1,41 @@
+# pylint: skip-file
+import pytest
+
+from vega.data_structs.line_index import LineIndex
+from vega.front_end.lexer import Lexer
+
+
+CODE = "a = 1;\n'multi\nline'\r\n\tb = 2;"
+
+
+def describe_line_index():
+
+    @pytest.mark.parametrize("position, location", [
+        pytest.param(0, (1, 0), id="start"),
+        pytest.param(5, (1, 5), id="first_line"),
+        pytest.param(7, (2, 0), id="second_line"),
+        pytest.param(14, (3, 0), id="literal_line"),
+        pytest.param(22, (5, 1), id="after_crlf"),
+        pytest.param(len(CODE), (5, 7), id="end"),
+    ])
+    def locates(position, location):
+        assert LineIndex(CODE).locate(position) == location
+
+    def filled_by_lexer():
+        lexer = Lexer(CODE)
+        list(lexer.spans())
+        assert len(lexer.line_index) == 5
+        assert lexer.line_index.locate(22) == (5, 1)
+
+    def starts_at_line():
+        assert LineIndex("x\ny", 10).locate(2) == (11, 0)
+
+    def text():
+        line_index = LineIndex(CODE)
+        assert line_index.text(2) == "'multi"
+        assert line_index.text(4) == ""
+        assert line_index.text(5) == "\tb = 2;"
+
+    def render():
+        assert LineIndex(CODE).render(22, 23) == "5 | \tb = 2;\n  | \t^"
+        assert LineIndex(CODE).render(0, 100) == "1 | a = 1;\n  | ^^^^^^"
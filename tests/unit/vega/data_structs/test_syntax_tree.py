@@ -0,0 +1,78 @@
+# pylint: skip-file
+import pytest
+
+from vega.data_structs.syntax_tree import Syntax
+from vega.data_structs.syntax_tree import SyntaxTree
+from vega.language import kinds
+from vega.language import vocabulary
+from vega.language.token import Num
+
+
+def describe_syntax_tree():
+
+    @pytest.fixture
+    def tree():
+        tree: SyntaxTree = SyntaxTree()
+        left: int = tree.add_node(Syntax.TERMINAL, tree.add_token(Num(1)))
+        right: int = tree.add_node(Syntax.TERMINAL,
+                                   tree.add_token(Num(2), 4, 5))
+        tree.add_node(Syntax.BINARY, tree.add_token(vocabulary.token('+')),
+                      (left, -1, right))
+        return tree
+
+    def empty():
+        tree: SyntaxTree = SyntaxTree()
+        assert len(tree) == 0
+        assert tree.root is None
+
+    def bottom_up(tree):
+        assert len(tree) == 3
+        assert tree.root.index == 2
+        assert tree.first_child(2) == 0
+        assert tree.next_sibling(0) == 1
+        assert tree.next_sibling(1) == -1
+        assert tree.first_child(0) == -1
+        assert list(tree.children(2)) == [0, 1]
+
+    def columns(tree):
+        assert tree.kind(2) is Syntax.BINARY
+        assert tree.token(1).value == 2
+        assert tree.span(1) == (4, 5)
+        assert tree.span(0) == (-1, -1)
+
+    def node_without_token():
+        tree: SyntaxTree = SyntaxTree()
+        tree.add_node(Syntax.DIMENSION)
+        assert tree.root.token is None
+        assert tree.root.span == (-1, -1)
+
+    def graft(tree):
+        grafted: SyntaxTree = SyntaxTree()
+        grafted.add_node(Syntax.PASS)
+        columns = tree.columns()
+        assert list(columns[4]) == [kinds.NUM, kinds.NUM, kinds.PLUS]
+        children = grafted.graft(columns, [Num(1), Num(2), '+'], 10)
+        assert children == [1, 2]
+        assert len(grafted) == 3
+        assert grafted.token(2).value == 2
+        assert grafted.span(2) == (14, 15)
+        assert grafted.span(1) == (-1, -1)
+        assert grafted.graft(SyntaxTree().columns(), []) == []
+
+    def describe_nodes():
+
+        def navigate(tree):
+            root = tree.root
+            assert root.kind is Syntax.BINARY
+            assert str(root.token) == '+'
+            assert [child.token.value for child in root] == [1, 2]
+            assert root.children == [tree[0], tree[1]]
+            assert tree[-1] == root
+
+        def render(tree):
+            assert str(tree.root) == '(BINARY + (TERMINAL 1) (TERMINAL 2))'
+            assert repr(tree.root) == 'SyntaxNode(BINARY, 2)'
+
+        def out_of_range(tree):
+            with pytest.raises(IndexError):
+                tree[3]
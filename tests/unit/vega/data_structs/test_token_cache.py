@@ -0,0 +1,83 @@
+# pylint: skip-file
+from pathlib import Path
+
+import pytest
+
+from vega.data_structs import token_cache
+from vega.data_structs.token_cache import TokenCache
+from vega.data_structs.token_stream import TokenStream
+from vega.front_end.lexer import Lexer
+
+
+SPEC = Path(__file__).parents[4] / 'spec.vg'
+
+
+def _drain(token_stream: TokenStream):
+    tokens = []
+    while not token_stream.is_empty():
+        token, line = token_stream.remove()
+        tokens.append((repr(token), line))
+    return tokens
+
+
+def describe_token_cache():
+
+    @pytest.fixture
+    def cache(tmp_path):
+        return TokenCache(tmp_path / 'tokens')
+
+    @pytest.fixture
+    def code():
+        return SPEC.read_text() + "'unterminated é"
+
+    def misses_unknown_code(cache, code):
+        assert cache.load(code) is None
+
+    def loads_stored_tokens(cache, code):
+        expected = _drain(Lexer(code).scan())
+        Lexer(code).scan(cache)
+        assert cache.path(code).exists()
+
+        cached = cache.load(code)
+        assert cached is not None
+        assert _drain(cached) == expected
+
+    def loads_spans(cache, code):
+        expected = Lexer(code).scan()
+        Lexer(code).scan(cache)
+        cached = cache.load(code)
+        assert len(cached) == len(expected)
+        while not expected.is_empty():
+            token, line, start, end = expected.remove_span()
+            assert cached.remove_span()[1:] == (line, start, end)
+
+    def shares_words(cache, code):
+        Lexer(code).scan(cache)
+        words = [token for token, _ in Lexer(code).tokens()
+                 if hasattr(token, 'lexeme')]
+        cached = cache.load(code)
+        while not cached.is_empty():
+            token, _ = cached.remove()
+            if hasattr(token, 'lexeme'):
+                assert token is words.pop(0)
+
+    def shifts_lines(cache):
+        Lexer("a\nb", line=1).scan(cache)
+        assert _drain(Lexer("a\nb", line=10).scan(cache)) == \
+            [("Word('a')", 10), ("Word('b')", 11)]
+
+    def ignores_changed_vocabulary(cache, code, monkeypatch):
+        Lexer(code).scan(cache)
+        monkeypatch.setattr(token_cache, 'FINGERPRINT', bytes(16))
+        assert cache.load(code) is None
+
+    def ignores_broken_file(cache, code):
+        Lexer(code).scan(cache)
+        cache.path(code).write_bytes(b'VGT')
+        assert cache.load(code) is None
+
+    def ignores_truncated_file(cache, code):
+        Lexer(code).scan(cache)
+        path = cache.path(code)
+        path.write_bytes(path.read_bytes()[:-100])
+        assert cache.load(code) is None
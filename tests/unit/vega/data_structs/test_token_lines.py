@@ -0,0 +1,66 @@
+# pylint: skip-file
+import pytest
+
+from vega.data_structs.token_lines import TextEdit
+from vega.data_structs.token_lines import TokenLines
+from vega.data_structs.token_lines import split_lines
+from vega.front_end.lexer import Lexer
+
+CODE = """func main() -> int {
+    m: str = "Hello
+World";
+    i: int = 5;
+}
+"""
+
+
+def _tokens(code):
+    return [(repr(token), line)
+            for token, line in Lexer(code).tokens()]
+
+
+def describe_split_lines():
+
+    @pytest.mark.parametrize("code, lines", [
+        pytest.param('', [''], id="empty"),
+        pytest.param('a\nb', ['a\n', 'b'], id="no_final_break"),
+        pytest.param('a\r\n', ['a\r', '\n', ''], id="carriage_return"),
+    ])
+    def lines(code, lines):
+        assert split_lines(code) == lines
+
+
+def describe_relex():
+
+    @pytest.fixture
+    def token_lines():
+        return Lexer(CODE).scan_lines()
+
+    def initial_scan(token_lines):
+        assert token_lines.text == CODE
+        assert [(repr(token), line) for token, line in token_lines.tokens()] \
+            == _tokens(CODE)
+
+    @pytest.mark.parametrize("edit, code", [
+        pytest.param(TextEdit(4, 13, 4, 14, '42'),
+                     CODE.replace('5;', '42;'), id="replace_number"),
+        pytest.param(TextEdit(1, 20, 1, 20, '\n    j: int;'),
+                     CODE.replace('{', '{\n    j: int;'), id="insert_line"),
+        pytest.param(TextEdit(2, 13, 2, 13, '"'),
+                     CODE.replace('"Hello', '""Hello'), id="open_literal"),
+        pytest.param(TextEdit(3, 5, 3, 6, ''),
+                     CODE.replace('World"', 'World'), id="remove_quote"),
+        pytest.param(TextEdit(2, 4, 3, 7, 'm: int = 1;'),
+                     CODE.replace('m: str = "Hello\nWorld";', 'm: int = 1;'),
+                     id="join_lines"),
+    ])
+    def edit(token_lines, edit, code):
+        relexed: TokenLines = Lexer.relex(token_lines, [edit])
+
+        assert relexed.text == code
+        assert [(repr(token), line) for token, line in relexed.tokens()] \
+            == _tokens(code)
+
+    def out_of_range(token_lines):
+        with pytest.raises(IndexError):
+            Lexer.relex(token_lines, [TextEdit(9, 0, 9, 0, 'a')])
@@ -0,0 +1,173 @@
+# pylint: skip-file
+import pytest
+
+from vega.data_structs.token_stream import TokenStream
+from vega.front_end.lexer import Lexer
+from vega.language import vocabulary
+from vega.language.token import Num
+from vega.language.token import Tag
+
+
+def describe_token_stream():
+
+    def describe_lazy_stream():
+
+        @pytest.fixture
+        def tokens():
+            return Lexer("func main() -> int {\n\tpass;\n}").spans()
+
+        def pulls_on_demand(tokens):
+            token_stream: TokenStream = TokenStream(tokens)
+            assert token_stream.peek().tag == Tag.FUNC
+            assert len(token_stream) == 1
+
+            token, line = token_stream.remove()
+            assert token.tag == Tag.FUNC
+            assert line == 1
+            assert len(token_stream) == 0
+
+        def drains_iterator(tokens):
+            token_stream: TokenStream = TokenStream(tokens)
+            tags = []
+            while not token_stream.is_empty():
+                token, _ = token_stream.remove()
+                tags.append(token.tag)
+
+            assert tags[-3:] == [Tag.PASS, ';', '}']
+            assert token_stream.peek() is vocabulary.EOF
+            with pytest.raises(IndexError):
+                token_stream.remove()
+
+        def closes(tokens):
+            token_stream: TokenStream = TokenStream(tokens)
+            token_stream.remove()
+            assert token_stream.peek(1).tag == '('
+            token_stream.close()
+
+            assert len(token_stream) == 0
+            assert token_stream.peek() is vocabulary.EOF
+            assert next(tokens)[0].tag == ')'
+            token_stream.restore()
+            assert token_stream.remove()[0].tag == Tag.FUNC
+
+    def describe_lookahead():
+
+        def peeks_ahead():
+            token_stream: TokenStream = TokenStream(Lexer("a = 1;").spans())
+            assert token_stream.peek(2).value == 1
+            assert len(token_stream) == 3
+            assert token_stream.peek(1).tag == '='
+            assert token_stream.peek_kind(3) == ord(';')
+            assert token_stream.remove()[0].lexeme == 'a'
+
+        def eof_sentinel():
+            token_stream: TokenStream = TokenStream(Lexer("a").spans())
+            assert token_stream.peek(1) is vocabulary.EOF
+            assert token_stream.peek(5).tag == Tag.EOF
+            assert token_stream.peek_kind(1) == Tag.EOF.value
+            assert len(token_stream) == 1
+
+    def describe_marks():
+
+        @pytest.fixture
+        def token_stream():
+            return TokenStream(Lexer("x = 1; " * 20).spans())
+
+        def resets_across_compaction(token_stream):
+            token_stream.remove()
+            mark = token_stream.mark()
+            removed = [token_stream.remove() for _ in range(50)]
+            token_stream.reset(mark)
+            assert [token_stream.remove() for _ in range(50)] == removed
+            assert token_stream.peek().tag == ';'
+
+        def nested_marks(token_stream):
+            outer = token_stream.mark()
+            token_stream.remove()
+            inner = token_stream.mark()
+            token_stream.remove()
+            token_stream.reset(inner)
+            assert token_stream.peek().tag == '='
+            token_stream.release(inner)
+            token_stream.reset(outer)
+            assert token_stream.peek().lexeme == 'x'
+
+        def restores_across_compaction(token_stream):
+            for _ in range(49):
+                token_stream.remove()
+            removed, _ = token_stream.remove()
+            token_stream.restore()
+            assert token_stream.peek() is removed
+            assert token_stream.remove()[0] is removed
+
+        def restore_without_removed(token_stream):
+            with pytest.raises(IndexError):
+                token_stream.restore()
+
+        def releases(token_stream):
+            mark = token_stream.mark()
+            token_stream.release(mark)
+            for _ in range(60):
+                token_stream.remove()
+            assert token_stream.peek().lexeme == 'x'
+            with pytest.raises(ValueError):
+                token_stream.reset(mark)
+            with pytest.raises(ValueError):
+                token_stream.release(mark)
+
+    def describe_array_columns():
+
+        def keeps_order_across_compaction():
+            token_stream: TokenStream = TokenStream()
+            tokens = [Num(number) for number in range(10)]
+            for line, token in enumerate(tokens[:6]):
+                token_stream.add(token, line=line)
+            removed = [token_stream.remove() for _ in range(4)]
+            for line, token in enumerate(tokens[6:], 6):
+                token_stream.add(token, line=line)
+            while not token_stream.is_empty():
+                removed.append(token_stream.remove())
+
+            assert [token for token, _ in removed] == tokens
+            assert [line for _, line in removed] == list(range(10))
+
+        def shares_tokens():
+            token_stream: TokenStream = TokenStream()
+            semicolon = vocabulary.token(';')
+            for line in range(3):
+                token_stream.add(semicolon, line=line)
+                token_stream.add(vocabulary.EQ, line=line)
+
+            assert len(token_stream) == 6
+            assert all(token_stream.remove()[0] is token
+                       for _ in range(3)
+                       for token in (semicolon, vocabulary.EQ))
+
+        def peeks_kind():
+            token_stream: TokenStream = TokenStream(Lexer("(x);").spans())
+            assert token_stream.peek_kind() == ord('(')
+            token_stream.remove()
+            assert token_stream.peek_kind() == Tag.ID.value
+            for _ in range(3):
+                token_stream.remove()
+            assert token_stream.peek_kind() == Tag.EOF.value
+
+
+def describe_flyweights():
+
+    def shares_punctuation():
+        assert vocabulary.token('(') is vocabulary.token('(')
+        first, second = [token for token, _ in Lexer("(;(").tokens()][::2]
+        assert first is second
+
+    def creates_unknown():
+        assert vocabulary.token('?') is not vocabulary.token('?')
+
+    def shares_unknown_by_tag():
+        token_stream: TokenStream = TokenStream()
+        first = vocabulary.token('?')
+        token_stream.add(first, line=1)
+        token_stream.add(vocabulary.token('?'), line=1)
+
+        assert token_stream.remove()[0] is first
+        assert token_stream.remove()[0] is first
@@ -0,0 +1,29 @@
+# pylint: skip-file
+import pytest
+
+from vega.front_end.diagnostics import Diagnostics
+from vega.front_end.exception import VegaNotYetDefinedError
+
+
+def describe_diagnostics():
+
+    def collects():
+        diagnostics = Diagnostics()
+        errors = [VegaNotYetDefinedError(name, 1) for name in 'xy']
+        for error in errors:
+            diagnostics.add(error)
+        assert list(diagnostics) == errors
+        assert diagnostics.report == '\n'.join(error.message
+                                               for error in errors)
+        assert not diagnostics.full
+
+    def limit():
+        diagnostics = Diagnostics(limit=2)
+        for name in 'xyz':
+            diagnostics.add(VegaNotYetDefinedError(name, 1))
+        assert diagnostics.full
+        assert len(diagnostics) == diagnostics.limit == 2
+
+    def invalid_limit():
+        with pytest.raises(ValueError):
+            Diagnostics(limit=0)
@@ -0,0 +1,88 @@
+# pylint: skip-file
+from unittest.mock import patch
+
+import pytest
+
+from vega.front_end import grammar
+from vega.front_end.grammar import GRAMMAR
+from vega.front_end.grammar import load_tables
+from vega.front_end.grammar import read_grammar
+from vega.language import kinds
+from vega.language.token import KINDS
+
+
+def describe_grammar():
+
+    @pytest.fixture(scope='module')
+    def vega():
+        return read_grammar(GRAMMAR.read_text())
+
+    def start_rule(vega):
+        assert vega.start == 'program'
+        assert 'unary:1' in vega.rules
+
+    def first_sets(vega):
+        assert vega.first('expression') == {
+            kinds.NOT, kinds.MINUS, kinds.NUM, kinds.REAL,
+            kinds.TRUE, kinds.FALSE, kinds.DQUOTE, kinds.SQUOTE, kinds.ID,
+            kinds.LBRACKET, kinds.LARRAY}
+        assert vega.first('terminalVariableType') == {kinds.BASIC,
+                                                      kinds.TYPE}
+
+    def follow_sets(vega):
+        assert vega.follow('expression') == {
+            kinds.RBRACKET, kinds.RARRAY, kinds.COMMA, kinds.DELIMITER}
+        assert vega.follow('block') == {kinds.EOF, kinds.RCURLY,
+                                        kinds.FUNC, kinds.ID, kinds.RETURN,
+                                        kinds.CONTINUE, kinds.BREAK,
+                                        kinds.WHILE, kinds.IF}
+
+    def left_factors_identifier_operands(vega):
+        assert [str(production) for production in vega.productions
+                if production.rule == 'unary'][1] == 'ID unary:4'
+
+    def only_nested_function_conflicts(vega):
+        conflicts = vega.tables().conflicts
+        assert [(conflict.rule, conflict.token) for conflict in conflicts] \
+            == [('block:2', 'FUNC')]
+        assert conflicts[0].productions[-1] == '<empty>'
+
+    def reports_conflict():
+        tables = read_grammar("s : a | b ; a : ID ; b : ID ;").tables()
+        assert [str(conflict) for conflict in tables.conflicts] \
+            == ['LL(1) conflict in s on ID: a | b']
+        assert tables.table[kinds.ID] == 0
+
+    @pytest.mark.parametrize("text", [
+        pytest.param("s : UNKNOWN ;", id="unknown_token"),
+        pytest.param("s : t ;", id="undefined_rule"),
+        pytest.param("s : ( ID ;", id="unclosed_group"),
+    ])
+    def malformed(text):
+        with pytest.raises(ValueError):
+            read_grammar(text)
+
+
+def describe_load_tables():
+
+    def caches_tables(tmp_path):
+        tables = load_tables(tmp_path)
+        assert len(list(tmp_path.iterdir())) == 1
+        with patch.object(grammar, 'read_grammar') as read:
+            cached = load_tables(tmp_path)
+        read.assert_not_called()
+        assert cached == tables
+        assert len(cached.table) == len(cached.rules) * KINDS
+
+    def regenerates_broken_file(tmp_path):
+        load_tables(tmp_path)
+        path = next(tmp_path.iterdir())
+        path.write_text('{')
+        assert load_tables(tmp_path) == load_tables()
+        assert path.read_text() != '{'
+
+    def falls_back_to_memory(tmp_path):
+        blocked = tmp_path / 'blocked'
+        blocked.write_text('')
+        assert load_tables(blocked) == load_tables()
+        assert blocked.read_text() == ''
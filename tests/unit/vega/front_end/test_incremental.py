@@ -0,0 +1,103 @@
+# pylint: skip-file
+import pytest
+
+from vega.front_end.diagnostics import Diagnostics
+from vega.front_end.exception import VegaNotYetDefinedError
+from vega.front_end.incremental import IncrementalParser
+from vega.front_end.parser import Parser
+
+FUNCTIONS = [
+    "func f() -> int {\n\treturn 1;\n}\n",
+    "func g() -> int {\n\tx: str = \"}\";\n\treturn f();\n}\n",
+    "func h() -> int {\n\treturn y;\n}\n",
+    "func main() -> int {\n\treturn g();\n}\n",
+]
+
+
+def full_report(code):
+    diagnostics = Diagnostics()
+    Parser(code, diagnostics=diagnostics).parse()
+    return diagnostics.report
+
+
+def describe_incremental_parser():
+
+    @pytest.fixture
+    def parser():
+        parser = IncrementalParser()
+        parser.parse(''.join(FUNCTIONS))
+        return parser
+
+    def splits_functions(parser):
+        functions = parser.functions
+        assert parser.parsed == len(functions) == len(FUNCTIONS)
+        assert [function.end - function.start for function in functions] \
+            == [len(code) for code in FUNCTIONS]
+        assert [function.line for function in functions] == [1, 4, 8, 11]
+        assert str(functions[0].tree.root) == str(
+            Parser(FUNCTIONS[0]).parse().root)
+
+    def same_diagnostics_as_full_parse(parser):
+        code = ''.join(FUNCTIONS)
+        assert parser.diagnostics.report == full_report(code)
+        assert [type(error) for error in parser.diagnostics] \
+            == [VegaNotYetDefinedError]
+
+    def locates_errors_in_whole_code(parser):
+        code = "func f() -> int {\n\treturn 1;\n} func g() -> int " \
+            "{ return y; }"
+        serial = Diagnostics()
+        Parser(code, diagnostics=serial).parse()
+        for edit in (code, 'func k() -> int {\n\tpass;\n}\n' + code):
+            expected = Diagnostics()
+            Parser(edit, diagnostics=expected).parse()
+            diagnostics = parser.parse(edit)
+            assert [(error.start, error.end) for error in diagnostics] \
+                == [(error.start, error.end) for error in expected]
+            assert diagnostics.report == expected.report
+        assert '} func g() -> int { return y; }' in diagnostics.report
+
+    def unchanged_code(parser):
+        parser.parse(''.join(FUNCTIONS))
+        assert parser.parsed == 0
+
+    def parses_edited_function(parser):
+        unchanged = parser.functions
+        code = ''.join(FUNCTIONS).replace('return 1;', 'return 2;')
+        parser.parse(code)
+        assert parser.parsed == 1
+        assert parser.functions[1:] == unchanged[1:]
+        assert parser.diagnostics.report == full_report(code)
+
+    def moves_error_lines(parser):
+        code = ''.join(FUNCTIONS).replace('return 1;',
+                                          'x: int = 1;\n\treturn 1;')
+        report = parser.parse(code).report
+        assert parser.parsed == 2
+        assert report == full_report(code)
+        assert 'line 10' in report
+
+    def rechecks_dependents(parser):
+        code = ''.join(FUNCTIONS).replace('func f()', 'func k()')
+        report = parser.parse(code).report
+        assert parser.parsed == 2
+        assert report == full_report(code)
+        assert 'Identifier f at line 6 not defined' in report
+        parser.parse(''.join(FUNCTIONS))
+        assert [type(error) for error in parser.diagnostics] \
+            == [VegaNotYetDefinedError]
+
+    def patches_global_symbols(parser):
+        assert parser.table.lookup('f')
+        parser.parse(''.join(FUNCTIONS[1:]))
+        assert not parser.table.lookup('f')
+        assert parser.table.lookup('main')
+
+    @pytest.mark.parametrize("code", [
+        pytest.param("", id="empty"),
+        pytest.param("\n\n", id="blank"),
+        pytest.param(FUNCTIONS[0] + "func", id="unfinished"),
+        pytest.param(FUNCTIONS[0] + "\n\n", id="trailing_blank"),
+    ])
+    def rest_of_code(parser, code):
+        assert parser.parse(code).report == full_report(code)
@@ -38,6 +38,7 @@ def describe_lexer():
             [
                 pytest.param('!=', Tag.NE, id="not_equal"),
                 pytest.param('->', Tag.RETURN_TYPE, id="return_type"),
+                pytest.param('==', Tag.EQ, id="equal"),
             ]
         )
         def combined_tokens(lexer, code, tag):
@@ -52,6 +53,10 @@ def describe_lexer():
             "code, recognized_tokens",
             [
                 pytest.param('>-', ['>', '-'], id="greater"),
+                pytest.param('x==y', [Tag.ID, Tag.EQ, Tag.ID], id="unspaced"),
+                pytest.param('a=-1', [Tag.ID, '=', '-', Tag.NUM],
+                             id="unspaced_minus"),
+                pytest.param('-->', ['-', Tag.RETURN_TYPE], id="arrow"),
             ]
         )
         def single_token(lexer, code, recognized_tokens):
@@ -108,6 +113,25 @@ def describe_lexer():
             assert token.tag == Tag.NUM or token.tag == Tag.REAL
             assert token.value == pytest.approx(value)
 
+        @pytest.mark.parametrize("code", ["0.1", "123.456789012345678"])
+        def exact_reals(lexer, code):
+            token, _ = lexer.scan().remove()
+            assert token.value == float(code)
+
+        @pytest.mark.parametrize("code", ["x = 'abc' + 42.5;"])
+        def spans(lexer, code):
+            tokens = {token.tag: token for token, _ in lexer.tokens()}
+            assert tokens[Tag.LITERAL].span == (5, 8)
+            assert tokens[Tag.LITERAL].content == 'abc'
+            assert tokens[Tag.REAL].span == (12, 16)
+
+        @pytest.mark.parametrize("code", ['"' + 'a\n' * 100000 + '"'])
+        def long_literal(lexer, code):
+            tokens = list(lexer.tokens())
+            assert tokens[1][0].content == code[1:-1]
+            assert tokens[2][1] == 1
+            assert tokens[2][0].tag == '"'
+
         @pytest.mark.parametrize(
             "code, generated_token_stream",
             [
@@ -0,0 +1,48 @@
+# pylint: skip-file
+from pathlib import Path
+
+import pytest
+
+from vega.front_end.lexer import Lexer
+from vega.front_end.parallel_lexer import scan_parallel
+from vega.front_end.parallel_lexer import split_chunks
+
+
+SPEC = Path(__file__).parents[4] / 'spec.vg'
+
+
+def describe_parallel_lexer():
+
+    def describe_split_chunks():
+
+        @pytest.mark.parametrize(
+            "code, chunks, boundaries",
+            [
+                pytest.param("a\nb\nc\nd", 2, [0, 4, 7], id="lines"),
+                pytest.param("'a\nb'\nc\nd", 4, [0, 6, 8, 9], id="literal"),
+                pytest.param("a\r\nb", 2, [0, 3, 4], id="carriage_return"),
+                pytest.param('"a\nb\nc', 3, [0, 6], id="open_literal"),
+                pytest.param("abc", 3, [0, 3], id="no_line_break"),
+            ]
+        )
+        def boundaries_outside_literals(code, chunks, boundaries):
+            assert split_chunks(code, chunks) == boundaries
+
+    def describe_scan_parallel():
+
+        def same_token_stream():
+            code = SPEC.read_text() * 20 + '"open\nliteral'
+            serial = Lexer(code).scan()
+            parallel = scan_parallel(code, workers=2,
+                                     chunk_size=len(code) // 3)
+
+            while not serial.is_empty():
+                serial_token, serial_line = serial.remove()
+                parallel_token, parallel_line = parallel.remove()
+                assert repr(parallel_token) == repr(serial_token)
+                assert parallel_line == serial_line
+            assert parallel.is_empty()
+
+        def small_code_in_process():
+            token_stream = scan_parallel("x = 1;", workers=4)
+            assert len(token_stream) == 4
@@ -0,0 +1,80 @@
+# pylint: skip-file
+import pickle
+
+import pytest
+
+from vega.front_end.diagnostics import Diagnostics
+from vega.front_end.exception import VegaAlreadyDefinedError
+from vega.front_end.exception import VegaNotYetDefinedError
+from vega.front_end.parallel_parser import parse_parallel
+from vega.front_end.parallel_parser import signature
+from vega.front_end.parallel_parser import split_functions
+from vega.front_end.parser import Parser
+
+FUNCTIONS = [
+    "func f() -> int {\n\treturn 1;\n}\n",
+    "func g() -> int {\n\tx: str = \"{\";\n\treturn f();\n}\n",
+    "func main() -> int {\n\treturn g();\n}\n",
+]
+
+FORWARD = "func f() -> int {\n\treturn g();\n}\n" \
+          "func g() -> int {\n\treturn y;\n}\n"
+
+
+def describe_parse_parallel():
+
+    def splits_functions():
+        code = ''.join(FUNCTIONS) + '\n\n'
+        assert [line for _, _, line in split_functions(code)] == [1, 4, 8]
+        assert split_functions('') == [(0, 0, 1)]
+        assert signature(FUNCTIONS[1]) == 'func g() -> int {}'
+
+    def same_tree_as_serial_parse():
+        code = ''.join(FUNCTIONS)
+        assert str(parse_parallel(code, workers=1).root) \
+            == str(Parser(code).parse().root)
+
+    def calls_functions_behind():
+        diagnostics = Diagnostics()
+        parse_parallel(FORWARD, workers=1, diagnostics=diagnostics)
+        assert [type(error) for error in diagnostics] \
+            == [VegaNotYetDefinedError]
+        assert 'Identifier y at line 5 not defined' in diagnostics.report
+
+    def locates_errors_in_whole_code():
+        code = "func f() -> int {\n\treturn 1;\n} func g() -> int " \
+            "{ return y; }"
+        expected = Diagnostics()
+        Parser(code, diagnostics=expected).parse()
+        diagnostics = Diagnostics()
+        parse_parallel(code, workers=1, diagnostics=diagnostics)
+        assert [(error.start, error.end) for error in diagnostics] \
+            == [(error.start, error.end) for error in expected]
+        assert diagnostics.report == expected.report
+        assert '3 | } func g() -> int { return y; }' in diagnostics.report
+
+    def flags_later_definitions():
+        diagnostics = Diagnostics()
+        parse_parallel(FUNCTIONS[0] * 3, workers=1, diagnostics=diagnostics)
+        assert [type(error) for error in diagnostics] \
+            == [VegaAlreadyDefinedError] * 2
+
+    def raises_first_error():
+        with pytest.raises(VegaNotYetDefinedError):
+            parse_parallel(FORWARD + FORWARD.replace('y', 'z'), workers=1)
+
+    def same_result_in_workers():
+        code = (FORWARD.replace('g', 'h') + ''.join(FUNCTIONS)) * 3
+        serial = Diagnostics()
+        tree = parse_parallel(code, workers=1, diagnostics=serial)
+        parallel = Diagnostics()
+        assert str(parse_parallel(code, workers=2, diagnostics=parallel,
+                                  chunk_size=1).root) == str(tree.root)
+        assert parallel.report == serial.report
+        assert len(parallel) == 14
+
+    def errors_pickle():
+        diagnostics = Diagnostics()
+        parse_parallel(FORWARD, workers=1, diagnostics=diagnostics)
+        error = next(iter(diagnostics))
+        assert str(pickle.loads(pickle.dumps(error))) == str(error)
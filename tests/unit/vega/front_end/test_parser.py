@@ -4,6 +4,16 @@ from unittest.mock import patch
 
 import pytest
 
+from vega.data_structs.syntax_tree import Syntax
+from vega.front_end.diagnostics import Diagnostics
+from vega.front_end.exception import BaseError
+from vega.front_end.exception import VegaAlreadyDefinedError
+from vega.front_end.exception import VegaNoCallableError
+from vega.front_end.exception import VegaNotAssignError
+from vega.front_end.exception import VegaNotYetDefinedError
+from vega.front_end.exception import VegaSyntaxError
+from vega.front_end.lexer import Lexer
+from vega.front_end.parser import Mode
 from vega.front_end.parser import Parser
 
 
@@ -50,3 +60,274 @@ func main() -> int {
         ])
         def vega_code(parser, code):
             parser.parse()
+
+        @pytest.mark.parametrize("statement, tree", [
+            pytest.param("x: int = 1 + 2 * 3;",
+                         "(DECLARATION : (NAME x) (TYPE int) (BINARY + "
+                         "(TERMINAL 1) (BINARY * (TERMINAL 2) (TERMINAL 3))))",
+                         id="precedence"),
+            pytest.param("x: bool = not -1 < 2 and true;",
+                         "(DECLARATION : (NAME x) (TYPE bool) (BINARY and "
+                         "(UNARY not (BINARY < (UNARY - (TERMINAL 1)) "
+                         "(TERMINAL 2))) (TERMINAL true)))",
+                         id="prefixes"),
+            pytest.param("x, y: const str = 'a';",
+                         "(DECLARATION : (NAME x) (NAME y) (CONST const) "
+                         "(TYPE str) (LITERAL a))",
+                         id="declaration"),
+            pytest.param("k: int[2] = [1, 2]; k[0] = main();",
+                         "(ASSIGNMENT = (INDEX [ (NAME k) (TERMINAL 0)) "
+                         "(CALL ( (NAME main)))",
+                         id="assignment"),
+            pytest.param("while (true) { break; }",
+                         "(WHILE while (TERMINAL true) (SCOPE { "
+                         "(BREAK break)))",
+                         id="while"),
+            pytest.param("if (1) { pass; } else { return 2; }",
+                         "(IF if (TERMINAL 1) (SCOPE { (PASS pass)) "
+                         "(ELSE else (SCOPE { (RETURN return "
+                         "(TERMINAL 2)))))",
+                         id="if_else"),
+        ])
+        def syntax_tree(statement, tree):
+            syntax_tree = Parser(f"func main() -> int {{ {statement} }}"
+                                 ).parse()
+            function = syntax_tree.root.children[0]
+            assert function.kind is Syntax.FUNCTION
+            assert str(function.token) == 'main'
+            *_, scope = function.children
+            assert str(scope.children[-1]) == tree
+
+        @pytest.mark.parametrize("expression", [
+            pytest.param("1 + 2 * 3 - 4 / 5", id="arithmetic"),
+            pytest.param("not - 1 < 2 * 3 == 4 or 5 && 6", id="mixed"),
+            pytest.param("1 * - 2 + not 3", id="prefixed_operands"),
+            pytest.param("((1 + 2) * [3, 4 - 5])", id="nested"),
+        ])
+        def expressions(expression):
+            Parser(f"func main() -> int {{\n\tx: int = {expression};\n}}"
+                   ).parse()
+
+        @pytest.mark.parametrize("expression", [
+            pytest.param("1 < not 2", id="prefix_after_comparison"),
+            pytest.param("not not 1", id="double_prefix"),
+            pytest.param("(1 + 2", id="open_bracket"),
+        ])
+        def invalid_expressions(expression):
+            with pytest.raises(VegaSyntaxError):
+                Parser(f"func main() -> int {{\n\tx: int = {expression};"
+                       f"\n}}").parse()
+
+    def describe_errors():
+
+        @pytest.mark.parametrize("code, error, snippet", [
+            pytest.param("func main() -> int {\n\tx: int = 1;\n\tx(2);\n}",
+                         VegaNoCallableError, "3 | \tx(2);\n  | \t^",
+                         id="no_callable"),
+            pytest.param("func main() -> int {\n    yy = 2;\n}",
+                         VegaNotYetDefinedError,
+                         "2 |     yy = 2;\n  |     ^^",
+                         id="not_defined"),
+            pytest.param("func main() -> int {\n\tpass;\n} func -",
+                         VegaSyntaxError, "3 | } func -\n  |        ^",
+                         id="syntax"),
+            pytest.param("func main() -> int {\n\tpass;\n",
+                         VegaSyntaxError, "2 | \tpass;\n  | \t     ^",
+                         id="end_of_file"),
+            pytest.param("func main() -> int {\n\tx;\n}",
+                         VegaSyntaxError, "2 | \tx;\n  | \t^",
+                         id="no_statement"),
+            pytest.param("func main() -> int {\n\tx: int = 1 1;\n}",
+                         VegaSyntaxError,
+                         "2 | \tx: int = 1 1;\n  | \t           ^",
+                         id="no_delimiter"),
+            pytest.param("func main() -> int {\n\telse {\n\tpass;\n}\n}",
+                         VegaSyntaxError, "2 | \telse {\n  | \t^^^^",
+                         id="else_without_if"),
+        ])
+        def located(parser, code, error, snippet):
+            with pytest.raises(error) as raised:
+                parser.parse()
+            assert raised.value.snippet == snippet
+            assert raised.value.report.endswith(snippet)
+
+
+def describe_modes():
+    NESTED = ("func main() -> int {\n\tx: int = " + "(" * 3000 + "1"
+              + ")" * 3000 + ";\n" + "\tif (x) {" * 1000 + "pass;"
+              + "}" * 1000 + "\n}")
+
+    @pytest.mark.parametrize("code", [
+        pytest.param("func f(a: int = 1) -> int[] {\n\tx, y: int = -(a + 2)"
+                     " * [1, f()][0];\n\twhile (not x < y) {\n\t\tif (x) {"
+                     " break; } elif (y) { continue; } else { return 'c'; }"
+                     "\n\t}\n}", id="statements"),
+        pytest.param("func main() -> int {\n\tx: int = (1 + ;\n}",
+                     id="syntax_error"),
+        pytest.param("func main() -> int {\n\ty = 1;\n}",
+                     id="not_defined"),
+    ])
+    def same_results(code):
+        results = []
+        for mode in Mode:
+            try:
+                results.append(str(Parser(code, mode).parse().root))
+            except BaseError as error:
+                results.append((type(error), error.report))
+        assert results[0] == results[1]
+
+    def deep_nesting_on_stack():
+        tree = Parser(NESTED, Mode.STACK).parse()
+        ifs = [index for index in range(len(tree))
+               if tree.kind(index) is Syntax.IF]
+        assert len(ifs) == 1000
+
+    def deep_nesting_recursive():
+        with pytest.raises(RecursionError):
+            Parser(NESTED, Mode.RECURSIVE).parse()
+
+
+def describe_recovery():
+    CODE = """func main() -> int {
+    x: int = 1;
+    y = 2;
+    x = (1 + ;
+    x: int = 3;
+    if (x { x = 1; }
+    main = 4;
+    x();
+    return 0;
+}
+func f(a b) -> int {
+    return 0
+}
+func g() -> int {
+    return w;
+}"""
+    ERRORS = [(VegaNotYetDefinedError, 3), (VegaSyntaxError, 4),
+              (VegaAlreadyDefinedError, 5), (VegaSyntaxError, 6),
+              (VegaNotAssignError, 7), (VegaNoCallableError, 8),
+              (VegaSyntaxError, 11), (VegaNotYetDefinedError, 15)]
+
+    @pytest.mark.parametrize("mode", list(Mode))
+    def reports_all_errors(mode):
+        diagnostics = Diagnostics()
+        tree = Parser(CODE, mode, diagnostics).parse()
+        assert [(type(error), error.line) for error in diagnostics] \
+            == ERRORS
+        assert diagnostics.report.count('\n') == 3 * len(ERRORS) - 1
+        functions = [tree.token(index).lexeme for index in range(len(tree))
+                     if tree.kind(index) is Syntax.FUNCTION]
+        assert functions == ['main', 'f', 'g']
+
+    def stops_at_limit():
+        diagnostics = Diagnostics(limit=3)
+        Parser(CODE, diagnostics=diagnostics).parse()
+        assert [(type(error), error.line) for error in diagnostics] \
+            == ERRORS[:3]
+
+    def stops_scanning_at_limit():
+        lines = []
+        scan = Lexer.spans
+
+        def spans(lexer):
+            for span in scan(lexer):
+                lines.append(span[1])
+                yield span
+
+        with patch.object(Lexer, 'spans', spans):
+            Parser(CODE, diagnostics=Diagnostics(limit=1)).parse()
+        assert max(lines) == 3
+
+    @pytest.mark.parametrize("code", [
+        pytest.param("func main() -> int {\n\tx: int = (1 + ;\n}",
+                     id="delimiter"),
+        pytest.param("func main() -> int {\n\twhile (1) { break }\n}",
+                     id="curly_bracket"),
+        pytest.param("func 5 func main() -> int {\n\treturn 0;\n}",
+                     id="func"),
+    ])
+    def synchronizes(code):
+        diagnostics = Diagnostics()
+        tree = Parser(code, diagnostics=diagnostics).parse()
+        assert [type(error) for error in diagnostics] == [VegaSyntaxError]
+        assert tree.root.kind is Syntax.BLOCK
+
+    @pytest.mark.parametrize("code, errors", [
+        pytest.param("func main() -> int { pass; } xyz",
+                     [(VegaSyntaxError, 1)], id="stray_word"),
+        pytest.param("func main() -> int { pass; }\n}\n"
+                     "func f() -> int { return y; }",
+                     [(VegaSyntaxError, 2), (VegaNotYetDefinedError, 3)],
+                     id="stray_curly_bracket"),
+        pytest.param("; func f() -> int { return y; }",
+                     [(VegaSyntaxError, 1), (VegaNotYetDefinedError, 1)],
+                     id="stray_delimiter_in_front"),
+        pytest.param("func a() -> i}nt { pass; }\n"
+                     "func b() -> int { return z; }",
+                     [(VegaSyntaxError, 1), (VegaSyntaxError, 1),
+                      (VegaNotYetDefinedError, 2)],
+                     id="broken_return_type"),
+    ])
+    @pytest.mark.parametrize("mode", list(Mode))
+    def reports_tokens_around_block(mode, code, errors):
+        with pytest.raises(VegaSyntaxError):
+            Parser(code, mode).parse()
+        diagnostics = Diagnostics()
+        tree = Parser(code, mode, diagnostics).parse()
+        assert [(type(error), error.line) for error in diagnostics] \
+            == errors
+        assert tree.root.kind is Syntax.BLOCK
+
+    @pytest.mark.parametrize("mode", list(Mode))
+    def reports_undefined_call_once(mode):
+        code = "func main() -> int {\n  return g(1);\n}"
+        diagnostics = Diagnostics()
+        Parser(code, mode, diagnostics).parse()
+        assert [(type(error), error.line) for error in diagnostics] \
+            == [(VegaNotYetDefinedError, 2)]
+
+    @pytest.mark.parametrize("mode", list(Mode))
+    def skips_array_type_without_type(mode):
+        code = "func main() -> int {\n x: int = 1;\nf \n : [ -> = pass " \
+            "while ,\n}\n"
+        diagnostics = Diagnostics()
+        tree = Parser(code, mode, diagnostics).parse()
+        assert [(type(error), error.line) for error in diagnostics] \
+            == [(VegaSyntaxError, 4)]
+        assert tree.root.kind is Syntax.BLOCK
+
+    def valid_code():
+        diagnostics = Diagnostics()
+        code = "func main() -> int {\n\tx: int = 1;\n\treturn x;\n}"
+        tree = Parser(code, diagnostics=diagnostics).parse()
+        assert not diagnostics
+        assert str(tree.root) == str(Parser(code).parse().root)
+
+
+def describe_parse_many():
+    CODES = ["func f() -> int {\n\treturn 1;\n}",
+             "func g() -> int {\n\treturn f();\n}",
+             "func h() -> int {\n\tx = (1 + ;\n\ty = 2;\n\treturn w;\n}"]
+
+    @pytest.mark.parametrize("mode", list(Mode))
+    def same_as_single_parse(mode):
+        results = Parser.parse_many(CODES, mode)
+        for code, result in zip(CODES, results):
+            diagnostics = Diagnostics()
+            tree = Parser(code, mode, diagnostics).parse()
+            assert str(result.tree.root) == str(tree.root)
+            assert result.diagnostics.report == diagnostics.report
+
+    def symbols_do_not_leak():
+        results = Parser.parse_many(CODES[:2])
+        assert not results[0].diagnostics
+        assert [type(error) for error in results[1].diagnostics] \
+            == [VegaNotYetDefinedError]
+
+    def limit_per_code():
+        results = Parser.parse_many(CODES[2:] + CODES[:1], limit=3)
+        assert len(results[0].diagnostics) == 3
+        assert not results[1].diagnostics
+        assert str(results[1].tree.root) \
+            == str(Parser(CODES[0]).parse().root)
@@ -0,0 +1,40 @@
+# pylint: skip-file
+from io import StringIO
+
+import pytest
+
+from vega.front_end.source import load_source
+
+
+def describe_load_source():
+
+    @pytest.fixture
+    def program(tmp_path):
+        path = tmp_path / 'program.vg'
+        path.write_bytes(b'func main() -> int {\r\n\tpass;\r\n}\n')
+        return path
+
+    def string(program):
+        assert load_source('a = 5') == 'a = 5'
+
+    def path(program):
+        assert load_source(program) == 'func main() -> int {\n\tpass;\n}\n'
+
+    def bytes_buffer(program):
+        assert load_source(program.read_bytes()) == load_source(program)
+
+    def text_file(program):
+        with open(program) as code_file:
+            assert load_source(code_file) == load_source(program)
+
+    def binary_file(program):
+        with open(program, 'rb') as code_file:
+            assert load_source(code_file) == load_source(program)
+
+    def stream():
+        assert load_source(StringIO('i: int;')) == 'i: int;'
+
+    def empty_file(tmp_path):
+        path = tmp_path / 'empty.vg'
+        path.write_bytes(b'')
+        assert load_source(path) == ''
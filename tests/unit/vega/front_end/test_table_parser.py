@@ -0,0 +1,132 @@
+# pylint: skip-file
+from pathlib import Path
+
+import pytest
+
+from vega.front_end.diagnostics import Diagnostics
+from vega.front_end.exception import VegaAlreadyDefinedError
+from vega.front_end.exception import VegaNoCallableError
+from vega.front_end.exception import VegaNotAssignError
+from vega.front_end.exception import VegaNotYetDefinedError
+from vega.front_end.exception import VegaSyntaxError
+from vega.front_end.parser import Parser
+from vega.front_end.table_parser import TableParser
+from vega.front_end.table_parser import default_tables
+
+SPEC = Path(__file__).parents[4] / 'spec.vg'
+
+CODE = """func main() -> int {
+    x: int = 1;
+    y = 2;
+    x: int = 3;
+    main = 4;
+    x();
+    c: const int = 1;
+    c = 2;
+    return f(x);
+}
+func f(a: int) -> int {
+    return a;
+}"""
+ERRORS = [(VegaNotYetDefinedError, 3), (VegaAlreadyDefinedError, 4),
+          (VegaNotAssignError, 5), (VegaNoCallableError, 6),
+          (VegaNotAssignError, 8), (VegaNotYetDefinedError, 9)]
+
+
+def errors(diagnostics):
+    return [(type(error), error.line) for error in diagnostics]
+
+
+def describe_table_parser():
+
+    def valid_code():
+        diagnostics = Diagnostics()
+        TableParser(SPEC, diagnostics).parse()
+        assert not diagnostics
+
+    def same_errors_as_parser():
+        diagnostics = Diagnostics()
+        TableParser(CODE, diagnostics).parse()
+        expected = Diagnostics()
+        Parser(CODE, diagnostics=expected).parse()
+        assert errors(diagnostics) == ERRORS
+        assert sorted(set(errors(expected)), key=ERRORS.index) == ERRORS
+        assert str(list(diagnostics)[0]) == str(list(expected)[0])
+
+    def raises_first_error():
+        with pytest.raises(VegaNotYetDefinedError):
+            TableParser(CODE).parse()
+
+    def stops_at_limit():
+        diagnostics = Diagnostics(limit=2)
+        TableParser(CODE, diagnostics).parse()
+        assert errors(diagnostics) == ERRORS[:2]
+
+    @pytest.mark.parametrize("code, line", [
+        pytest.param("func main() -> int {\n\tx: int = (1 + ;\n}", 2,
+                     id="operand"),
+        pytest.param("func main() -> int {\n}", 2, id="empty_scope"),
+        pytest.param("func main() -> int {\n\tpass;\n}\nx", 4,
+                     id="behind_functions"),
+        pytest.param("", 1, id="empty"),
+    ])
+    def syntax_error(code, line):
+        diagnostics = Diagnostics()
+        TableParser(code, diagnostics).parse()
+        assert errors(diagnostics) == [(VegaSyntaxError, line)]
+        with pytest.raises(VegaSyntaxError):
+            TableParser(code).parse()
+
+    @pytest.mark.parametrize("statement", [
+        pytest.param("x: bool = not 1 < 2;", id="not"),
+        pytest.param("x: bool = 1 && 2 || not 3 > 4;", id="boolean_signs"),
+        pytest.param("x: int = -1 * 2 and 3;", id="boolean_words"),
+        pytest.param("x: int[2] = [1, 2];", id="array"),
+        pytest.param("x: str = \"a\";\n\ty: char = 'b';", id="literals"),
+        pytest.param("x: bool = !1;", id="exclamation_mark"),
+        pytest.param("x: bool = !(1 < 2);", id="exclamation_mark_bracket"),
+        pytest.param("x: bool = not not 1;", id="double_not"),
+        pytest.param("x: int = 1", id="missing_delimiter"),
+        pytest.param("return 1 2;", id="missing_operator"),
+    ])
+    def same_verdict_as_parser(statement):
+        code = f"func main() -> int {{\n\t{statement}\n}}"
+        verdicts = []
+        for parser in (Parser, TableParser):
+            try:
+                parser(code).parse()
+                verdicts.append(None)
+            except VegaSyntaxError as error:
+                verdicts.append(error.line)
+        assert verdicts[0] == verdicts[1]
+
+    def nested_functions():
+        code = "func f() -> int {\n\tfunc g() -> int {\n\t\treturn 1;\n\t}" \
+               "\n\tfunc h() -> int {\n\t\treturn g();\n\t}\n}"
+        TableParser(code).parse()
+
+    def custom_actions():
+        calls = []
+        TableParser(SPEC).parse({
+            ('scopeStatement', 'enter'): lambda token, line: calls.append(
+                line),
+            ('block', 'ID'): lambda token, line: calls.append(token.lexeme),
+        })
+        assert calls == ['foobar', 1, 2, 3, 7, 11, 'main', 18]
+
+    def keeps_symbols():
+        parser = TableParser(SPEC)
+        parser.parse()
+        assert parser.table.lookup('main')
+        assert not parser.table.lookup('k')
+
+
+def describe_default_tables():
+
+    def keeps_tables_in_memory():
+        assert default_tables() is default_tables()
+
+    def caches_in_directory(tmp_path):
+        tables = default_tables(tmp_path)
+        assert tables == default_tables()
+        assert len(list(tmp_path.iterdir())) == 1
@@ -0,0 +1,52 @@
+# pylint: skip-file
+import pytest
+
+from vega.language import kinds
+from vega.language import vocabulary
+from vega.language.token import KINDS
+from vega.language.token import Literal
+from vega.language.token import Num
+from vega.language.token import Real
+from vega.language.token import Tag
+from vega.language.token import Token
+from vega.language.token import kind_of
+from vega.language.types import String
+
+
+def describe_kinds():
+
+    def one_char_tokens():
+        assert Token('+').kind == ord('+') == kinds.PLUS
+        assert vocabulary.token(';').kind == kinds.DELIMITER
+        assert Token('\xff').kind == 255
+
+    def tag_tokens():
+        assert Num(1).kind == Tag.NUM.value == kinds.NUM
+        assert vocabulary.EQ.kind == kinds.EQ
+        assert vocabulary.EOF.kind == kinds.EOF
+        assert all(256 <= tag.value < KINDS for tag in Tag)
+
+    def wide_chars():
+        assert kind_of('€') == Tag.CHAR.value
+        assert Token('€').kind < KINDS
+
+    def dense():
+        kind_list = [kind_of(chr(code)) for code in range(256)] \
+            + [kind_of(tag) for tag in Tag]
+        assert kind_list == list(range(KINDS))
+
+
+def describe_slots():
+
+    @pytest.mark.parametrize("token", [
+        pytest.param(Token('+'), id="token"),
+        pytest.param(vocabulary.EQ, id="word"),
+        pytest.param(Num(None, '42', 0, 2), id="num"),
+        pytest.param(Real(1.5), id="real"),
+        pytest.param(Literal('text'), id="literal"),
+        pytest.param(String(size=2), id="string"),
+    ])
+    def no_instance_dict(token):
+        assert not hasattr(token, '__dict__')
+        with pytest.raises(AttributeError):
+            token.unknown = 1
@@ -26,6 +26,12 @@ def describe_symbol_table():
         def global_scope(symbol_table, lookup, bool):
             assert symbol_table.lookup(lookup) is bool
 
+        def interned_id(symbol_table):
+            symbol, scope = symbol_table.retrieve(Symbol("A", False, False,
+                                                         None).id)
+            assert scope == 'global'
+            assert symbol.name == "A"
+
         def retrieval(symbol_table):
             symbol: Symbol
             scope: str
@@ -44,3 +50,47 @@ def describe_symbol_table():
             symbol_table.leave_scope()
 
             assert symbol_table.lookup(lookup) is bool
+
+    def describe_reuse():
+        def pooled_scope_is_empty(symbol_table):
+            table = symbol_table.head.data.table
+            symbol_table.leave_scope()
+            symbol_table.enter_scope('other')
+
+            assert symbol_table.head.data.table is table
+            assert symbol_table.lookup("do_something") is False
+
+        def reset(symbol_table):
+            symbol_table.reset()
+
+            assert len(symbol_table) == 1
+            assert symbol_table.head.data.name == 'global'
+            assert symbol_table.lookup("A") is False
+
+        def reset_no_scope():
+            symbol_table = SymbolTable()
+            symbol_table.leave_scope()
+            with pytest.raises(IndexError):
+                symbol_table.reset()
+
+    def describe_remove():
+        def top_scope(symbol_table):
+            assert symbol_table.remove("do_something") is True
+            assert symbol_table.lookup("do_something") is False
+
+        def lower_scope(symbol_table):
+            assert symbol_table.remove("A") is False
+            assert symbol_table.lookup("A") is True
+
+        def never_interned(symbol_table):
+            assert symbol_table.remove("never_interned_name") is False
+
+
+def describe_symbol():
+
+    def slotted():
+        symbol: Symbol = Symbol("A", True, False, INT)
+
+        assert not hasattr(symbol, '__dict__')
+        assert symbol == Symbol("A", True, False, INT)
+        assert symbol.id == Symbol("A", False, False, None).id
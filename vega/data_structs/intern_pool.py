@@ -0,0 +1,101 @@
+"""Interning pool for lexemes
+
+Keywords and identifiers are mapped to small dense integer ids once per
+process. Tokens, hash tables and the symbol table use these ids as keys
+instead of hashing the same lexeme strings again and again.
+
+The pool also keeps the word token of every lexeme, so scanning many
+programs in one process shares the word tokens of common names.
+
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Union
+
+
+class InternPool:
+    """Interning pool
+
+    Lexemes are numbered in order of their first occurrence.
+
+    """
+
+    def __init__(self) -> None:
+        """Create empty interning pool"""
+        self.__ids: Dict[str, int] = {}
+        self.__lexemes: List[str] = []
+        self.__words: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self.__lexemes)
+
+    def __contains__(self, lexeme: str) -> bool:
+        return lexeme in self.__ids
+
+    def intern(self, lexeme: str) -> int:
+        """Get id of a lexeme
+
+        Unknown lexemes are added to the pool.
+
+        Args:
+            lexeme: keyword or identifier
+
+        Returns:
+            id of the lexeme
+        """
+        ident: Union[int, None] = self.__ids.get(lexeme)
+        if ident is None:
+            ident = len(self.__lexemes)
+            self.__ids[lexeme] = ident
+            self.__lexemes.append(lexeme)
+            self.__words.append(None)
+        return ident
+
+    def find(self, lexeme: str) -> Union[int, None]:
+        """Get id of a lexeme without adding it to the pool
+
+        Args:
+            lexeme: keyword or identifier
+
+        Returns:
+            id of the lexeme, None if the lexeme has not been interned
+        """
+        return self.__ids.get(lexeme)
+
+    def lexeme(self, ident: int) -> str:
+        """Get lexeme of an id
+
+        Args:
+            ident: lexeme id
+
+        Returns:
+            lexeme
+        """
+        return self.__lexemes[ident]
+
+    def get(self, lexeme: str) -> Union[Any, None]:
+        """Get word token of a lexeme
+
+        Args:
+            lexeme: keyword or identifier
+
+        Returns:
+            word token, None if no word has been stored for the lexeme
+        """
+        ident: Union[int, None] = self.__ids.get(lexeme)
+        if ident is None:
+            return None
+        return self.__words[ident]
+
+    def put(self, lexeme: str, word: Any) -> None:
+        """Store word token of a lexeme
+
+        Args:
+            lexeme: keyword or identifier
+            word: word token
+        """
+        self.__words[self.intern(lexeme)] = word
+
+
+POOL: InternPool = InternPool()
@@ -0,0 +1,106 @@
+"""Line index of program code
+
+The lexer records the buffer position of every line start while scanning.
+Buffer positions are then mapped to line and column by binary search over
+these line starts, and diagnostics render the line of a position straight
+from the code buffer.
+
+Lines the lexer has not reached yet are indexed on demand, so any position
+of the code can be located.
+
+"""
+from array import array
+from bisect import bisect_right
+from typing import Tuple
+
+from vega.data_structs.token_lines import LINE_BREAK
+
+
+class LineIndex:
+    """Buffer positions of line starts"""
+
+    def __init__(self, code: str, line: int = 1) -> None:
+        """Create line index of program code
+
+        Args:
+            code: code buffer
+            line: line number the code starts at
+        """
+        self.__code: str = code
+        self.__line: int = line
+        self.__starts: array = array('q', [0])
+        self.__indexed: int = 0
+
+    def __len__(self) -> int:
+        return len(self.__starts)
+
+    def add(self, start: int) -> None:
+        """Record a line start found while scanning
+
+        Args:
+            start: buffer position behind a line break
+        """
+        if start > self.__starts[-1]:
+            self.__starts.append(start)
+        if start > self.__indexed:
+            self.__indexed = start
+
+    def index(self, end: int) -> None:
+        """Record all line starts in front of a buffer position
+
+        Args:
+            end: buffer position to index the code up to
+        """
+        if end <= self.__indexed:
+            return
+        for found in LINE_BREAK.finditer(self.__code, self.__indexed, end):
+            self.add(found.end())
+        self.__indexed = min(end, len(self.__code))
+
+    def locate(self, position: int) -> Tuple[int, int]:
+        """Map buffer position to line and column
+
+        Args:
+            position: buffer position
+
+        Returns:
+            line number and column (counted from 0) of the position
+        """
+        self.index(position)
+        index: int = bisect_right(self.__starts, position) - 1
+        return self.__line + index, position - self.__starts[index]
+
+    def text(self, line: int) -> str:
+        """Get text of a line without its line break
+
+        Args:
+            line: line number
+
+        Returns:
+            text of the line
+        """
+        if line - self.__line >= len(self.__starts):
+            self.index(len(self.__code))
+        start: int = self.__starts[line - self.__line]
+        found = LINE_BREAK.search(self.__code, start)
+        return self.__code[start:len(self.__code) if found is None
+                           else found.start()]
+
+    def render(self, start: int, end: int) -> str:
+        """Render the line of a code range with carets below the range
+
+        Args:
+            start: buffer position of the range
+            end: buffer position behind the range
+
+        Returns:
+            line number and line text followed by a caret line
+        """
+        line, column = self.locate(start)
+        text: str = self.text(line)
+        width: int = max(1, min(end - start, len(text) - column))
+        gutter: str = f'{line} | '
+        indent: str = ''.join('\t' if char == '\t' else ' '
+                              for char in text[:column])
+        return (f'{gutter}{text}\n'
+                f'{" " * (len(gutter) - 2)}| {indent}{"^" * width}')
@@ -3,11 +3,15 @@
 Implements symbol table and needed data structures for storing data
 inside symbol table
 
+Symbols are keyed on the interned id of their name, see ``InternPool``.
+
 """
 from dataclasses import dataclass
+from typing import List
 from typing import Tuple
 from typing import Union
 
+from vega.data_structs.intern_pool import POOL
 from vega.language.types import Type
 from vega.utils.data_types.hash_table import HashTable
 from vega.utils.data_types.lists import Node
@@ -26,13 +30,20 @@ class Symbol:
         const: bool - True if symbol is a constant
         callable: bool - True if symbol is a callable like a function call
         type: Type - variable type of the symbol
+        id: int - interned id of the name
 
     """
+    __slots__ = ('name', 'const', 'callable', 'type', 'id')
+
     name: str
     const: bool
     callable: bool
     type: Union[Type, None]
 
+    def __post_init__(self) -> None:
+        # not a dataclass field: a field default would shadow its slot
+        self.id: int = POOL.intern(self.name)
+
 
 @dataclass
 class Scope:
@@ -45,10 +56,26 @@ class Scope:
         table: HashTable - hash table for storing symbols
 
     """
+    __slots__ = ('name', 'table')
+
     name: str
     table: HashTable
 
 
+def _key(name: Union[str, int]) -> Union[int, None]:
+    """Get hash table key of a symbol name
+
+    Args:
+        name: symbol name or its interned id
+
+    Returns:
+        interned id, None if the name has never been interned
+    """
+    if isinstance(name, int):
+        return name
+    return POOL.find(name)
+
+
 class SymbolTable(Stack):
     """Symbol table for storing symbols
 
@@ -57,12 +84,23 @@ class SymbolTable(Stack):
     top of the stack. If an element is not found, lookup one level below in the
     stack.
 
+    Hash tables of left scopes are cleared and kept in a pool for the next
+    scope, since seeding the hash function of a new one is expensive.
+
     """
 
-    def __init__(self) -> None:
-        """Initialize Symbol table with global scope"""
+    def __init__(self, scope: Union[Scope, None] = None) -> None:
+        """Initialize Symbol table with global scope
+
+        Args:
+            scope: global scope, a new one if None
+        """
         super().__init__()
-        self.enter_scope('global')
+        self.__pool: List[HashTable] = []
+        if scope is None:
+            self.enter_scope('global')
+        else:
+            self.push(scope)
 
     def enter_scope(self, scope_name: str) -> None:
         """Create a new scope
@@ -72,7 +110,8 @@ class SymbolTable(Stack):
         Args:
             scope_name: name of the new scope to be created
         """
-        scope = Scope(scope_name, HashTable())
+        table: HashTable = self.__pool.pop() if self.__pool else HashTable()
+        scope = Scope(scope_name, table)
         self.push(scope)
 
     def leave_scope(self) -> None:
@@ -80,40 +119,61 @@ class SymbolTable(Stack):
         if self.is_empty():
             raise IndexError("Cannot leave no scope")
         scope: Scope = self.pop()
+        if isinstance(scope.table, HashTable):
+            scope.table.clear()
+            self.__pool.append(scope.table)
         del scope
 
-    def lookup(self, name: str) -> bool:
+    def reset(self) -> None:
+        """Leave all scopes but the global one and empty it
+
+        The symbol table can then be reused for other program code.
+        """
+        if self.is_empty():
+            raise IndexError("Cannot reset no scope")
+        while self.head.prev:
+            self.leave_scope()
+        self.head.data.table.clear()
+
+    def lookup(self, name: Union[str, int]) -> bool:
         """Lookup symbol in symbol table
 
         First lookup on top of the stack, then move one level down till bottom
 
         Args:
-            name: symbol name to look for
+            name: symbol name or its interned id to look for
 
         Returns:
             True if symbol with name is found, False otherwise
         """
+        key: Union[int, None] = _key(name)
+        if key is None:
+            return False
         current_scope: Node = self.head
         while current_scope:
-            if current_scope.data.table.get(name):
+            if current_scope.data.table.get(key):
                 return True
             current_scope = current_scope.prev
         return False
 
-    def retrieve(self, name: str) -> Tuple[Union[Symbol, None], str]:
+    def retrieve(self, name: Union[str, int]
+                 ) -> Tuple[Union[Symbol, None], str]:
         """Get symbol from hash table
 
         See ``self.lookup()`` for symbol search.
 
         Args:
-            name: symbol name to retrieve
+            name: symbol name or its interned id to retrieve
 
         Returns:
             Tuple of symbol and scope name if found, Tuple of None otherwise
         """
+        key: Union[int, None] = _key(name)
+        if key is None:
+            return None, ''
         current_scope: Node = self.head
         while current_scope:
-            symbol: Union[Symbol, None] = current_scope.data.table.get(name)
+            symbol: Union[Symbol, None] = current_scope.data.table.get(key)
             scope: str = current_scope.data.name
             if symbol:
                 return symbol, scope
@@ -131,4 +191,22 @@ class SymbolTable(Stack):
         """
         if self.is_empty():
             raise IndexError("Cannot store in no scope")
-        self.head.data.table.put(symbol.name, symbol)
+        self.head.data.table.put(symbol.id, symbol)
+
+    def remove(self, name: Union[str, int]) -> bool:
+        """Remove symbol from symbol table
+
+        Remove a symbol from the top scope of the stack
+
+        Args:
+            name: symbol name or its interned id to remove
+
+        Returns:
+            True if the symbol has been removed, False if it was not found
+        """
+        if self.is_empty():
+            raise IndexError("Cannot remove from no scope")
+        key: Union[int, None] = _key(name)
+        if key is None:
+            return False
+        return self.head.data.table.delete(key)
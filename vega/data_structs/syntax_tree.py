@@ -0,0 +1,362 @@
+"""Abstract syntax tree of vega program code
+
+The parser stores the syntax tree in a flat arena instead of one object per
+node. Every node is a row of ``array`` columns:
+
+    kind: node kind (``Syntax`` value)
+    token: index into the token table, -1 for nodes without token
+    first child: index of the first child node, -1 for leaves
+    next sibling: index of the next child of the parent, -1 for the last
+
+Nodes are added bottom up, children before their parent, so the root is
+the last node. Tokens referenced by nodes are kept in a token table with
+their buffer positions.
+
+``SyntaxNode`` is a lightweight view of one node for navigating the tree.
+
+Trees can be exported as plain array columns, with tokens replaced by their
+kind and buffer positions. The subtrees of such columns can be grafted onto
+another tree, with the tokens created again from the program code.
+
+"""
+from array import array
+from enum import Enum
+from enum import auto
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from vega.language.token import TokenType
+
+
+class Syntax(Enum):
+    """Syntax tree node kinds"""
+    BLOCK = auto()  # functions
+    FUNCTION = auto()  # parameters, return type, scope
+    PARAMETER = auto()  # type, default value
+    TYPE = auto()  # array dimensions
+    DIMENSION = auto()  # array size
+    SCOPE = auto()  # statements
+    DECLARATION = auto()  # names, const, type, value
+    CONST = auto()
+    ASSIGNMENT = auto()  # target, value
+    CALL = auto()  # arguments
+    RETURN = auto()  # value
+    BREAK = auto()
+    CONTINUE = auto()
+    PASS = auto()
+    WHILE = auto()  # condition, scope
+    IF = auto()  # condition, scope, elif and else branches
+    ELIF = auto()  # condition, scope
+    ELSE = auto()  # scope
+    BINARY = auto()  # left and right operand
+    UNARY = auto()  # operand
+    INDEX = auto()  # array, index
+    ARRAY = auto()  # elements
+    NAME = auto()
+    TERMINAL = auto()  # numbers and booleans
+    LITERAL = auto()
+
+
+# node kinds by their value
+SYNTAX: List[Union[Syntax, None]] = [None] + list(Syntax)
+
+# node kind, token, first child and next sibling columns followed by the
+# token kind, start and end columns of the token table
+Columns = Tuple[array, array, array, array, array, array, array]
+
+
+class SyntaxTree:
+    """Arena of syntax tree nodes"""
+
+    def __init__(self) -> None:
+        """Create empty syntax tree"""
+        self.__kinds: array = array('i')
+        self.__tokens: array = array('i')
+        self.__first_children: array = array('i')
+        self.__next_siblings: array = array('i')
+        self.__token_table: List[TokenType] = []
+        self.__starts: array = array('q')
+        self.__ends: array = array('q')
+
+    def __len__(self) -> int:
+        return len(self.__kinds)
+
+    def __getitem__(self, index: int) -> 'SyntaxNode':
+        if not -len(self.__kinds) <= index < len(self.__kinds):
+            raise IndexError('syntax tree node index out of range')
+        return SyntaxNode(self, index % len(self.__kinds))
+
+    @property
+    def root(self) -> Union['SyntaxNode', None]:
+        """Root property
+
+        Returns:
+            root node, None for an empty tree
+        """
+        if not self.__kinds:
+            return None
+        return SyntaxNode(self, len(self.__kinds) - 1)
+
+    def add_token(self, token: TokenType, start: int = -1,
+                  end: int = -1) -> int:
+        """Add token to the token table
+
+        Args:
+            token: token
+            start: buffer position of the token
+            end: buffer position behind the token
+
+        Returns:
+            token index
+        """
+        self.__token_table.append(token)
+        self.__starts.append(start)
+        self.__ends.append(end)
+        return len(self.__token_table) - 1
+
+    def add_node(self, kind: Syntax, token: int = -1,
+                 children: Iterable[int] = ()) -> int:
+        """Add node above its children
+
+        Args:
+            kind: node kind
+            token: token index, -1 for nodes without token
+            children: indices of the child nodes in order, negative indices
+                of missing children are skipped
+
+        Returns:
+            node index
+        """
+        first: int = -1
+        last: int = -1
+        next_siblings: array = self.__next_siblings
+        for child in children:
+            if child < 0:
+                continue
+            if last < 0:
+                first = child
+            else:
+                next_siblings[last] = child
+            last = child
+        self.__kinds.append(kind.value)
+        self.__tokens.append(token)
+        self.__first_children.append(first)
+        next_siblings.append(-1)
+        return len(self.__kinds) - 1
+
+    def columns(self) -> Columns:
+        """Export tree as array columns
+
+        Returns:
+            node columns and token table columns
+        """
+        return (self.__kinds, self.__tokens, self.__first_children,
+                self.__next_siblings,
+                array('i', (token.kind for token in self.__token_table)),
+                self.__starts, self.__ends)
+
+    def graft(self, columns: Columns, tokens: Iterable[TokenType],
+              offset: int = 0) -> List[int]:
+        """Add the subtrees below the root of exported tree columns
+
+        Args:
+            columns: columns of a tree, see ``columns()``
+            tokens: tokens of the token table of the columns
+            offset: buffer position the token positions are relative to
+
+        Returns:
+            indices of the children of the root in order
+        """
+        kinds, node_tokens, first_children, next_siblings, _, starts, \
+            ends = columns
+        if not kinds:
+            return []
+        nodes: int = len(self.__kinds)
+        token_table: int = len(self.__token_table)
+        self.__token_table.extend(tokens)
+        self.__starts.extend(start + offset if start >= 0 else start
+                             for start in starts)
+        self.__ends.extend(end + offset if end >= 0 else end
+                           for end in ends)
+        root: int = len(kinds) - 1
+        self.__kinds.extend(kinds[:root])
+        self.__tokens.extend(token + token_table if token >= 0 else token
+                             for token in node_tokens[:root])
+        self.__first_children.extend(child + nodes if child >= 0 else child
+                                     for child in first_children[:root])
+        self.__next_siblings.extend(
+            sibling + nodes if sibling >= 0 else sibling
+            for sibling in next_siblings[:root])
+        children: List[int] = []
+        child: int = first_children[root]
+        while child >= 0:
+            children.append(child + nodes)
+            child = next_siblings[child]
+        return children
+
+    def kind(self, index: int) -> Syntax:
+        """Get kind of a node
+
+        Args:
+            index: node index
+
+        Returns:
+            node kind
+        """
+        return SYNTAX[self.__kinds[index]]
+
+    def token(self, index: int) -> Union[TokenType, None]:
+        """Get token of a node
+
+        Args:
+            index: node index
+
+        Returns:
+            token, None for nodes without token
+        """
+        token: int = self.__tokens[index]
+        return self.__token_table[token] if token >= 0 else None
+
+    def span(self, index: int) -> Tuple[int, int]:
+        """Get buffer positions of the token of a node
+
+        Args:
+            index: node index
+
+        Returns:
+            start and end position, -1 for nodes without token
+        """
+        token: int = self.__tokens[index]
+        if token < 0:
+            return -1, -1
+        return self.__starts[token], self.__ends[token]
+
+    def first_child(self, index: int) -> int:
+        """Get first child of a node
+
+        Args:
+            index: node index
+
+        Returns:
+            index of the first child, -1 for leaves
+        """
+        return self.__first_children[index]
+
+    def next_sibling(self, index: int) -> int:
+        """Get next sibling of a node
+
+        Args:
+            index: node index
+
+        Returns:
+            index of the next sibling, -1 for the last child
+        """
+        return self.__next_siblings[index]
+
+    def children(self, index: int) -> Iterator[int]:
+        """Iterate over the children of a node
+
+        Args:
+            index: node index
+
+        Returns:
+            iterator of child node indices
+        """
+        child: int = self.__first_children[index]
+        while child >= 0:
+            yield child
+            child = self.__next_siblings[child]
+
+
+class SyntaxNode:
+    """View of one node of a syntax tree"""
+
+    __slots__ = ('__tree', '__index')
+
+    def __init__(self, tree: SyntaxTree, index: int) -> None:
+        """Create view of a node
+
+        Args:
+            tree: syntax tree
+            index: node index
+        """
+        self.__tree: SyntaxTree = tree
+        self.__index: int = index
+
+    @property
+    def index(self) -> int:
+        """Index property
+
+        Returns:
+            node index in the syntax tree
+        """
+        return self.__index
+
+    @property
+    def kind(self) -> Syntax:
+        """Kind property
+
+        Returns:
+            node kind
+        """
+        return self.__tree.kind(self.__index)
+
+    @property
+    def token(self) -> Union[TokenType, None]:
+        """Token property
+
+        Returns:
+            token of the node, None for nodes without token
+        """
+        return self.__tree.token(self.__index)
+
+    @property
+    def span(self) -> Tuple[int, int]:
+        """Span property
+
+        Returns:
+            buffer positions of the token of the node
+        """
+        return self.__tree.span(self.__index)
+
+    @property
+    def children(self) -> List['SyntaxNode']:
+        """Children property
+
+        Returns:
+            child nodes in order
+        """
+        tree: SyntaxTree = self.__tree
+        return [SyntaxNode(tree, child) for child in tree.children(
+            self.__index)]
+
+    def __iter__(self) -> Iterator['SyntaxNode']:
+        tree: SyntaxTree = self.__tree
+        for child in tree.children(self.__index):
+            yield SyntaxNode(tree, child)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SyntaxNode):
+            return NotImplemented
+        return self.__tree is other.__tree and self.__index == other.__index
+
+    def __hash__(self) -> int:
+        return hash((id(self.__tree), self.__index))
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.kind.name}, {self.index})'
+
+    def __str__(self) -> str:
+        """Render the subtree as s-expression
+
+        Returns:
+            node kind and token followed by the rendered children
+        """
+        parts: List[str] = [self.kind.name]
+        if self.token is not None:
+            parts.append(str(self.token))
+        parts.extend(str(child) for child in self)
+        return f'({" ".join(parts)})'
@@ -0,0 +1,274 @@
+"""Persistent token cache
+
+Scanned tokens of program code are written to a binary token file (.vgt)
+named by the hash of the code. Scanning unchanged code again loads the token
+file instead.
+
+A token file starts with a header followed by the columns of the token
+stream and the table of shared tokens:
+
+    header: magic, format version, vocabulary fingerprint, code hash,
+            number of tokens, number of shared tokens, number of unique
+            tokens
+    columns: kinds, lines, starts, ends and value indices of all tokens,
+             token positions of the unique tokens (numbers, literals)
+    shared: word flags, offsets into the lexeme data, utf-8 lexeme data
+
+All numbers are little endian. Loading a token file copies the columns
+straight into the arrays of the token stream. Only the shared tokens and
+the unique tokens are created, no token is added one by one.
+
+The vocabulary fingerprint hashes all tags, keywords and operators, see
+``vocabulary``, so token files are ignored once the vocabulary changes.
+
+"""
+import hashlib
+import os
+import struct
+import sys
+from array import array
+from mmap import ACCESS_READ
+from mmap import mmap
+from os import PathLike
+from pathlib import Path
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from vega.data_structs.token_stream import Span
+from vega.data_structs.token_stream import TokenStream
+from vega.language import vocabulary
+from vega.language.token import SPAN_TOKENS
+from vega.language.token import Tag
+from vega.language.token import TokenType
+from vega.language.token import Word
+from vega.language.vocabulary import FINGERPRINT
+
+MAGIC: bytes = b'VGT\0'
+FORMAT_VERSION: int = 3
+SUFFIX: str = '.vgt'
+
+HEADER: struct.Struct = struct.Struct('<4sI16s32sIII')
+
+# array type codes of the token stream columns and the unique positions
+COLUMNS: Tuple[str, ...] = ('i', 'i', 'q', 'q', 'i', 'i')
+
+# columns are stored little endian, arrays use the native byte order
+SWAP: bool = sys.byteorder == 'big'
+
+
+def _digest(code: str) -> bytes:
+    """Hash program code
+
+    Args:
+        code: program code
+
+    Returns:
+        sha256 digest of the code
+    """
+    return hashlib.sha256(code.encode('utf-8', 'surrogatepass')).digest()
+
+
+def _little_endian(column: array) -> bytes:
+    """Get the little endian bytes of an array
+
+    Args:
+        column: array
+
+    Returns:
+        bytes of the array items
+    """
+    if SWAP:
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _read_columns(buffer: mmap, position: int,
+                  columns: List[Tuple[str, int]]) -> List[array]:
+    """Read arrays stored one after another
+
+    Args:
+        buffer: memory mapped token file
+        position: buffer position of the first array
+        columns: type code and number of items of every array
+
+    Returns:
+        arrays in native byte order
+
+    Raises:
+        ValueError: if the buffer ends before the last array
+    """
+    arrays: List[array] = []
+    for typecode, count in columns:
+        column: array = array(typecode)
+        end: int = position + column.itemsize * count
+        if end > len(buffer):
+            raise ValueError('Token file ends inside a column')
+        column.frombytes(buffer[position:end])
+        if SWAP:
+            column.byteswap()
+        arrays.append(column)
+        position = end
+    return arrays
+
+
+class TokenCache:
+    """Directory of token files"""
+
+    def __init__(self, directory: Union[str, PathLike]) -> None:
+        """Create token cache
+
+        Args:
+            directory: directory of the token files, created on first store
+        """
+        self.__directory: Path = Path(directory)
+
+    @property
+    def directory(self) -> Path:
+        """Directory property
+
+        Returns:
+            directory of the token files
+        """
+        return self.__directory
+
+    def path(self, code: str) -> Path:
+        """Get path of the token file of program code
+
+        Args:
+            code: program code
+
+        Returns:
+            path of the token file
+        """
+        return self.__directory / f'{_digest(code).hex()}{SUFFIX}'
+
+    def load(self, code: str, line: int = 1) -> Union[TokenStream, None]:
+        """Load tokens of program code
+
+        Args:
+            code: program code
+            line: line number the code starts at
+
+        Returns:
+            token stream of all tokens, None if there is no valid token file
+            for the code
+        """
+        try:
+            with open(self.path(code), 'rb') as token_file:
+                buffer: mmap = mmap(token_file.fileno(), 0,
+                                    access=ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            return _load(code, buffer, line - 1)
+        except (ValueError, IndexError, KeyError):
+            return None
+        finally:
+            buffer.close()
+
+    def store(self, code: str, spans: Iterable[Span], line: int = 1) -> None:
+        """Write token file of program code
+
+        The file is written under a temporary name and moved in place, so
+        concurrent builds never see a partial token file.
+
+        Args:
+            code: program code
+            spans: scanned tokens with line number and buffer positions
+            line: line number the code starts at
+        """
+        columns: List[array] = [array(typecode) for typecode in COLUMNS]
+        kinds, lines, starts, ends, values, positions = columns
+        shared: Dict[Union[int, str, Tag], int] = {}
+        flags: array = array('B')
+        lexemes: List[bytes] = []
+        span_tokens = SPAN_TOKENS
+        for position, (token, token_line, start, end) in enumerate(spans):
+            kind: int = token.kind
+            kinds.append(kind)
+            lines.append(token_line - line + 1)
+            starts.append(start)
+            ends.append(end)
+            if kind in span_tokens:
+                values.append(len(positions))
+                positions.append(position)
+                continue
+            word: bool = isinstance(token, Word)
+            key: Union[int, str, Tag] = token.id if word else token.tag
+            value: Union[int, None] = shared.get(key)
+            if value is None:
+                value = shared[key] = -1 - len(shared)
+                flags.append(word)
+                lexemes.append((token.lexeme if word else token.tag)
+                               .encode('utf-8', 'surrogatepass'))
+            values.append(value)
+        offsets: array = array('I', [0])
+        for lexeme in lexemes:
+            offsets.append(offsets[-1] + len(lexeme))
+
+        self.__directory.mkdir(parents=True, exist_ok=True)
+        path: Path = self.path(code)
+        temporary: Path = path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(temporary, 'wb') as token_file:
+            token_file.write(HEADER.pack(MAGIC, FORMAT_VERSION, FINGERPRINT,
+                                         _digest(code), len(kinds),
+                                         len(shared), len(positions)))
+            for column in columns + [flags, offsets]:
+                token_file.write(_little_endian(column))
+            token_file.write(b''.join(lexemes))
+        os.replace(temporary, path)
+
+
+def _load(code: str, buffer: mmap, line_offset: int
+          ) -> Union[TokenStream, None]:
+    """Create token stream of a token file
+
+    Args:
+        code: program code
+        buffer: memory mapped token file
+        line_offset: offset added to the line numbers of the file
+
+    Returns:
+        token stream, None if the token file belongs to other code or
+        another vocabulary
+
+    Raises:
+        ValueError: if the token file is broken
+    """
+    if len(buffer) < HEADER.size:
+        return None
+    magic, version, fingerprint, digest, tokens, shared, unique = \
+        HEADER.unpack_from(buffer)
+    if magic != MAGIC or version != FORMAT_VERSION \
+            or fingerprint != FINGERPRINT or digest != _digest(code):
+        return None
+    counts: List[int] = [tokens] * (len(COLUMNS) - 1) + [unique]
+    columns: List[array] = _read_columns(
+        buffer, HEADER.size,
+        list(zip(COLUMNS + ('B', 'I'), counts + [shared, shared + 1])))
+    kinds, lines, starts, ends, values, positions, flags, offsets = columns
+    data_start: int = HEADER.size + sum(
+        column.itemsize * len(column) for column in columns)
+    data: bytes = buffer[data_start:data_start + offsets[-1]]
+    if len(data) < offsets[-1]:
+        raise ValueError('Token file ends inside the lexemes')
+
+    word = vocabulary.word
+    char_token = vocabulary.token
+    shared_tokens: List[TokenType] = [
+        (word if flag else char_token)(
+            data[first:stop].decode('utf-8', 'surrogatepass'))
+        for flag, first, stop in zip(flags, offsets, offsets[1:])]
+    span_tokens = SPAN_TOKENS
+    unique_tokens: List[TokenType] = [
+        span_tokens[kinds[position]](None, code, starts[position],
+                                     ends[position])
+        for position in positions]
+    if line_offset:
+        lines = array('i', [token_line + line_offset for token_line in lines])
+    return TokenStream.from_columns(kinds, lines, starts, ends, values,
+                                    shared_tokens, unique_tokens)
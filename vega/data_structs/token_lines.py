@@ -0,0 +1,235 @@
+"""Tokens grouped by line for incremental scanning
+
+Editors change program code in small steps. To avoid scanning the whole code
+after each change, scanned tokens are kept per line together with the text of
+the line. A token belongs to the line the lexer reported for it, line numbers
+are therefore given by the position of a line and never have to be shifted
+when lines are inserted or removed in front of it.
+
+Literals are the only tokens spanning multiple lines. Lines starting inside a
+literal are marked as continued, they are no safe point to restart scanning.
+
+"""
+import re
+from bisect import bisect_left
+from bisect import bisect_right
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Pattern
+from typing import Tuple
+
+from vega.data_structs.token_stream import Span
+from vega.data_structs.token_stream import TokenStream
+from vega.language.token import Literal
+from vega.language.token import TokenType
+
+LINE_BREAK: Pattern = re.compile(r'([\r\n])')
+
+
+@dataclass
+class TextEdit:
+    """Text edit
+
+    Replace the text between start and end position with new text. Lines are
+    counted from 1 like token lines, columns from 0. The end position is
+    exclusive.
+
+    Properties:
+        start_line: int - line of first replaced char
+        start_column: int - column of first replaced char
+        end_line: int - line of the end position
+        end_column: int - column of the end position
+        text: str - replacement text
+    """
+    start_line: int
+    start_column: int
+    end_line: int
+    end_column: int
+    text: str
+
+
+def split_lines(code: str) -> List[str]:
+    """Split code into lines keeping the line breaks
+
+    Every '\\r' or '\\n' ends a line like it does for the lexer.
+
+    Args:
+        code: program code
+
+    Returns:
+        lines of code, the last one without line break
+    """
+    parts: List[str] = LINE_BREAK.split(code)
+    lines: List[str] = [parts[index] + parts[index + 1]
+                        for index in range(0, len(parts) - 1, 2)]
+    lines.append(parts[-1])
+    return lines
+
+
+class TokenLines:
+    """Tokens of program code grouped by line
+
+    Every line stores its text including the line break, its tokens with
+    their column and whether the line starts inside a literal.
+
+    """
+
+    def __init__(self) -> None:
+        """Create token lines of empty code"""
+        self.__lines: List[str] = ['']
+        self.__tokens: List[List[Tuple[TokenType, int]]] = [[]]
+        self.__continued: List[bool] = [False]
+
+    def __len__(self) -> int:
+        return len(self.__lines)
+
+    @property
+    def text(self) -> str:
+        """Text property
+
+        Returns:
+            complete program code
+        """
+        return ''.join(self.__lines)
+
+    def text_of(self, first: int, stop: int) -> str:
+        """Get text of a range of lines
+
+        Args:
+            first: index of first line
+            stop: index behind last line
+
+        Returns:
+            text of the lines
+        """
+        return ''.join(self.__lines[first:stop])
+
+    def line(self, number: int) -> List[Tuple[TokenType, int]]:
+        """Get tokens of a line
+
+        Args:
+            number: line number
+
+        Returns:
+            tokens and their column
+        """
+        return self.__tokens[number - 1]
+
+    def tokens(self) -> Iterator[Tuple[TokenType, int]]:
+        """Iterate over all tokens
+
+        Returns:
+            iterator of tokens and their line numbers
+        """
+        for index, tokens in enumerate(self.__tokens):
+            for token, _ in tokens:
+                yield token, index + 1
+
+    def spans(self) -> Iterator[Span]:
+        """Iterate over all tokens with their buffer positions
+
+        Only the start of a token is kept per line, the end is reported as
+        the start.
+
+        Returns:
+            iterator of tokens with line number, start and end position in
+            the code buffer
+        """
+        offset: int = 0
+        for index, tokens in enumerate(self.__tokens):
+            for token, column in tokens:
+                yield token, index + 1, offset + column, offset + column
+            offset += len(self.__lines[index])
+
+    def token_stream(self) -> TokenStream:
+        """Collect all tokens in a token stream
+
+        Returns:
+            token stream for parsing
+        """
+        return TokenStream(self.spans())
+
+    def window(self, edit: TextEdit) -> Tuple[int, int, str]:
+        """Get range of lines to scan again for a text edit
+
+        The range starts at the last line in front of the edit not starting
+        inside a literal and ends behind the edit at a line break not followed
+        by a literal continuation.
+
+        Args:
+            edit: text edit
+
+        Returns:
+            index of first line, index behind last line and the edited text
+            of these lines
+        """
+        first: int = edit.start_line - 1
+        last: int = edit.end_line - 1
+        if not 0 <= first <= last < len(self) or \
+                not 0 <= edit.start_column <= len(self.__lines[first]) or \
+                not 0 <= edit.end_column <= len(self.__lines[last]) or \
+                (first == last and edit.start_column > edit.end_column):
+            raise IndexError(f'Edit {edit} out of range')
+
+        restart: int = first
+        while self.__continued[restart]:
+            restart -= 1
+        code: str = (self.text_of(restart, first)
+                     + self.__lines[first][:edit.start_column]
+                     + edit.text
+                     + self.__lines[last][edit.end_column:])
+        stop: int = last + 1
+        if stop < len(self) and not code.endswith(('\n', '\r')):
+            # the line break of the last line has been removed
+            code += self.__lines[stop]
+            stop += 1
+        boundary: int = self.boundary(stop)
+        return restart, boundary, code + self.text_of(stop, boundary)
+
+    def boundary(self, index: int) -> int:
+        """Find the next line starting outside of a literal
+
+        Args:
+            index: index of the line to start searching at
+
+        Returns:
+            index of first line at or behind ``index`` not continuing a
+            literal, number of lines if there is none
+        """
+        while index < len(self) and self.__continued[index]:
+            index += 1
+        return index
+
+    def splice(self, first: int, stop: int, code: str,
+               spans: Iterable[Span]) -> None:
+        """Replace a range of lines with newly scanned lines
+
+        Args:
+            first: index of first replaced line
+            stop: index behind last replaced line
+            code: text of the new lines
+            spans: tokens of the new lines with line numbers counted from
+                the first line and buffer positions in ``code``
+        """
+        lines: List[str] = split_lines(code)
+        if stop < len(self):
+            # the window ends with a line break in front of the next line
+            lines.pop()
+        starts: List[int] = [0] + list(accumulate(len(line)
+                                                  for line in lines[:-1]))
+        tokens: List[List[Tuple[TokenType, int]]] = [[] for _ in lines]
+        continued: List[bool] = [False] * len(lines)
+        for token, line, start, end in spans:
+            index: int = line - 1 - first
+            tokens[index].append((token, start - starts[index]))
+            if isinstance(token, Literal):
+                for inner in range(bisect_right(starts, start),
+                                   bisect_left(starts, end + 1)):
+                    continued[inner] = True
+
+        self.__lines[first:stop] = lines
+        self.__tokens[first:stop] = tokens
+        self.__continued[first:stop] = continued
@@ -3,40 +3,206 @@
 Tokens are placed on a queue and enriched with new data like the line number
 the token has occured in the program code for better error messages.
 
-"""
+The queue is stored as struct of arrays: one ``array`` column each for the
+token kind, the line number, the start and end position of the token in the
+code buffer and an index into a value table. Tokens shared by
+many occurrences (one char tokens, keywords, identifiers) are stored once in
+the shared value table, keyed by the interned id of a word or the tag of a
+one char token. Tokens carrying their own value (numbers, literals) are
+stored in order of occurrence in the unique value table.
+
+Positions in the stream can be marked. Removing tokens only moves a cursor,
+so returning to a mark just moves the cursor back. Removed tokens are freed
+once no mark refers to them anymore.
+
+A token stream can also be fed lazily from a token iterator like
+``Lexer.spans()``. Tokens are then pulled from the iterator only when they
+are looked at, so the queue never holds more than the lookahead. Looking
+ahead behind the last token returns the ``EOF`` sentinel.
 
-from dataclasses import dataclass
+"""
+from array import array
+from itertools import islice
+from typing import Dict
+from typing import Iterator
+from typing import List
 from typing import Tuple
+from typing import Union
 
+from vega.language.token import Literal
+from vega.language.token import Num
+from vega.language.token import Real
+from vega.language.token import Tag
 from vega.language.token import TokenType
-from vega.utils.data_types.lists import Queue
-
+from vega.language.token import Word
+from vega.language.vocabulary import EOF
 
-@dataclass
-class Bucket:
-    """Bucket to Token Stream
+UNIQUE_TOKENS = (Num, Real, Literal)
 
-    Put Token and line of occurence in code into Token Stream
-    """
-    token: TokenType
-    line: int
+# token, line number, start and end position in the code
+Span = Tuple[TokenType, int, int, int]
 
 
-class TokenStream(Queue):
+class TokenStream:
     """Stream of Tokens
 
     Store Tokens in order of occurrence
     """
 
+    def __init__(self, tokens: Union[Iterator[Span], None] = None) -> None:
+        """Create token stream
+
+        Args:
+            tokens: optional iterator of tokens with line numbers and buffer
+                positions to pull tokens from on demand
+        """
+        self.__tokens: Union[Iterator[Span], None] = tokens
+        self.__kinds: array = array('i')
+        self.__lines: array = array('i')
+        self.__starts: array = array('q')
+        self.__ends: array = array('q')
+        self.__values: array = array('i')
+        self.__shared: List[TokenType] = []
+        self.__shared_index: Dict[Union[int, str, Tag], int] = {}
+        self.__unique: List[TokenType] = []
+        self.__unique_offset: int = 0
+        self.__position: int = 0
+        self.__offset: int = 0
+        self.__marks: List[int] = []
+
+    # pylint: disable=too-many-arguments
+    @classmethod
+    def from_columns(cls, kinds: array, lines: array, starts: array,
+                     ends: array, values: array, shared: List[TokenType],
+                     unique: List[TokenType]) -> 'TokenStream':
+        """Create token stream of filled columns
+
+        The columns are taken over as they are, no token is added one by
+        one.
+
+        Args:
+            kinds: token kinds ('i')
+            lines: line numbers ('i')
+            starts: buffer positions of the tokens ('q')
+            ends: buffer positions behind the tokens ('q')
+            values: shared (< 0) or unique (>= 0) value table indices ('i')
+            shared: shared value table
+            unique: unique value table
+
+        Returns:
+            token stream of all tokens of the columns
+        """
+        token_stream: TokenStream = cls()
+        token_stream.__kinds = kinds
+        token_stream.__lines = lines
+        token_stream.__starts = starts
+        token_stream.__ends = ends
+        token_stream.__values = values
+        token_stream.__shared = shared
+        token_stream.__shared_index = {
+            token.id if isinstance(token, Word) else token.tag: -1 - index
+            for index, token in enumerate(shared)}
+        token_stream.__unique = unique
+        return token_stream
+
+    def __len__(self) -> int:
+        return len(self.__kinds) - self.__position
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({len(self)!r})'
+
+    def __str__(self) -> str:
+        return f'{len(self)}'
+
+    def __pull(self, ahead: int = 0) -> None:
+        """Pull tokens from token iterator into the queue
+
+        Only pulls if the queue holds less than ``ahead + 1`` tokens. The
+        iterator is dropped once it is exhausted.
+
+        Args:
+            ahead: number of tokens behind the next token to make available
+        """
+        if self.__tokens is None:
+            return
+        missing: int = self.__position + ahead + 1 - len(self.__kinds)
+        if missing <= 0:
+            return
+        for token, line, start, end in self.__tokens:
+            self.add(token, line=line, start=start, end=end)
+            missing -= 1
+            if not missing:
+                return
+        self.__tokens = None
+
+    def __compact(self) -> None:
+        """Free the removed part of the columns
+
+        Tokens are freed up to the last removed token or the oldest mark,
+        whichever comes first. Only compacts once more than half of the
+        columns can be freed, so removing tokens stays amortized constant.
+        """
+        # the last removed token is kept for restore()
+        cut: int = self.__position - 1
+        if self.__marks:
+            cut = min(cut, min(self.__marks) - self.__offset)
+        if cut <= len(self.__kinds) // 2:
+            return
+        kept: int = next((value for value in islice(self.__values, cut, None)
+                          if value >= 0),
+                         self.__unique_offset + len(self.__unique))
+        del self.__kinds[:cut]
+        del self.__lines[:cut]
+        del self.__starts[:cut]
+        del self.__ends[:cut]
+        del self.__values[:cut]
+        del self.__unique[:kept - self.__unique_offset]
+        self.__unique_offset = kept
+        self.__offset += cut
+        self.__position -= cut
+
+    def __token(self, value: int) -> TokenType:
+        """Get token of a value column entry
+
+        Args:
+            value: index into unique (>= 0) or shared (< 0) value table
+
+        Returns:
+            token
+        """
+        if value < 0:
+            return self.__shared[-value - 1]
+        return self.__unique[value - self.__unique_offset]
+
+    # pylint: disable=unused-argument
     def add(self, data: TokenType, *args, **kwargs) -> None:
         """Add Token to stream
 
         Args:
             data: Token to store
             line: line number in code
+            start: optional buffer position of the token
+            end: optional buffer position behind the token
         """
         line: int = kwargs.pop('line')
-        super().add(Bucket(data, line), **kwargs)
+        start: int = kwargs.pop('start', -1)
+        end: int = kwargs.pop('end', -1)
+        if isinstance(data, UNIQUE_TOKENS):
+            value: int = self.__unique_offset + len(self.__unique)
+            self.__unique.append(data)
+        else:
+            key: Union[int, str, Tag] = data.id if isinstance(data, Word) \
+                else data.tag
+            value = self.__shared_index.get(key, 0)
+            if not value:
+                self.__shared.append(data)
+                value = -len(self.__shared)
+                self.__shared_index[key] = value
+        self.__kinds.append(data.kind)
+        self.__lines.append(line)
+        self.__starts.append(start)
+        self.__ends.append(end)
+        self.__values.append(value)
 
     def remove(self) -> Tuple[TokenType, int]:
         """Remove object from stream
@@ -44,7 +210,132 @@ class TokenStream(Queue):
         Returns:
             Tuple of Token and line number
         """
-        bucket: Bucket = super().remove()
-        token: TokenType = bucket.token
-        line: int = bucket.line
+        token, line, _, _ = self.remove_span()
         return token, line
+
+    def remove_span(self) -> Span:
+        """Remove object from stream with its buffer positions
+
+        Returns:
+            Tuple of Token, line number, start and end position in the code
+            buffer (-1 if unknown)
+        """
+        self.__pull()
+        position: int = self.__position
+        if position >= len(self.__kinds):
+            raise IndexError('Remove from empty token stream')
+        span: Span = (self.__token(self.__values[position]),
+                      self.__lines[position], self.__starts[position],
+                      self.__ends[position])
+        self.__position = position + 1
+        if self.__position > len(self.__kinds) // 2:
+            self.__compact()
+        return span
+
+    def restore(self) -> None:
+        """Put the last removed token back on the stream
+
+        Raises:
+            IndexError: if no removed token is left to restore
+        """
+        if not self.__position:
+            raise IndexError('No removed token to restore')
+        self.__position -= 1
+
+    def close(self) -> None:
+        """End the stream at the current position
+
+        Tokens not removed yet are dropped and no more tokens are pulled from
+        the token iterator, so looking ahead returns the ``EOF`` sentinel.
+        Removed tokens are kept for ``restore()``.
+        """
+        self.__tokens = None
+        position: int = self.__position
+        dropped: int = next((value for value in islice(self.__values,
+                                                       position, None)
+                             if value >= 0),
+                            self.__unique_offset + len(self.__unique))
+        del self.__kinds[position:]
+        del self.__lines[position:]
+        del self.__starts[position:]
+        del self.__ends[position:]
+        del self.__values[position:]
+        del self.__unique[dropped - self.__unique_offset:]
+
+    def mark(self) -> int:
+        """Mark the current position to return to it later
+
+        Removed tokens are kept as long as a mark refers to them.
+
+        Returns:
+            mark of the next token
+        """
+        mark: int = self.__offset + self.__position
+        self.__marks.append(mark)
+        return mark
+
+    def reset(self, mark: int) -> None:
+        """Return to a marked position
+
+        Tokens removed since the mark are put back on the stream. The mark
+        stays valid until it is released.
+
+        Args:
+            mark: mark returned by ``mark()``
+        """
+        if mark not in self.__marks:
+            raise ValueError(f'Reset to unknown mark {mark}')
+        self.__position = mark - self.__offset
+
+    def release(self, mark: int) -> None:
+        """Release a mark
+
+        Tokens in front of the oldest remaining mark can be freed again.
+
+        Args:
+            mark: mark returned by ``mark()``
+        """
+        if mark not in self.__marks:
+            raise ValueError(f'Release of unknown mark {mark}')
+        self.__marks.remove(mark)
+        self.__compact()
+
+    def peek(self, ahead: int = 0) -> TokenType:
+        """Look at an upcoming token without removing it
+
+        Args:
+            ahead: number of tokens to skip, 0 for the next token
+
+        Returns:
+            upcoming token, ``EOF`` if the stream ends before it
+        """
+        self.__pull(ahead)
+        position: int = self.__position + ahead
+        if position >= len(self.__kinds):
+            return EOF
+        return self.__token(self.__values[position])
+
+    def peek_kind(self, ahead: int = 0) -> int:
+        """Look at kind of an upcoming token without removing it
+
+        Args:
+            ahead: number of tokens to skip, 0 for the next token
+
+        Returns:
+            kind of upcoming token, kind of ``EOF`` if the stream ends
+            before it
+        """
+        self.__pull(ahead)
+        position: int = self.__position + ahead
+        if position >= len(self.__kinds):
+            return Tag.EOF.value
+        return self.__kinds[position]
+
+    def is_empty(self) -> bool:
+        """Check if stream is empty
+
+        Returns:
+            True when no token is left, False otherwise
+        """
+        self.__pull()
+        return self.__position >= len(self.__kinds)
@@ -0,0 +1,74 @@
+"""Vega compiler diagnostics
+
+Collect the errors found in one compiler run instead of stopping at the
+first one. The collector is full once a limit of errors is reached, the
+compiler stops looking for more errors then.
+
+"""
+from typing import Iterator
+from typing import List
+
+from vega.front_end.exception import BaseError
+
+# errors collected by default before the compiler stops
+DEFAULT_LIMIT: int = 100
+
+
+class Diagnostics:
+    """Collector of compiler errors"""
+
+    def __init__(self, limit: int = DEFAULT_LIMIT) -> None:
+        """Create empty collector
+
+        Args:
+            limit: number of errors after which the compiler stops
+
+        Raises:
+            ValueError: if the limit is not positive
+        """
+        if limit < 1:
+            raise ValueError('Diagnostics limit must be positive')
+        self.__limit: int = limit
+        self.__errors: List[BaseError] = []
+
+    def __len__(self) -> int:
+        return len(self.__errors)
+
+    def __iter__(self) -> Iterator[BaseError]:
+        return iter(self.__errors)
+
+    @property
+    def limit(self) -> int:
+        """Limit property
+
+        Returns:
+            number of errors after which the compiler stops
+        """
+        return self.__limit
+
+    @property
+    def full(self) -> bool:
+        """Full property
+
+        Returns:
+            True if the limit of errors is reached
+        """
+        return len(self.__errors) >= self.__limit
+
+    @property
+    def report(self) -> str:
+        """Report property
+
+        Returns:
+            reports of all errors in the order they were found
+        """
+        return '\n'.join(error.report for error in self.__errors)
+
+    def add(self, error: BaseError) -> None:
+        """Add error, errors beyond the limit are dropped
+
+        Args:
+            error: error found by the compiler
+        """
+        if len(self.__errors) < self.__limit:
+            self.__errors.append(error)
@@ -1,4 +1,31 @@
-"""Vega compiler exceptions"""
+"""Vega compiler exceptions
+
+Errors can be located in the code buffer, the report then shows the
+offending line with carets below the erroneous token.
+
+"""
+from copy import copy
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Tuple
+
+from vega.data_structs.line_index import LineIndex
+
+
+def _restore(cls: type, state: Dict[str, Any]) -> 'BaseError':
+    """Restore pickled error without calling its init method
+
+    Args:
+        cls: error class
+        state: attributes of the error
+
+    Returns:
+        error
+    """
+    error: BaseError = cls.__new__(cls)
+    error.__dict__.update(state)
+    return error
 
 
 class BaseError(Exception):
@@ -7,8 +34,61 @@ class BaseError(Exception):
     def __init__(self, line, message) -> None:
         self.line: int = line
         self.message: str = message
+        self.start: int = -1
+        self.end: int = -1
+        self.snippet: str = ''
         super().__init__()
 
+    def locate(self, line_index: LineIndex, start: int, end: int) -> None:
+        """Locate error in the code buffer
+
+        Args:
+            line_index: line index of the code
+            start: buffer position of the erroneous token
+            end: buffer position behind the erroneous token
+        """
+        self.start = start
+        self.end = end
+        self.snippet = line_index.render(start, end)
+
+    def relocated(self, line_index: LineIndex, offset: int) -> 'BaseError':
+        """Copy error found in a part of the code into the whole code
+
+        Args:
+            line_index: line index of the whole code
+            offset: buffer position the part of the code starts at
+
+        Returns:
+            copy of the error, located in the whole code if it is located
+        """
+        error: BaseError = copy(self)
+        if self.start >= 0:
+            error.locate(line_index, self.start + offset, self.end + offset)
+        return error
+
+    def __reduce__(self) -> Tuple[Callable, Tuple[type, Dict[str, Any]]]:
+        """Pickle error by its attributes
+
+        Errors take other arguments than they store, so they are restored
+        without calling their init method. This way errors can be sent
+        between processes.
+
+        Returns:
+            restore function and its arguments
+        """
+        return _restore, (type(self), self.__dict__)
+
+    @property
+    def report(self) -> str:
+        """Report property
+
+        Returns:
+            error message followed by the source snippet if located
+        """
+        if not self.snippet:
+            return self.message
+        return f'{self.message}\n{self.snippet}'
+
 
 class VegaSyntaxError(BaseError):
     """Syntax Error"""
@@ -0,0 +1,623 @@
+"""LL(1) parse tables of the vega grammar
+
+The parser rules of ``resources/grammar/Vega.g4`` are read into a plain
+context free grammar: groups and the ``?``, ``*`` and ``+`` operators become
+helper rules named after their rule, e.g. ``unary:2``. Grammar tokens are
+mapped to token kinds, some tokens stand for alternatives (``BOOL`` is
+``true`` or ``false``) or for a sequence of kinds (``LITERAL`` is scanned as
+quote, literal and quote). Alternatives starting with the same symbols are
+left factored.
+
+From the FIRST and FOLLOW sets the LL(1) table selects the production of a
+rule by the kind of the next token. Cells claimed by more than one
+production are LL(1) conflicts. They are reported and resolved greedily:
+a production consuming tokens wins over an empty one, like a loop which
+takes another round, otherwise the first production in grammar order.
+
+Generated tables are cached as JSON files named by the hash of the grammar
+and the vocabulary, so the grammar is only read again once it changes.
+
+"""
+import hashlib
+import json
+import os
+import re
+from dataclasses import asdict
+from dataclasses import dataclass
+from os import PathLike
+from pathlib import Path
+from typing import Dict
+from typing import FrozenSet
+from typing import List
+from typing import Pattern
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+from vega.language import kinds
+from vega.language.token import KINDS
+from vega.language.token import Tag
+from vega.language.vocabulary import FINGERPRINT
+
+GRAMMAR: Path = Path(__file__).resolve().parents[2] / 'resources' \
+    / 'grammar' / 'Vega.g4'
+FORMAT_VERSION: int = 1
+SUFFIX: str = '.json'
+
+GRAMMAR_TOKEN: Pattern = re.compile(
+    r"//[^\n]*|/\*.*?\*/|'(?:\\.|[^'\\])*'|\[(?:\\.|[^\]\\])*\]"
+    r"|[A-Za-z_][A-Za-z0-9_]*|->|\.\.|\S", re.DOTALL)
+OPERATORS: str = '?*+'
+
+# grammar tokens standing for alternatives or sequences of token kinds, all
+# other tokens are named like their kind
+TOKENS: Dict[str, Tuple[Tuple[int, ...], ...]] = {
+    'EQUAL': ((kinds.EQ,),),
+    'NOTEQUAL': ((kinds.NE,),),
+    'LESSEQ': ((kinds.LE,),),
+    'GREATEREQ': ((kinds.GE,),),
+    'INT_TYPE': ((kinds.BASIC,),),
+    'FLOAT_TYPE': ((kinds.BASIC,),),
+    'CHAR_TYPE': ((kinds.BASIC,),),
+    'BOOL_TYPE': ((kinds.BASIC,),),
+    'STRING_TYPE': ((kinds.TYPE,),),
+    'NOT': ((kinds.NOT,),),
+    'AND': ((kinds.AND,), (kinds.BOOL_AND,)),
+    'OR': ((kinds.OR,), (kinds.BOOL_OR,)),
+    'BOOL': ((kinds.TRUE,), (kinds.FALSE,)),
+    'INT': ((kinds.NUM,),),
+    'FLOAT': ((kinds.REAL,),),
+    'LITERAL': ((kinds.DQUOTE, kinds.LITERAL, kinds.DQUOTE),),
+    'CHAR': ((kinds.SQUOTE, kinds.LITERAL, kinds.SQUOTE),),
+}
+
+# grammar symbol: token kind or rule name, with the name of the grammar
+# token a kind stems from ('' for rules)
+Item = Tuple[Union[int, str], str]
+
+
+@dataclass
+class Production:
+    """Production of a rule
+
+    Properties:
+        rule: str - name of the rule
+        symbols: Tuple - token kinds and rule names
+        marks: Tuple - grammar token name of every token kind, '' for rules
+
+    """
+    __slots__ = ('rule', 'symbols', 'marks')
+
+    rule: str
+    symbols: Tuple[Union[int, str], ...]
+    marks: Tuple[str, ...]
+
+    def __str__(self) -> str:
+        return ' '.join(
+            symbol if isinstance(symbol, str)
+            else mark if TOKENS.get(mark, ((symbol,),)) == ((symbol,),)
+            else kind_name(symbol)
+            for symbol, mark in zip(self.symbols, self.marks)) or '<empty>'
+
+
+@dataclass
+class Conflict:
+    """LL(1) conflict
+
+    Properties:
+        rule: str - name of the rule
+        token: str - token kind claimed by several productions
+        productions: List - productions claiming the token, the chosen one
+            first
+
+    """
+    __slots__ = ('rule', 'token', 'productions')
+
+    rule: str
+    token: str
+    productions: List[str]
+
+    def __str__(self) -> str:
+        return f'LL(1) conflict in {self.rule} on {self.token}: ' \
+               f'{" | ".join(self.productions)}'
+
+
+@dataclass
+class Tables:
+    """LL(1) parse tables
+
+    Rule symbols are numbered from ``KINDS`` on, so they never clash with
+    token kinds. Rule 0 is the start rule.
+
+    Properties:
+        rules: List - rule names
+        productions: List - rule, symbols and marks of every production
+        table: List - production of rule and next token kind at
+            ``rule * KINDS + kind``, -1 for a syntax error
+        conflicts: List - conflicts of the grammar
+
+    """
+    __slots__ = ('rules', 'productions', 'table', 'conflicts')
+
+    rules: List[str]
+    productions: List[Tuple[int, List[int], List[str]]]
+    table: List[int]
+    conflicts: List[Conflict]
+
+    def to_json(self) -> Dict:
+        """Convert tables to JSON data
+
+        Only the filled cells of the table are kept.
+
+        Returns:
+            JSON data
+        """
+        return {
+            'rules': self.rules,
+            'productions': self.productions,
+            'cells': [(index, production)
+                      for index, production in enumerate(self.table)
+                      if production >= 0],
+            'conflicts': [asdict(conflict) for conflict in self.conflicts],
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict) -> 'Tables':
+        """Create tables from JSON data
+
+        Args:
+            data: JSON data of ``to_json``
+
+        Returns:
+            tables
+        """
+        table: List[int] = [-1] * (len(data['rules']) * KINDS)
+        for index, production in data['cells']:
+            table[index] = production
+        return cls(data['rules'],
+                   [(rule, symbols, marks)
+                    for rule, symbols, marks in data['productions']],
+                   table,
+                   [Conflict(**conflict) for conflict in data['conflicts']])
+
+
+def kind_name(kind: int) -> str:
+    """Name token kind
+
+    Args:
+        kind: token kind
+
+    Returns:
+        one char token or tag name
+    """
+    return repr(chr(kind)) if kind < 256 else Tag(kind).name
+
+
+def _token(name: str) -> Tuple[Tuple[int, ...], ...]:
+    """Map grammar token to token kinds
+
+    Args:
+        name: grammar token name
+
+    Returns:
+        alternatives of token kind sequences
+
+    Raises:
+        ValueError: if there is no token kind for the grammar token
+    """
+    mapped: Union[Tuple[Tuple[int, ...], ...], None] = TOKENS.get(name)
+    if mapped is not None:
+        return mapped
+    kind: Union[int, None] = getattr(kinds, name, None)
+    if not isinstance(kind, int):
+        raise ValueError(f'No token kind for grammar token {name}')
+    return ((kind,),)
+
+
+class Grammar:
+    """Context free grammar of parser rules"""
+
+    def __init__(self, productions: List[Production]) -> None:
+        """Create grammar and compute its FIRST and FOLLOW sets
+
+        Args:
+            productions: productions in grammar order, the rule of the first
+                one is the start rule
+        """
+        self.__productions: List[Production] = productions
+        self.__rules: Dict[str, List[Production]] = {}
+        for production in productions:
+            self.__rules.setdefault(production.rule, []).append(production)
+        for production in productions:
+            for symbol in production.symbols:
+                if isinstance(symbol, str) and symbol not in self.__rules:
+                    raise ValueError(f'Rule {symbol} of {production.rule} '
+                                     f'is not defined')
+        self.__nullable: Set[str] = set()
+        self.__first: Dict[str, Set[int]] = {rule: set()
+                                             for rule in self.__rules}
+        self.__follow: Dict[str, Set[int]] = {rule: set()
+                                              for rule in self.__rules}
+        self.__compute_first()
+        self.__compute_follow()
+
+    @property
+    def start(self) -> str:
+        """Start property
+
+        Returns:
+            name of the start rule
+        """
+        return self.__productions[0].rule
+
+    @property
+    def rules(self) -> List[str]:
+        """Rules property
+
+        Returns:
+            rule names, the start rule first
+        """
+        return list(self.__rules)
+
+    @property
+    def productions(self) -> List[Production]:
+        """Productions property
+
+        Returns:
+            productions in grammar order
+        """
+        return self.__productions
+
+    def nullable(self, symbols: Tuple[Union[int, str], ...]) -> bool:
+        """Check if symbols can derive the empty sequence
+
+        Args:
+            symbols: token kinds and rule names
+
+        Returns:
+            True if no token needs to be consumed
+        """
+        return all(symbol in self.__nullable for symbol in symbols)
+
+    def first(self, symbols: Union[str, Tuple[Union[int, str], ...]]
+              ) -> FrozenSet[int]:
+        """FIRST set
+
+        Args:
+            symbols: rule name or sequence of token kinds and rule names
+
+        Returns:
+            token kinds the symbols can start with
+        """
+        if isinstance(symbols, str):
+            return frozenset(self.__first[symbols])
+        first: Set[int] = set()
+        for symbol in symbols:
+            if isinstance(symbol, int):
+                first.add(symbol)
+                break
+            first |= self.__first[symbol]
+            if symbol not in self.__nullable:
+                break
+        return frozenset(first)
+
+    def follow(self, rule: str) -> FrozenSet[int]:
+        """FOLLOW set
+
+        Args:
+            rule: rule name
+
+        Returns:
+            token kinds which can follow the rule
+        """
+        return frozenset(self.__follow[rule])
+
+    def __compute_first(self) -> None:
+        """Compute nullable rules and FIRST sets up to a fixed point"""
+        changed: bool = True
+        while changed:
+            changed = False
+            for production in self.__productions:
+                first: Set[int] = self.__first[production.rule]
+                size: int = len(first)
+                first |= self.first(production.symbols)
+                if len(first) != size:
+                    changed = True
+                if production.rule not in self.__nullable \
+                        and self.nullable(production.symbols):
+                    self.__nullable.add(production.rule)
+                    changed = True
+
+    def __compute_follow(self) -> None:
+        """Compute FOLLOW sets up to a fixed point"""
+        changed: bool = True
+        while changed:
+            changed = False
+            for production in self.__productions:
+                symbols: Tuple[Union[int, str], ...] = production.symbols
+                for index, symbol in enumerate(symbols):
+                    if isinstance(symbol, int):
+                        continue
+                    follow: Set[int] = self.__follow[symbol]
+                    size: int = len(follow)
+                    rest: Tuple[Union[int, str], ...] = symbols[index + 1:]
+                    follow |= self.first(rest)
+                    if self.nullable(rest):
+                        follow |= self.__follow[production.rule]
+                    if len(follow) != size:
+                        changed = True
+
+    def tables(self) -> Tables:
+        """Build LL(1) parse tables
+
+        Returns:
+            parse tables with the conflicts of the grammar
+        """
+        rules: List[str] = self.rules
+        numbers: Dict[str, int] = {rule: index
+                                   for index, rule in enumerate(rules)}
+        table: List[int] = [-1] * (len(rules) * KINDS)
+        claims: Dict[int, List[int]] = {}
+        for index, production in enumerate(self.__productions):
+            kinds_: Set[int] = set(self.first(production.symbols))
+            if self.nullable(production.symbols):
+                kinds_ |= self.__follow[production.rule]
+            row: int = numbers[production.rule] * KINDS
+            for kind in sorted(kinds_):
+                claims.setdefault(row + kind, []).append(index)
+
+        conflicts: List[Conflict] = []
+        for cell in sorted(claims):
+            candidates: List[int] = claims[cell]
+            # productions consuming tokens first, then grammar order
+            candidates.sort(key=lambda index: (
+                self.nullable(self.__productions[index].symbols), index))
+            table[cell] = candidates[0]
+            if len(candidates) > 1:
+                conflicts.append(Conflict(
+                    rules[cell // KINDS], kind_name(cell % KINDS),
+                    [str(self.__productions[index])
+                     for index in candidates]))
+        return Tables(
+            rules,
+            [(numbers[production.rule],
+              [symbol if isinstance(symbol, int)
+               else KINDS + numbers[symbol] for symbol in production.symbols],
+              list(production.marks))
+             for production in self.__productions],
+            table, conflicts)
+
+
+class _Reader:
+    """Reader of the parser rules of an ANTLR grammar"""
+
+    def __init__(self, text: str) -> None:
+        """Split grammar text into grammar tokens
+
+        Args:
+            text: grammar text
+        """
+        self.__tokens: List[str] = [
+            found.group() for found in GRAMMAR_TOKEN.finditer(text)
+            if not found.group().startswith(('//', '/*'))]
+        self.__position: int = 0
+        self.__alternatives: Dict[str, List[List[Item]]] = {}
+        self.__helpers: Dict[str, int] = {}
+
+    def __peek(self) -> str:
+        if self.__position >= len(self.__tokens):
+            return ''
+        return self.__tokens[self.__position]
+
+    def __next(self, expected: str = '') -> str:
+        token: str = self.__peek()
+        if not token or (expected and token != expected):
+            raise ValueError(f'Expected {expected or "grammar token"} but '
+                             f'found {token or "end of grammar"}')
+        self.__position += 1
+        return token
+
+    def __helper(self, rule: str, alternatives: List[List[Item]]) -> str:
+        """Add helper rule
+
+        Args:
+            rule: rule the helper belongs to
+            alternatives: alternatives of the helper rule
+
+        Returns:
+            name of the helper rule
+        """
+        number: int = self.__helpers.get(rule, 0) + 1
+        self.__helpers[rule] = number
+        name: str = f'{rule}:{number}'
+        self.__alternatives[name] = alternatives
+        return name
+
+    def read(self) -> Grammar:
+        """Read parser rules
+
+        Returns:
+            grammar of the parser rules, the first one is the start rule
+        """
+        while self.__peek():
+            name: str = self.__next()
+            if name == 'grammar':
+                self.__next()
+                self.__next(';')
+            elif name == 'fragment' or name[0].isupper():
+                # lexer rule
+                while self.__next() != ';':
+                    pass
+            else:
+                self.__next(':')
+                self.__alternatives[name] = []
+                self.__alternatives[name] = self.__read_alternatives(name)
+                self.__next(';')
+
+        rules: List[str] = list(self.__alternatives)
+        for rule in rules:
+            self.__factor(rule)
+        return Grammar([
+            Production(rule, tuple(symbol for symbol, _ in alternative),
+                       tuple(mark for _, mark in alternative))
+            for rule, alternatives in self.__alternatives.items()
+            for alternative in alternatives])
+
+    def __read_alternatives(self, rule: str) -> List[List[Item]]:
+        alternatives: List[List[Item]] = [self.__read_sequence(rule)]
+        while self.__peek() == '|':
+            self.__next()
+            alternatives.append(self.__read_sequence(rule))
+        unique: List[List[Item]] = []
+        for alternative in alternatives:
+            if [symbol for symbol, _ in alternative] not in \
+                    [[symbol for symbol, _ in known] for known in unique]:
+                unique.append(alternative)
+        return unique
+
+    def __read_sequence(self, rule: str) -> List[Item]:
+        sequence: List[Item] = []
+        while self.__peek() not in ('|', ')', ';', ''):
+            sequence.extend(self.__read_element(rule))
+        return sequence
+
+    def __read_element(self, rule: str) -> List[Item]:
+        """Read rule, token or group with its operator
+
+        Args:
+            rule: rule the element belongs to
+
+        Returns:
+            symbols to put in place of the element
+        """
+        token: str = self.__next()
+        alternatives: List[List[Item]]
+        if token == '(':
+            alternatives = self.__read_alternatives(rule)
+            self.__next(')')
+        elif token[0].isupper():
+            alternatives = [[(kind, token) for kind in sequence]
+                            for sequence in _token(token)]
+        else:
+            alternatives = [[(token, '')]]
+
+        operator: str = ''
+        if self.__peek() in tuple(OPERATORS):
+            operator = self.__next()
+        if not operator:
+            if len(alternatives) == 1:
+                return alternatives[0]
+            return [(self.__helper(rule, alternatives), '')]
+        if operator == '?':
+            return [(self.__helper(rule, alternatives + [[]]), '')]
+        loop: str = self.__helper(rule, [])
+        self.__alternatives[loop] = [alternative + [(loop, '')]
+                                     for alternative in alternatives] + [[]]
+        if operator == '*':
+            return [(loop, '')]
+        if len(alternatives) == 1:
+            return alternatives[0] + [(loop, '')]
+        return [(self.__helper(rule, alternatives), ''), (loop, '')]
+
+    def __factor(self, rule: str) -> None:
+        """Left factor alternatives starting with the same symbol
+
+        Args:
+            rule: rule or helper rule to factor
+        """
+        alternatives: List[List[Item]] = self.__alternatives[rule]
+        for alternative in alternatives:
+            if not alternative:
+                continue
+            group: List[List[Item]] = [
+                other for other in alternatives
+                if other and other[0][0] == alternative[0][0]]
+            if len(group) < 2:
+                continue
+            prefix: int = 1
+            while all(len(other) > prefix for other in group) and all(
+                    other[prefix][0] == group[0][prefix][0]
+                    for other in group):
+                prefix += 1
+            owner: str = rule.split(':')[0]
+            helper: str = self.__helper(owner, [other[prefix:]
+                                                for other in group])
+            factored: List[Item] = alternative[:prefix] + [(helper, '')]
+            self.__alternatives[rule] = [
+                factored if other is alternative else other
+                for other in alternatives
+                if other is alternative or other not in group]
+            self.__factor(helper)
+            self.__factor(rule)
+            return
+
+
+def read_grammar(text: str) -> Grammar:
+    """Read parser rules of an ANTLR grammar
+
+    Lexer rules are skipped, grammar tokens are mapped to token kinds.
+
+    Args:
+        text: grammar text
+
+    Returns:
+        grammar of the parser rules
+
+    Raises:
+        ValueError: on malformed grammar text or unknown grammar tokens
+    """
+    return _Reader(text).read()
+
+
+def _digest(text: str) -> str:
+    """Hash grammar text and the vocabulary
+
+    Args:
+        text: grammar text
+
+    Returns:
+        hex digest
+    """
+    grammar_hash = hashlib.blake2b(digest_size=16)
+    grammar_hash.update(repr((FORMAT_VERSION, KINDS, sorted(TOKENS.items()))
+                             ).encode('utf-8'))
+    grammar_hash.update(FINGERPRINT)
+    grammar_hash.update(text.encode('utf-8'))
+    return grammar_hash.hexdigest()
+
+
+def load_tables(directory: Union[str, PathLike, None] = None,
+                grammar: Union[str, PathLike] = GRAMMAR) -> Tables:
+    """Load parse tables of a grammar
+
+    Tables are generated on a cache miss and written under a temporary name
+    moved in place, so concurrent builds never see a partial file. A cache
+    directory which cannot be written is ignored.
+
+    Args:
+        directory: cache directory of the tables, None to always generate
+        grammar: path of the grammar file
+
+    Returns:
+        parse tables of the grammar
+    """
+    text: str = Path(grammar).read_text(encoding='utf-8')
+    if directory is None:
+        return read_grammar(text).tables()
+    path: Path = Path(directory) / f'{_digest(text)}{SUFFIX}'
+    try:
+        with open(path, encoding='utf-8') as tables_file:
+            return Tables.from_json(json.load(tables_file))
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    tables: Tables = read_grammar(text).tables()
+    temporary: Path = path.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temporary, 'w', encoding='utf-8') as tables_file:
+            json.dump(tables.to_json(), tables_file)
+        os.replace(temporary, path)
+    except OSError:
+        pass
+    return tables
+
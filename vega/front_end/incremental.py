@@ -0,0 +1,569 @@
+"""Function granular incremental parsing
+
+A Vega program is a sequence of top-level functions. The incremental parser
+splits the program code into one chunk per function and parses every chunk
+on its own. Per function it keeps the buffer range of its code, a hash of
+the code, the global symbols it declares, the global names it looks up, its
+syntax tree and its diagnostics.
+
+Parsing changed code again only splits the code around the edit again. Only
+functions whose code changed are parsed, and functions which look up a
+global name whose declarations changed. Functions behind an edit changing
+the number of lines are also parsed again if they have diagnostics, since
+error reports name their lines.
+
+Functions see the global symbols declared in front of them, like when the
+whole program is parsed at once. The global symbols of all functions are
+kept in one symbol table, which is patched in place after every parse.
+
+"""
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Pattern
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+from vega.data_structs.line_index import LineIndex
+from vega.data_structs.symbol_table import Scope
+from vega.data_structs.symbol_table import Symbol
+from vega.data_structs.symbol_table import SymbolTable
+from vega.data_structs.syntax_tree import SyntaxTree
+from vega.front_end.diagnostics import DEFAULT_LIMIT
+from vega.front_end.diagnostics import Diagnostics
+from vega.front_end.exception import BaseError
+from vega.front_end.parser import Mode
+from vega.front_end.parser import Parser
+from vega.front_end.source import Source
+from vega.front_end.source import load_source
+
+# curly brackets and the literals which can hold curly brackets
+CHUNK_PATTERN: Pattern = re.compile(r'''[{}]|'[^']*'?|"[^"]*"?''')
+# blank rest of the line behind a function
+LINE_REST: Pattern = re.compile(r'[ \t]*(?:\r\n|\r|\n|\Z)')
+BLANK: Pattern = re.compile(r'[ \t\r\n]*\Z')
+
+# name, const and callable flag and type of a global symbol
+Signature = Tuple[str, bool, bool, str]
+
+
+@dataclass(eq=False)
+class Function:
+    """Function data structure
+
+    Parse results of one top-level function with the following attributes:
+
+    Properties:
+        start: int - buffer position of the function code
+        end: int - buffer position behind the function code
+        line: int - line number the function code starts at
+        digest: bytes - hash of the function code
+        tree: SyntaxTree - syntax tree, buffer positions relative to start
+        diagnostics: List[BaseError] - errors found in the function,
+            buffer positions relative to start
+        declarations: Dict[int, Symbol] - global symbols by interned name id
+        references: Set[int] - interned ids of global names looked up
+
+    """
+    __slots__ = ('start', 'end', 'line', 'digest', 'tree', 'diagnostics',
+                 'declarations', 'references')
+
+    start: int
+    end: int
+    line: int
+    digest: bytes
+    tree: SyntaxTree
+    diagnostics: List[BaseError]
+    declarations: Dict[int, Symbol]
+    references: Set[int]
+
+
+class GlobalScope:
+    """Global scope as seen by one function
+
+    Stands in for the hash table of the global scope while a function is
+    parsed. Symbols declared by functions in front of the function are
+    found. Looking ahead, names no function in front declares are also
+    found behind it, unless the function declares them itself. Looked up
+    names and declared symbols are recorded.
+
+    """
+
+    def __init__(self, declarers: Dict[int, List[Function]], start: int,
+                 ahead: bool = False) -> None:
+        """Create global scope of a function
+
+        Args:
+            declarers: functions declaring a global name by its interned id,
+                in code order
+            start: buffer position of the function code
+            ahead: if symbols declared behind the function are found
+        """
+        self.__declarers: Dict[int, List[Function]] = declarers
+        self.__start: int = start
+        self.__ahead: bool = ahead
+        self.declarations: Dict[int, Symbol] = {}
+        self.references: Set[int] = set()
+
+    def get(self, key: int) -> Union[Symbol, None]:
+        """Get global symbol visible to the function
+
+        Args:
+            key: interned id of the name
+
+        Returns:
+            symbol declared last in front of the function, else the first
+            one behind it when looking ahead, None if not found
+        """
+        self.references.add(key)
+        symbol: Union[Symbol, None] = self.declarations.get(key)
+        if symbol is not None:
+            return symbol
+        declarers: List[Function] = self.__declarers.get(key, [])
+        for function in reversed(declarers):
+            if function.start < self.__start:
+                return function.declarations[key]
+        if self.__ahead and declarers and declarers[0].start > self.__start:
+            return declarers[0].declarations[key]
+        return None
+
+    def put(self, key: int, symbol: Symbol) -> None:
+        """Declare global symbol
+
+        Args:
+            key: interned id of the name
+            symbol: symbol to declare
+        """
+        self.declarations[key] = symbol
+
+
+def _digest(code: str) -> bytes:
+    """Hash function code
+
+    Args:
+        code: function code
+
+    Returns:
+        blake2b digest of the code
+    """
+    return hashlib.blake2b(code.encode('utf-8', 'surrogatepass'),
+                           digest_size=16).digest()
+
+
+def _count_lines(code: str, start: int, end: int) -> int:
+    """Count line breaks inside a span of the code buffer
+
+    Args:
+        code: code buffer
+        start: buffer position to start counting at
+        end: buffer position to stop counting at
+
+    Returns:
+        number of line breaks
+    """
+    return code.count('\n', start, end) + code.count('\r', start, end)
+
+
+def _common_prefix(old: str, new: str) -> int:
+    """Get length of the common prefix of two codes
+
+    Slices are compared by binary search, so the chars are compared in C.
+
+    Args:
+        old: old code
+        new: new code
+
+    Returns:
+        number of equal chars at the start
+    """
+    low: int = 0
+    high: int = min(len(old), len(new))
+    while low < high:
+        middle: int = (low + high + 1) // 2
+        if old[low:middle] == new[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _common_suffix(old: str, new: str, limit: int) -> int:
+    """Get length of the common suffix of two codes
+
+    Args:
+        old: old code
+        new: new code
+        limit: maximum length of the suffix
+
+    Returns:
+        number of equal chars at the end
+    """
+    low: int = 0
+    high: int = limit
+    while low < high:
+        middle: int = (low + high + 1) // 2
+        if old[len(old) - middle:len(old) - low] \
+                == new[len(new) - middle:len(new) - low]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def function_ends(code: str, start: int) -> Iterator[int]:
+    """Find the ends of top-level functions
+
+    A function ends behind the curly bracket closing its scope, together
+    with the rest of that line if it is blank.
+
+    Args:
+        code: code buffer
+        start: buffer position in front of a function
+
+    Returns:
+        iterator of the buffer positions behind each function
+    """
+    depth: int = 0
+    for found in CHUNK_PATTERN.finditer(code, start):
+        char: str = found.group()
+        if char == '{':
+            depth += 1
+        elif char == '}' and depth:
+            depth -= 1
+            if not depth:
+                end: int = found.end()
+                rest = LINE_REST.match(code, end)
+                yield end if rest is None else rest.end()
+
+
+def _find(functions: List[Function], position: int) -> int:
+    """Find function holding a buffer position
+
+    Args:
+        functions: functions in code order
+        position: buffer position
+
+    Returns:
+        index of the last function starting at or in front of the position
+    """
+    low: int = 0
+    high: int = len(functions) - 1
+    while low < high:
+        middle: int = (low + high + 1) // 2
+        if functions[middle].start <= position:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _signature(symbol: Symbol) -> Signature:
+    """Get comparable signature of a global symbol
+
+    Args:
+        symbol: symbol
+
+    Returns:
+        name, const and callable flag and type
+    """
+    return symbol.name, symbol.const, symbol.callable, str(symbol.type)
+
+
+class IncrementalParser:
+    """Incremental parser class
+
+    Parses vega code function by function and keeps the results, so parsing
+    changed code again only parses the functions affected by the change.
+
+    """
+
+    def __init__(self, mode: Mode = Mode.RECURSIVE,
+                 limit: int = DEFAULT_LIMIT) -> None:
+        """Create incremental parser without code
+
+        Args:
+            mode: how nested grammar rules are run
+            limit: number of errors after which diagnostics are cut off
+        """
+        self.__mode: Mode = mode
+        self.__limit: int = limit
+        self.__code: str = ''
+        self.__functions: List[Function] = []
+        self.__declarers: Dict[int, List[Function]] = {}
+        self.__referrers: Dict[int, Set[Function]] = {}
+        self.__table: SymbolTable = SymbolTable()
+        self.__parsed: int = 0
+
+    @property
+    def functions(self) -> List[Function]:
+        """Functions property
+
+        Returns:
+            parse results of all top-level functions in code order
+        """
+        return list(self.__functions)
+
+    @property
+    def table(self) -> SymbolTable:
+        """Table property
+
+        Returns:
+            symbol table, its global scope holds the global symbols declared
+            last by the functions
+        """
+        return self.__table
+
+    @property
+    def parsed(self) -> int:
+        """Parsed property
+
+        Returns:
+            number of functions parsed by the last parse
+        """
+        return self.__parsed
+
+    @property
+    def diagnostics(self) -> Diagnostics:
+        """Diagnostics property
+
+        Errors are copied and located in the whole code, so the reports
+        show whole lines even when a function starts inside a line.
+
+        Returns:
+            errors of all functions in code order
+        """
+        diagnostics: Diagnostics = Diagnostics(self.__limit)
+        line_index: LineIndex = LineIndex(self.__code)
+        for function in self.__functions:
+            for error in function.diagnostics:
+                diagnostics.add(error.relocated(line_index, function.start))
+            if diagnostics.full:
+                break
+        return diagnostics
+
+    def parse(self, code: Source) -> Diagnostics:
+        """Parse code, reusing the results of the code parsed before
+
+        Args:
+            code: Vega program code (path, file object, bytes or string)
+
+        Returns:
+            errors of all functions in code order
+        """
+        new: str = load_source(code)
+        old: str = self.__code
+        functions: List[Function] = self.__functions
+        self.__parsed = 0
+        if functions and new == old:
+            return self.diagnostics
+        self.__code = new
+
+        # the edit, functions in front of it are kept
+        prefix: int = _common_prefix(old, new)
+        suffix: int = _common_suffix(old, new,
+                                     min(len(old), len(new)) - prefix)
+        delta: int = len(new) - len(old)
+        lines: int = _count_lines(new, prefix, len(new) - suffix) \
+            - _count_lines(old, prefix, len(old) - suffix)
+        first: int = 0
+        last: int = 0
+        if functions:
+            first = _find(functions, prefix - 1)
+            last = max(first, _find(functions, len(old) - suffix - 1))
+        start: int = functions[first].start if functions else 0
+
+        # split again until a function ends where an old one ended
+        chunks: List[Tuple[int, int]] = []
+        stop: int = len(functions)
+        position: int = start
+        for end in function_ends(new, start):
+            chunks.append((position, end))
+            position = end
+            while last < len(functions) \
+                    and functions[last].end + delta < end:
+                last += 1
+            if last < len(functions) and functions[last].end + delta == end:
+                stop = last + 1
+                break
+        else:
+            if position < len(new) or not chunks and not first:
+                chunks.append((position, len(new)))
+
+        replaced: List[Function] = functions[first:stop]
+        current, created = self.__split(
+            new, chunks, functions[first].line if functions else 1, replaced)
+        functions[first:stop] = current
+        behind: List[Function] = functions[first + len(current):]
+        for function in behind:
+            function.start += delta
+            function.end += delta
+            function.line += lines
+
+        # signatures of the global names declared by parsed functions
+        signatures: Dict[int, List[Signature]] = {}
+        kept: Set[Function] = set(current)
+        for function in replaced:
+            if function not in kept:
+                self.__unregister(function, signatures)
+        for function in created:
+            self.__parse_function(function, signatures)
+
+        # functions depending on changed declarations or moved lines
+        pending: Set[Function] = set()
+        for key, before in signatures.items():
+            if self.__signatures(key) != before:
+                pending.update(self.__referrers.get(key, ()))
+        if lines:
+            pending.update(function for function in behind
+                           if function.diagnostics)
+        pending.difference_update(created)
+        for function in sorted(pending, key=lambda item: item.start):
+            self.__unregister(function, signatures)
+            self.__parse_function(function, signatures)
+
+        for key in signatures:
+            declarers: List[Function] = self.__declarers.get(key, [])
+            if declarers:
+                self.__table.store(declarers[-1].declarations[key])
+            else:
+                self.__table.remove(key)
+        return self.diagnostics
+
+    def __split(self, code: str, chunks: List[Tuple[int, int]], line: int,
+                replaced: List[Function]
+                ) -> Tuple[List[Function], List[Function]]:
+        """Create functions of code chunks, reusing unchanged ones in order
+
+        Args:
+            code: code buffer
+            chunks: buffer ranges of the function code
+            line: line number of the first chunk
+            replaced: functions the chunks replace
+
+        Returns:
+            functions of the chunks and the new ones among them to parse
+        """
+        functions: List[Function] = []
+        for start, end in chunks:
+            functions.append(Function(start, end, line,
+                                      _digest(code[start:end]), SyntaxTree(),
+                                      [], {}, set()))
+            line += _count_lines(code, start, end)
+        common: int = min(len(functions), len(replaced))
+        lead: int = 0
+        while lead < common \
+                and self.__reusable(replaced[lead], functions[lead]):
+            lead += 1
+        trail: int = 0
+        while trail < common - lead \
+                and self.__reusable(replaced[-trail - 1],
+                                    functions[-trail - 1]):
+            trail += 1
+        reused: List[int] = list(range(lead)) + list(range(
+            len(functions) - trail, len(functions)))
+        for index in reused:
+            old: Function = replaced[index + len(replaced) - len(functions)
+                                     if index >= lead else index]
+            new: Function = functions[index]
+            old.start, old.end, old.line = new.start, new.end, new.line
+            functions[index] = old
+        return functions, functions[lead:len(functions) - trail]
+
+    @staticmethod
+    def __reusable(old: Function, new: Function) -> bool:
+        """Check if the results of a function can be kept for new code
+
+        Args:
+            old: parsed function
+            new: function of the new code
+
+        Returns:
+            True if the code is the same and no error report names a line
+            which moved
+        """
+        return old.digest == new.digest \
+            and (old.line == new.line or not old.diagnostics)
+
+    def __signatures(self, key: int) -> List[Signature]:
+        """Get signatures of the declarations of a global name
+
+        Args:
+            key: interned id of the name
+
+        Returns:
+            signatures in code order
+        """
+        return [_signature(function.declarations[key])
+                for function in self.__declarers.get(key, ())]
+
+    def __unregister(self, function: Function,
+                     signatures: Dict[int, List[Signature]]) -> None:
+        """Remove declarations and references of a function
+
+        Args:
+            function: function to remove
+            signatures: signatures of the global names before the parse,
+                filled for the names declared by the function
+        """
+        for key in function.declarations:
+            if key not in signatures:
+                signatures[key] = self.__signatures(key)
+            declarers: List[Function] = self.__declarers[key]
+            declarers.remove(function)
+            if not declarers:
+                del self.__declarers[key]
+        for key in function.references:
+            referrers: Set[Function] = self.__referrers[key]
+            referrers.discard(function)
+            if not referrers:
+                del self.__referrers[key]
+
+    def __register(self, function: Function,
+                   signatures: Dict[int, List[Signature]]) -> None:
+        """Add declarations and references of a function
+
+        Args:
+            function: function to add
+            signatures: signatures of the global names before the parse,
+                filled for the names declared by the function
+        """
+        for key in function.declarations:
+            if key not in signatures:
+                signatures[key] = self.__signatures(key)
+            declarers: List[Function] = self.__declarers.setdefault(key, [])
+            index: int = len(declarers)
+            while index and declarers[index - 1].start > function.start:
+                index -= 1
+            declarers.insert(index, function)
+        for key in function.references:
+            self.__referrers.setdefault(key, set()).add(function)
+
+    def __parse_function(self, function: Function,
+                         signatures: Dict[int, List[Signature]]) -> None:
+        """Parse function code and register the results
+
+        Blank code behind the last function is only parsed if it is all of
+        the code.
+
+        Args:
+            function: function to parse
+            signatures: signatures of the global names before the parse
+        """
+        code: str = self.__code[function.start:function.end]
+        if len(self.__functions) > 1 and BLANK.match(code):
+            return
+        scope: GlobalScope = GlobalScope(self.__declarers, function.start)
+        diagnostics: Diagnostics = Diagnostics(self.__limit)
+        parser: Parser = Parser(code, self.__mode, diagnostics,
+                                SymbolTable(Scope('global', scope)),
+                                function.line)
+        function.tree = parser.parse()
+        function.diagnostics = list(diagnostics)
+        function.declarations = scope.declarations
+        function.references = scope.references
+        self.__parsed += 1
+        self.__register(function, signatures)
@@ -1,78 +1,186 @@
 """Implements lexical scanner for Vega language
 
-"""
-from io import TextIOWrapper
+The lexer walks the program code char by char and tries every kind of
+token, ASCII code is classified byte by byte through a class table. Tokens
+can either be collected into a ``TokenStream`` with ``Lexer.scan()`` or
+pulled one by one from the ``Lexer.tokens()`` generator.
+
+For editors the code can be scanned into ``TokenLines`` which keep the tokens
+of every line apart. After text edits ``Lexer.relex()`` only scans the lines
+around each edit again and splices the new tokens in.
 
+"""
+import re
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Pattern
+from typing import Tuple
+from typing import Union
+
+from vega.data_structs.intern_pool import POOL
+from vega.data_structs.intern_pool import InternPool
+from vega.data_structs.line_index import LineIndex
+from vega.data_structs.token_cache import TokenCache
+from vega.data_structs.token_lines import TextEdit
+from vega.data_structs.token_lines import TokenLines
+from vega.data_structs.token_stream import Span
 from vega.data_structs.token_stream import TokenStream
+from vega.front_end.source import Source
+from vega.front_end.source import load_source
 from vega.language import vocabulary
 from vega.language.token import Literal
 from vega.language.token import Num
 from vega.language.token import Real
-from vega.language.token import Tag
-from vega.language.token import Token
+from vega.language.token import TokenType
 from vega.language.token import Word
-from vega.utils.data_types.hash_table import HashTable
+
+
+OPERATORS = {operator.lexeme: operator for operator in vocabulary.operators}
+BLANKS = frozenset((' ', '', '\t'))
+NON_ASCII: Pattern = re.compile(r'[^\x00-\x7f]')
+
+# char classes of the ASCII fast path, combinable as bit flags
+BLANK: int = 1
+NEWLINE: int = 2
+DIGIT: int = 4
+LETTER: int = 8
+QUOTE: int = 16
+OPERATOR: int = 32
+UNICODE: int = 64
+ALNUM: int = DIGIT | LETTER
+
+
+def _char_classes() -> bytes:
+    """Build class table of all byte values
+
+    Returns:
+        char class of every byte value, 0 for one char tokens
+    """
+    classes: bytearray = bytearray(256)
+    for byte in range(128):
+        char: str = chr(byte)
+        if char in ' \t':
+            classes[byte] = BLANK
+        elif char in '\r\n':
+            classes[byte] = NEWLINE
+        elif char.isdecimal():
+            classes[byte] = DIGIT
+        elif char.isalpha():
+            classes[byte] = LETTER
+        elif char in '\'"':
+            classes[byte] = QUOTE
+        elif any(operator.startswith(char) for operator in OPERATORS):
+            classes[byte] = OPERATOR
+    for byte in range(128, 256):
+        classes[byte] = UNICODE
+    return bytes(classes)
+
+
+CHAR_CLASSES: bytes = _char_classes()
+
+
+def _count_lines(code: str, start: int, end: int) -> int:
+    """Count line breaks inside a span of the code buffer
+
+    Args:
+        code: code buffer
+        start: buffer position to start counting at
+        end: buffer position to stop counting at
+
+    Returns:
+        number of line breaks
+    """
+    return code.count('\n', start, end) + code.count('\r', start, end)
 
 
 # pylint: disable=too-few-public-methods
 class Lexer:
     """Lexer class"""
 
-    def __init__(self, code: TextIOWrapper) -> None:
-        """On lexer initialization create hash table
-        with keywords for easier matching
+    def __init__(self, code: Source, line: int = 1) -> None:
+        """On lexer initialization load the program code
+
+        Keywords and identifiers are looked up in the process wide interning
+        pool, so word tokens are shared by all lexers. The program code is
+        loaded into one buffer up front, see
+        ``load_source`` for the accepted kinds of input.
 
         Args:
-            code: vega program code
+            code: vega program code (path, file object, bytes or string)
+            line: line number the code starts at
         """
-        self.__line: int = 1
+        self.__line: int = line
         self.__peek: str = ''
-        self.__code: TextIOWrapper = code
-        self.__token_stream: TokenStream = TokenStream()
-        self.__words: HashTable = HashTable()
-        for keyword in vocabulary.keywords:
-            self.__words.put(keyword.lexeme, keyword)
+        self.__code: str = load_source(code)
+        self.__length: int = len(self.__code)
+        self.__position: int = 0
+        self.__pending: List[Span] = []
+        self.__words: InternPool = POOL
+        self.__line_index: LineIndex = LineIndex(self.__code, line)
 
     @property
-    def words(self) -> HashTable:
+    def words(self) -> InternPool:
         """Word property
 
         Returns:
-            hash table of stored keywords and identifiers
+            interning pool of stored keywords and identifiers
 
         """
         return self.__words
 
+    @property
+    def line_index(self) -> LineIndex:
+        """Line index property
+
+        Returns:
+            line starts of the code, filled while scanning
+
+        """
+        return self.__line_index
+
     def __readch(self) -> bool:
         """Read next char from code stream
 
-        Read char from code stream and write to attribute ``__peek``
+        Read char at the current buffer position and write to attribute
+        ``__peek``
 
         Returns:
             True when char left on input stream, False otherwise
         """
-        self.__peek = self.__code.read(1)
-        if len(self.__peek) == 0:
-            return False
-        return True
+        if self.__position < self.__length:
+            self.__peek = self.__code[self.__position]
+            self.__position += 1
+            return True
+        self.__peek = ''
+        return False
+
+    def __nextch(self) -> str:
+        """Look at the char following ``__peek`` without reading it
+
+        Returns:
+            next char, empty string at the end of the code stream
+        """
+        if self.__position < self.__length:
+            return self.__code[self.__position]
+        return ''
 
     def __readcch(self, char: str) -> bool:
-        """Read next char from code stream and validate against ``c``
+        """Read next char from code stream if it matches ``char``
 
         Args:
-            c: char to validate
+            char: char to validate
 
         Returns:
-            True when c matches, False otherwise
+            True when char matches and has been read, False otherwise
         """
-        self.__readch()
-        if self.__peek != char:
+        if self.__nextch() != char:
             return False
-        self.__peek = ''
+        self.__readch()
         return True
 
     def __scan_combined_tokens(self, first_sign: str, second_sign: str,
-                               word: Word) -> None:
+                               word: Word) -> bool:
         """Scan for combined tokens like '!=' or '=='
 
         Args:
@@ -81,111 +189,317 @@ class Lexer:
             word: word to add to token stream for combined token
 
         Returns:
-
+            True if a token has been added, False otherwise
         """
-        if self.__peek == first_sign:
-            if self.__readcch(second_sign):
-                self.__token_stream.add(word, line=self.__line)
-            else:
-                self.__token_stream.add(Token(first_sign), line=self.__line)
+        if self.__peek != first_sign:
+            return False
+        start: int = self.__position - 1
+        if self.__readcch(second_sign):
+            self.__emit(word, start)
+        else:
+            self.__emit(vocabulary.token(first_sign), start)
+        return True
 
-    def __scan_literals(self, indicator: str) -> None:
+    def __scan_literals(self, indicator: str) -> bool:
         """Scan for literals
 
-        Add literals like char or strings to token stream
+        Add literals like char or strings to token stream. Line breaks inside
+        a literal are counted after the literal has been added.
 
         Args:
             indicator: literal indicator for chars and strings
 
         Returns:
-
+            True if a literal has been added, False otherwise
         """
-        if self.__peek == indicator:
-            string: str = ''
-            self.__token_stream.add(Token(indicator), line=self.__line)
-            self.__readch()
-            eof: bool = True
-            while self.__peek != indicator and eof:
-                string += self.__peek
-                eof = self.__readch()
-            self.__token_stream.add(Literal(string), line=self.__line)
+        if self.__peek != indicator:
+            return False
+        start: int = self.__position
+        self.__emit(vocabulary.token(indicator), start - 1)
+        end: int = self.__code.find(indicator, start)
+        closed: bool = end >= 0
+        if not closed:
+            end = self.__length
+        self.__position = end
+        self.__emit(Literal(None, self.__code, start, end), start)
+        if closed:
+            self.__position += 1
+            self.__emit(vocabulary.token(indicator), end)
+        self.__line += _count_lines(self.__code, start, end)
+        self.__line_index.index(end)
+        return True
 
-    def __scan_numbers(self) -> None:
+    def __scan_numbers(self) -> bool:
         """Scan for numbers
 
         Add natural or real numbers to token stream
 
         Returns:
-
+            True if a number has been added, False otherwise
         """
-        if self.__peek.isdecimal():
-            value: int = 0
-            while self.__peek.isdecimal():
-                value = 10 * value + int(self.__peek)
-                self.__readch()
-            if self.__peek != '.':
-                self.__token_stream.add(Num(value), line=self.__line)
-                return
-            real: float = value
-            fraction: float = 10
+        if not self.__peek.isdecimal():
+            return False
+        start: int = self.__position - 1
+        while self.__nextch().isdecimal():
+            self.__readch()
+        if not self.__readcch('.'):
+            self.__emit(Num(None, self.__code, start, self.__position), start)
+            return True
+        while self.__nextch().isdecimal():
             self.__readch()
-            while self.__peek.isdecimal():
-                real = real + int(self.__peek) / fraction
-                fraction *= 10
-                self.__readch()
-            self.__token_stream.add(Real(real), line=self.__line)
+        self.__emit(Real(None, self.__code, start, self.__position), start)
+        return True
 
-    def __scan_words(self) -> None:
+    def __scan_words(self) -> bool:
         """Scan for words
 
         Add words (keywords or identifier) to token stream
 
         Returns:
+            True if a word has been added, False otherwise
+        """
+        if not self.__peek.isalpha():
+            return False
+        start: int = self.__position - 1
+        while self.__nextch().isalnum():
+            self.__readch()
+        self.__emit(self.__word(self.__code[start:self.__position]), start)
+        return True
 
+    def __word(self, string: str) -> Word:
+        """Get keyword or identifier
+
+        Args:
+            string: lexeme of the word
+
+        Returns:
+            keyword or identifier word
         """
-        if self.__peek.isalpha():
-            string: str = ''
-            while self.__peek.isalnum():
-                string += self.__peek
-                self.__readch()
-            lookup: Word = self.__words.get(string)
-            if lookup is not None:
-                self.__token_stream.add(lookup, line=self.__line)
-                return
-            word = Word(string, Tag.ID)
-            self.__words.put(string, word)
-            self.__token_stream.add(word, line=self.__line)
+        return vocabulary.word(string, self.__words)
+
+    def __emit(self, token: TokenType, start: int) -> None:
+        """Hand scanned token over to the tokens generator
+
+        The token ends at the current buffer position.
+
+        Args:
+            token: scanned token
+            start: buffer position the token starts at
+        """
+        self.__pending.append((token, self.__line, start, self.__position))
 
     def __skip_whitespace(self):
-        return bool(self.__peek in [' ', '', '\t'])
+        return self.__peek in BLANKS
 
-    def scan(self) -> TokenStream:
-        """lexical scan method
+    # pylint: disable=too-many-branches,too-many-statements
+    def __scan_ascii(self) -> Iterator[Span]:
+        """ASCII fast path of the lexer
 
-        Scan code for tokens and add them to token stream
+        Classify every byte of the ASCII part in front of the first non ASCII
+        char through ``CHAR_CLASSES`` instead of calling the Unicode aware
+        string methods. The Unicode aware char scan takes over at the
+        first token running into non ASCII code.
 
         Returns:
-            Queue: token stream for parsing
+            iterator of tokens with line numbers and buffer positions
         """
+        code: str = self.__code
+        found = NON_ASCII.search(code, self.__position)
+        stop: int = self.__length if found is None else found.start()
+        handover: bool = stop < self.__length
+        buffer: bytes = code[:stop].encode('ascii')
+        classes: bytes = CHAR_CLASSES
+        position: int = self.__position
+        line: int = self.__line
+        line_index: LineIndex = self.__line_index
+        while position < stop:
+            start: int = position
+            char_class: int = classes[buffer[position]]
+            position += 1
+            if char_class & BLANK:
+                continue
+            if char_class & NEWLINE:
+                line += 1
+                line_index.add(position)
+            elif char_class & LETTER:
+                while position < stop and classes[buffer[position]] & ALNUM:
+                    position += 1
+                if position == stop and handover:
+                    position = start
+                    break
+                yield self.__word(code[start:position]), line, start, position
+            elif char_class & DIGIT:
+                while position < stop and classes[buffer[position]] & DIGIT:
+                    position += 1
+                number = Num
+                if position < stop and buffer[position] == 46:  # '.'
+                    number = Real
+                    position += 1
+                    while position < stop and \
+                            classes[buffer[position]] & DIGIT:
+                        position += 1
+                if position == stop and handover:
+                    position = start
+                    break
+                yield (number(None, code, start, position), line, start,
+                       position)
+            elif char_class & QUOTE:
+                indicator: str = code[start]
+                end: int = code.find(indicator, position, stop)
+                if end < 0:
+                    if handover:
+                        position = start
+                        break
+                    end = stop
+                yield vocabulary.token(indicator), line, start, position
+                yield Literal(None, code, position, end), line, position, end
+                if end < stop:
+                    yield vocabulary.token(indicator), line, end, end + 1
+                line += _count_lines(code, position, end)
+                line_index.index(end)
+                position = end + 1
+            elif char_class & OPERATOR:
+                operator: Word = OPERATORS.get(code[start:start + 2])
+                if operator is None:
+                    yield vocabulary.token(code[start]), line, start, position
+                else:
+                    position += 1
+                    yield operator, line, start, position
+            else:
+                yield vocabulary.token(code[start]), line, start, position
+        self.__position = min(position, self.__length)
+        self.__line = line
+        if handover:
+            yield from self.__scan_chars()
+
+    def __scan_chars(self) -> Iterator[Span]:
+        """Unicode aware char scan
+
+        Read code char by char and try each kind of token on the current
+        char till one of them matches.
+
+        Returns:
+            iterator of tokens with line numbers and buffer positions
+        """
+        pending: List[Span] = self.__pending
         while self.__readch():
-            self.__scan_combined_tokens('&', '&', vocabulary.BOOL_AND)
-            self.__scan_combined_tokens('|', '|', vocabulary.BOOL_OR)
-            self.__scan_combined_tokens('=', '=', vocabulary.EQ)
-            self.__scan_combined_tokens('!', '=', vocabulary.NE)
-            self.__scan_combined_tokens('<', '=', vocabulary.LE)
-            self.__scan_combined_tokens('>', '=', vocabulary.GE)
-            self.__scan_combined_tokens('-', '>', vocabulary.RETURN_TYPE)
-            self.__scan_literals("'")
-            self.__scan_literals('"')
-            self.__scan_numbers()
-            self.__scan_words()
+            if self.__scan_combined_tokens('&', '&', vocabulary.BOOL_AND) \
+                    or self.__scan_combined_tokens('|', '|',
+                                                   vocabulary.BOOL_OR) \
+                    or self.__scan_combined_tokens('=', '=', vocabulary.EQ) \
+                    or self.__scan_combined_tokens('!', '=', vocabulary.NE) \
+                    or self.__scan_combined_tokens('<', '=', vocabulary.LE) \
+                    or self.__scan_combined_tokens('>', '=', vocabulary.GE) \
+                    or self.__scan_combined_tokens('-', '>',
+                                                   vocabulary.RETURN_TYPE) \
+                    or self.__scan_literals("'") \
+                    or self.__scan_literals('"') \
+                    or self.__scan_numbers() \
+                    or self.__scan_words():
+                yield from pending
+                pending.clear()
+                continue
             # text control characters
             if self.__skip_whitespace():
                 continue
             if self.__peek == '\n' or self.__peek == '\r':
                 self.__line += 1
+                self.__line_index.add(self.__position)
                 continue
             # Add remaining tokens
-            self.__token_stream.add(Token(self.__peek), line=self.__line)
+            yield (vocabulary.token(self.__peek), self.__line,
+                   self.__position - 1, self.__position)
+
+    def spans(self) -> Iterator[Span]:
+        """Lazy lexical scan method with token positions
+
+        Scan code on demand, every token is created when it is pulled from
+        the returned iterator.
+
+        Returns:
+            iterator of tokens with line number, start and end position in
+            the code buffer
+        """
+        return self.__scan_ascii()
+
+    def tokens(self) -> Iterator[Tuple[TokenType, int]]:
+        """Lazy lexical scan method
+
+        See ``spans()``.
 
-        return self.__token_stream
+        Returns:
+            iterator of tokens and their line numbers
+        """
+        return ((token, line) for token, line, _, _ in self.spans())
+
+    def scan(self, cache: Union[TokenCache, None] = None) -> TokenStream:
+        """lexical scan method
+
+        Scan code for tokens and add them to token stream. With a token cache
+        the tokens of unchanged code are loaded from the cache, otherwise
+        they are written to it.
+
+        Args:
+            cache: optional token cache
+
+        Returns:
+            Queue: token stream for parsing
+        """
+        spans: Iterable[Span] = self.spans()
+        if cache is not None:
+            line: int = self.__line
+            cached: Union[TokenStream, None] = cache.load(self.__code, line)
+            if cached is not None:
+                return cached
+            spans = list(spans)
+            cache.store(self.__code, spans, line)
+        token_stream: TokenStream = TokenStream()
+        for token, line, start, end in spans:
+            token_stream.add(token, line=line, start=start, end=end)
+        return token_stream
+
+    def scan_lines(self) -> TokenLines:
+        """lexical scan method for incremental scanning
+
+        Scan code for tokens and keep them apart by line, see
+        ``Lexer.relex()``.
+
+        Returns:
+            tokens of the code grouped by line
+        """
+        token_lines: TokenLines = TokenLines()
+        token_lines.splice(0, len(token_lines), self.__code, self.spans())
+        return token_lines
+
+    @classmethod
+    def relex(cls, previous: TokenLines, edits: Iterable[TextEdit]
+              ) -> TokenLines:
+        """Scan edited code again
+
+        Edits are applied one after another, every edit refers to the code
+        resulting from the edits before it. For each edit only the lines from
+        the last safe restart point (a line start outside of a literal) till
+        the end of the edit are scanned again. Literals left open by the edit
+        pull in following lines till they are closed.
+
+        Args:
+            previous: tokens by line of the code before the edits, spliced in
+                place
+            edits: text edits
+
+        Returns:
+            tokens by line of the edited code
+        """
+        for edit in edits:
+            first, stop, code = previous.window(edit)
+            spans: List[Span] = list(cls(code, line=first + 1).spans())
+            while spans and isinstance(spans[-1][0], Literal) \
+                    and stop < len(previous):
+                # literal is still open at the end of the window
+                extension: int = previous.boundary(
+                    min(len(previous), stop + stop - first))
+                code += previous.text_of(stop, extension)
+                stop = extension
+                spans = list(cls(code, line=first + 1).spans())
+            previous.splice(first, stop, code, spans)
+        return previous
@@ -0,0 +1,177 @@
+"""Parallel lexical scanner for large program code
+
+Program code is split into chunks at line breaks outside of literals. Every
+token ends at a line break, so each chunk can be scanned on its own. The
+boundaries are found with a cheap pre-scan of all literals, a quote outside
+of a literal always starts a new literal.
+
+The chunks are scanned in worker processes. Workers do not send tokens back
+but compact array columns of token kind, line, start and end position. The
+tokens are created from these columns and the code buffer when they are
+pulled from the merged ``TokenStream``, so the stream is identical to the one
+of a serial scan.
+
+"""
+import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from typing import Iterator
+from typing import List
+from typing import Match
+from typing import Pattern
+from typing import Tuple
+from typing import Union
+
+from vega.data_structs.token_lines import LINE_BREAK
+from vega.data_structs.token_stream import Span
+from vega.data_structs.token_stream import TokenStream
+from vega.front_end.lexer import Lexer
+from vega.front_end.source import Source
+from vega.front_end.source import load_source
+from vega.language import vocabulary
+from vega.language.token import SPAN_TOKENS
+from vega.language.token import Tag
+from vega.language.token import TokenType
+
+LITERAL_PATTERN: Pattern = re.compile(r"'[^']*'?|\"[^\"]*\"?")
+
+# smallest chunk worth sending to a worker process
+MIN_CHUNK_SIZE: int = 1 << 20
+
+FIRST_TAG: int = min(tag.value for tag in Tag)
+CHAR_KIND: int = Tag.CHAR.value
+
+# token kind, line, start and end position columns and number of line breaks
+Columns = Tuple[array, array, array, array, int]
+
+
+def split_chunks(code: str, chunks: int) -> List[int]:
+    """Find chunk boundaries in program code
+
+    Each boundary is placed behind the first line break following the ideal
+    boundary which is not part of a literal.
+
+    Args:
+        code: program code
+        chunks: number of chunks to aim for
+
+    Returns:
+        buffer positions of the chunk boundaries including 0 and the end of
+        the code
+    """
+    size: int = max(1, len(code) // chunks)
+    boundaries: List[int] = [0]
+    literals: Iterator[Match] = LITERAL_PATTERN.finditer(code)
+    literal: Union[Match, None] = next(literals, None)
+    position: int = size
+    while position < len(code):
+        found: Union[Match, None] = LINE_BREAK.search(code, position)
+        if found is None:
+            break
+        position = found.start()
+        while literal is not None and literal.end() <= position:
+            literal = next(literals, None)
+        if literal is not None and literal.start() < position:
+            # line break inside a literal
+            position = literal.end()
+            continue
+        boundaries.append(position + 1)
+        position += size
+    if boundaries[-1] < len(code):
+        boundaries.append(len(code))
+    return boundaries
+
+
+def _scan_chunk(chunk: str) -> Columns:
+    """Scan one chunk of program code in a worker process
+
+    Args:
+        chunk: program code of the chunk
+
+    Returns:
+        token columns with lines and positions relative to the chunk
+    """
+    kinds: array = array('i')
+    lines: array = array('i')
+    starts: array = array('q')
+    ends: array = array('q')
+    for token, line, start, end in Lexer(chunk).spans():
+        kinds.append(token.kind)
+        lines.append(line)
+        starts.append(start)
+        ends.append(end)
+    line_breaks: int = chunk.count('\n') + chunk.count('\r')
+    return kinds, lines, starts, ends, line_breaks
+
+
+def create_token(code: str, kind: int, start: int, end: int) -> TokenType:
+    """Create token from its columns
+
+    Args:
+        code: program code
+        kind: token kind
+        start: buffer position of the token
+        end: buffer position behind the token
+
+    Returns:
+        token
+    """
+    if kind < FIRST_TAG or kind == CHAR_KIND:
+        return vocabulary.token(code[start])
+    span_token = SPAN_TOKENS.get(kind)
+    if span_token is not None:
+        return span_token(None, code, start, end)
+    return vocabulary.word(code[start:end])
+
+
+def _merge(code: str, boundaries: List[int],
+           results: List[Columns]) -> Iterator[Span]:
+    """Merge scanned chunks into one token iterator
+
+    Args:
+        code: program code
+        boundaries: chunk boundaries
+        results: token columns of each chunk
+
+    Returns:
+        iterator of tokens with line numbers and buffer positions
+    """
+    line_offset: int = 0
+    for offset, (kinds, lines, starts, ends, line_breaks) in zip(boundaries,
+                                                                  results):
+        for kind, line, start, end in zip(kinds, lines, starts, ends):
+            start += offset
+            end += offset
+            yield (create_token(code, kind, start, end), line_offset + line,
+                   start, end)
+        line_offset += line_breaks
+
+
+def scan_parallel(code: Source, workers: Union[int, None] = None,
+                  chunk_size: int = MIN_CHUNK_SIZE) -> TokenStream:
+    """Lexical scan of program code with multiple processes
+
+    Code too small for more than one chunk is scanned in this process.
+
+    Args:
+        code: vega program code (path, file object, bytes or string)
+        workers: number of worker processes, number of CPUs by default
+        chunk_size: minimal size of a chunk
+
+    Returns:
+        token stream for parsing, tokens are created on demand
+    """
+    code = load_source(code)
+    if workers is None:
+        workers = cpu_count() or 1
+    chunks: int = min(workers, len(code) // chunk_size)
+    if chunks < 2:
+        return Lexer(code).scan()
+    boundaries: List[int] = split_chunks(code, chunks)
+    with ProcessPoolExecutor(workers) as executor:
+        results: List[Columns] = list(executor.map(
+            _scan_chunk,
+            [code[start:end] for start, end in zip(boundaries,
+                                                   boundaries[1:])]))
+    return TokenStream(_merge(code, boundaries, results))
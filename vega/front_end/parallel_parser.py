@@ -0,0 +1,249 @@
+"""Parallel parser for large program code
+
+Parsing runs in two phases. A pre-pass parses only the signature of every
+top-level function and declares all functions in the global scope. Then the
+function bodies are parsed in worker processes, each with a read-only copy
+of the global scope. Since all functions are declared up front, functions
+can call functions defined behind them.
+
+Symbols hold interned ids of their own process, so every worker runs the
+pre-pass on the signature code once when it starts. Workers do not send
+tokens back but syntax tree columns, the tokens are created again from the
+code buffer. Trees and diagnostics are merged in code order, so the result
+does not depend on the number of workers.
+
+"""
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from os import cpu_count
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from vega.data_structs.line_index import LineIndex
+from vega.data_structs.symbol_table import Scope
+from vega.data_structs.symbol_table import SymbolTable
+from vega.data_structs.syntax_tree import Columns
+from vega.data_structs.syntax_tree import Syntax
+from vega.data_structs.syntax_tree import SyntaxTree
+from vega.front_end.diagnostics import Diagnostics
+from vega.front_end.exception import BaseError
+from vega.front_end.incremental import BLANK
+from vega.front_end.incremental import CHUNK_PATTERN
+from vega.front_end.incremental import Function
+from vega.front_end.incremental import GlobalScope
+from vega.front_end.incremental import function_ends
+from vega.front_end.parallel_lexer import create_token
+from vega.front_end.parser import Mode
+from vega.front_end.parser import Parser
+from vega.front_end.source import Source
+from vega.front_end.source import load_source
+from vega.language import kinds
+from vega.language.token import TokenType
+from vega.language.vocabulary import EOF
+
+# smallest code worth sending to worker processes
+MIN_CHUNK_SIZE: int = 1 << 16
+
+# syntax tree columns and errors of one function
+Result = Tuple[Columns, List[BaseError]]
+
+# global scope of a worker process, declared when the worker starts
+_WORKER_DECLARERS: Dict[int, List[Function]] = {}
+
+
+def split_functions(code: str) -> List[Tuple[int, int, int]]:
+    """Split program code into top-level functions
+
+    Code behind the last function is one more chunk unless it is blank.
+
+    Args:
+        code: program code
+
+    Returns:
+        buffer range and first line of every function
+    """
+    functions: List[Tuple[int, int, int]] = []
+    position: int = 0
+    line: int = 1
+    for end in function_ends(code, 0):
+        functions.append((position, end, line))
+        line += code.count('\n', position, end) \
+            + code.count('\r', position, end)
+        position = end
+    if not functions or not BLANK.match(code, position):
+        functions.append((position, len(code), line))
+    return functions
+
+
+def signature(code: str) -> str:
+    """Cut the signature out of function code
+
+    Args:
+        code: function code
+
+    Returns:
+        function code up to the curly bracket opening its scope, followed by
+        the closing curly bracket
+    """
+    for found in CHUNK_PATTERN.finditer(code):
+        if found.group() == '{':
+            return f'{code[:found.end()]}}}'
+    return code
+
+
+def declare_signatures(signatures: List[Tuple[int, str]]
+                       ) -> Dict[int, List[Function]]:
+    """Declare functions of their signatures
+
+    Errors in signatures are left to the parse of the whole function.
+
+    Args:
+        signatures: buffer position and signature code of every function
+
+    Returns:
+        functions declaring a global name by its interned id, in code order
+    """
+    declarers: Dict[int, List[Function]] = {}
+    for start, code in signatures:
+        scope: GlobalScope = GlobalScope({}, start)
+        Parser(code, diagnostics=Diagnostics(),
+               table=SymbolTable(Scope('global', scope))).parse()
+        function: Function = Function(start, start, 1, b'', SyntaxTree(), [],
+                                      scope.declarations, set())
+        for key in scope.declarations:
+            declarers.setdefault(key, []).append(function)
+    return declarers
+
+
+# pylint: disable=too-many-arguments
+def _parse_function(declarers: Dict[int, List[Function]], code: str,
+                    start: int, line: int, mode: Mode, limit: int) -> Result:
+    """Parse one function with all functions declared
+
+    Args:
+        declarers: functions declaring a global name by its interned id
+        code: function code
+        start: buffer position of the function code
+        line: line number the function code starts at
+        mode: how nested grammar rules are run
+        limit: number of errors after which parsing stops
+
+    Returns:
+        syntax tree columns and errors of the function
+    """
+    diagnostics: Diagnostics = Diagnostics(limit)
+    scope: GlobalScope = GlobalScope(declarers, start, ahead=True)
+    tree: SyntaxTree = Parser(code, mode, diagnostics,
+                              SymbolTable(Scope('global', scope)),
+                              line).parse()
+    return tree.columns(), list(diagnostics)
+
+
+def _load_signatures(signatures: List[Tuple[int, str]]) -> None:
+    """Declare functions in a starting worker process
+
+    Args:
+        signatures: buffer position and signature code of every function
+    """
+    _WORKER_DECLARERS.clear()
+    _WORKER_DECLARERS.update(declare_signatures(signatures))
+
+
+def _parse_in_worker(code: str, start: int, line: int, mode: Mode,
+                     limit: int) -> Result:
+    """Parse one function in a worker process
+
+    Args:
+        code: function code
+        start: buffer position of the function code
+        line: line number the function code starts at
+        mode: how nested grammar rules are run
+        limit: number of errors after which parsing stops
+
+    Returns:
+        syntax tree columns and errors of the function
+    """
+    return _parse_function(_WORKER_DECLARERS, code, start, line, mode, limit)
+
+
+def _tokens(code: str, columns: Columns, offset: int) -> List[TokenType]:
+    """Create the tokens of syntax tree columns
+
+    Args:
+        code: program code
+        columns: syntax tree columns of a function
+        offset: buffer position of the function code
+
+    Returns:
+        tokens of the token table
+    """
+    _, _, _, _, token_kinds, starts, ends = columns
+    return [EOF if kind == kinds.EOF
+            else create_token(code, kind, start + offset, end + offset)
+            for kind, start, end in zip(token_kinds, starts, ends)]
+
+
+def parse_parallel(code: Source, workers: Union[int, None] = None,
+                   mode: Mode = Mode.RECURSIVE,
+                   diagnostics: Union[Diagnostics, None] = None,
+                   chunk_size: int = MIN_CHUNK_SIZE) -> SyntaxTree:
+    """Parse program code in two phases with multiple processes
+
+    Code too small for more than one worker is parsed in this process, in
+    the same two phases.
+
+    Args:
+        code: vega program code (path, file object, bytes or string)
+        workers: number of worker processes, number of CPUs by default
+        mode: how nested grammar rules are run
+        diagnostics: collector of all errors, None to raise the first
+        chunk_size: minimal size of code per worker
+
+    Returns:
+        syntax tree of the program code, its root is the block of all
+        functions
+
+    Raises:
+        BaseError: first error in code order if errors are not collected
+    """
+    code = load_source(code)
+    if workers is None:
+        workers = cpu_count() or 1
+    functions: List[Tuple[int, int, int]] = split_functions(code)
+    codes: List[str] = [code[start:end] for start, end, _ in functions]
+    starts: List[int] = [start for start, _, _ in functions]
+    lines: List[int] = [line for _, _, line in functions]
+    signatures: List[Tuple[int, str]] = [
+        (start, signature(function)) for start, function in zip(starts,
+                                                                 codes)]
+    limit: int = 1 if diagnostics is None else diagnostics.limit
+    processes: int = min(workers, len(code) // chunk_size)
+    results: List[Result]
+    if processes < 2:
+        declarers: Dict[int, List[Function]] = declare_signatures(signatures)
+        results = [_parse_function(declarers, function, start, line, mode,
+                                   limit)
+                   for function, start, line in zip(codes, starts, lines)]
+    else:
+        with ProcessPoolExecutor(processes, initializer=_load_signatures,
+                                 initargs=(signatures,)) as executor:
+            results = list(executor.map(
+                _parse_in_worker, codes, starts, lines, repeat(mode),
+                repeat(limit),
+                chunksize=max(1, len(codes) // (processes * 4))))
+
+    tree: SyntaxTree = SyntaxTree()
+    nodes: List[int] = []
+    line_index: LineIndex = LineIndex(code)
+    for start, (columns, errors) in zip(starts, results):
+        if errors and diagnostics is None:
+            raise errors[0].relocated(line_index, start)
+        for error in errors:
+            if diagnostics is not None and not diagnostics.full:
+                diagnostics.add(error.relocated(line_index, start))
+        nodes.extend(tree.graft(columns, _tokens(code, columns, start),
+                                start))
+    tree.add_node(Syntax.BLOCK, -1, nodes)
+    return tree
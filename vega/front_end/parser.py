@@ -1,30 +1,121 @@
 """Vega parser
 
 Check syntax of Vega program code. Return syntax errors on invalid syntax.
-Create AST for further code analysis.
+Create AST for further code analysis, stored as ``SyntaxTree`` arena.
+
+Grammar rules which nest other rules are generators: they yield the nested
+rule and receive its result. How nested rules are run depends on the mode:
+
+    RECURSIVE: every nested rule is run by a recursive call
+    STACK: nested rules are run from an explicit work stack, so nesting
+           depth is only limited by memory
+
+Both modes run the same rules, so they create the same syntax tree and
+raise the same errors.
+
+Errors are raised right away, unless the parser is given ``Diagnostics`` to
+collect them. A syntax error then puts the parser into panic mode: tokens
+are skipped up to the next delimiter, closing curly bracket, func or end of
+file. While panicking, matching tokens and checking identifiers are no-ops,
+so the rules unwind with the synchronizing token as lookahead. The
+statement loop leaves panic mode at a delimiter or closing curly bracket,
+the block at func. Tokens left behind the last function are skipped up
+to the next func, parsing goes on there. Parsing stops once the diagnostics
+are full.
 """
 
-from io import TextIOWrapper
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+from typing import Callable
+from typing import Generator
+from typing import Iterable
+from typing import List
 from typing import Tuple
 from typing import Union
 
+from vega.data_structs.line_index import LineIndex
 from vega.data_structs.symbol_table import Symbol
 from vega.data_structs.symbol_table import SymbolTable
+from vega.data_structs.syntax_tree import Syntax
+from vega.data_structs.syntax_tree import SyntaxTree
 from vega.data_structs.token_stream import TokenStream
+from vega.front_end.diagnostics import DEFAULT_LIMIT
+from vega.front_end.diagnostics import Diagnostics
+from vega.front_end.exception import BaseError
 from vega.front_end.exception import VegaAlreadyDefinedError
 from vega.front_end.exception import VegaNoCallableError
 from vega.front_end.exception import VegaNotAssignError
 from vega.front_end.exception import VegaNotYetDefinedError
 from vega.front_end.exception import VegaSyntaxError
 from vega.front_end.lexer import Lexer
-from vega.language.token import Tag
+from vega.front_end.source import Source
+from vega.language import kinds
+from vega.language.token import KINDS
 from vega.language.token import TokenType
 from vega.language.token import Word
 from vega.language.types import Array
 from vega.language.types import String
 from vega.language.types import Type
+from vega.language.vocabulary import EOF
 from vega.utils.data_types.lists import Queue
 
+# grammar rule: yields the rules it nests, receives their results and
+# returns its own result
+Rule = Generator[Any, Any, Any]
+
+
+class Mode(Enum):
+    """Parsing mode of the parser"""
+    RECURSIVE = 'recursive'
+    STACK = 'stack'
+
+
+# binding powers of binary operators, 0 for all other tokens
+SUM: int = 1
+PRODUCT: int = 2
+COMPARISON: int = 3
+
+
+def _binding_powers() -> List[int]:
+    """Build binding power table of binary operators
+
+    Returns:
+        binding power of every token kind
+    """
+    powers: List[int] = [0] * KINDS
+    for kind in (kinds.PLUS, kinds.MINUS, kinds.OR, kinds.BOOL_OR):
+        powers[kind] = SUM
+    for kind in (kinds.MULT, kinds.DIV, kinds.AND, kinds.BOOL_AND):
+        powers[kind] = PRODUCT
+    for kind in (kinds.EQ, kinds.NE, kinds.LE, kinds.GE, kinds.LESS,
+                 kinds.GREATER):
+        powers[kind] = COMPARISON
+    return powers
+
+
+BINDING_POWERS: List[int] = _binding_powers()
+
+# tokens ending panic mode after a syntax error
+SYNCHRONIZING: List[bool] = [False] * KINDS
+for _kind in (kinds.DELIMITER, kinds.RCURLY, kinds.FUNC, kinds.EOF):
+    SYNCHRONIZING[_kind] = True
+
+
+@dataclass
+class Parsed:
+    """Result of parsing one program code
+
+    Properties:
+        tree: SyntaxTree - syntax tree of the program code
+        diagnostics: Diagnostics - errors found in the program code
+
+    """
+    __slots__ = ('tree', 'diagnostics')
+
+    tree: SyntaxTree
+    diagnostics: Diagnostics
+
 
 # pylint: disable=too-few-public-methods
 class Parser:
@@ -34,19 +125,118 @@ class Parser:
 
     """
 
-    def __init__(self, code: TextIOWrapper) -> None:
+    # pylint: disable=too-many-arguments
+    def __init__(self, code: Source, mode: Mode = Mode.RECURSIVE,
+                 diagnostics: Union[Diagnostics, None] = None,
+                 table: Union[SymbolTable, None] = None,
+                 line: int = 1) -> None:
         """Init method
 
-        Call lexer on init of class and declare needed properties for parsing
+        Set up the lexer on init of class and declare needed properties for
+        parsing. Tokens are pulled from the lexer while parsing, so syntax
+        errors are raised before the whole program has been scanned.
 
         Args:
-            code: Vega program code file
+            code: Vega program code (path, file object, bytes or string)
+            mode: how nested grammar rules are run
+            diagnostics: collector of all errors, None to raise the first
+            table: symbol table to start with, a new one if None
+            line: line number the code starts at
         """
-        lexer: Lexer = Lexer(code)
-        self.__token_stream: TokenStream = lexer.scan()
+        self.__mode: Mode = mode
+        self.__run: Callable[[Rule], Any] = \
+            self.__run_recursive if mode is Mode.RECURSIVE \
+            else self.__run_stack
+        self.__table: SymbolTable = \
+            table if table is not None else SymbolTable()
+        self.__load(code, diagnostics, line)
+        # statements following an identifier by their second token
+        self.__id_statements: List[Union[Callable[[int], Rule], None]] = \
+            [None] * KINDS
+        self.__id_statements[kinds.COMMA] = \
+            self.__parse_declaration_statement
+        self.__id_statements[kinds.COLON] = \
+            self.__parse_declaration_statement
+        self.__id_statements[kinds.LARRAY] = self.__parse_assign_statement
+        self.__id_statements[kinds.ASSIGN] = self.__parse_assign_statement
+        self.__id_statements[kinds.LBRACKET] = self.__parse_func_call
+        # statements by the FIRST set of their rule
+        self.__statements: List[Union[Callable[[], Rule], None]] = \
+            [None] * KINDS
+        self.__statements[kinds.ID] = self.__parse_identifier_statement
+        self.__statements[kinds.RETURN] = self.__parse_return_statement
+        self.__statements[kinds.WHILE] = self.__parse_while_statement
+        self.__statements[kinds.IF] = self.__parse_if_statement
+        self.__statements[kinds.FUNC] = self.__parse_block
+        # loop control statements nest no rule
+        self.__loop_controls: List[bool] = [False] * KINDS
+        self.__loop_controls[kinds.BREAK] = True
+        self.__loop_controls[kinds.CONTINUE] = True
+        # terminal operands by their first token
+        self.__terminals: List[Union[Callable[[], int], None]] = \
+            [None] * KINDS
+        for kind in (kinds.NUM, kinds.REAL, kinds.TRUE, kinds.FALSE):
+            self.__terminals[kind] = self.__parse_word_terminal
+        self.__terminals[kinds.SQUOTE] = self.__parse_literal_terminal
+        self.__terminals[kinds.DQUOTE] = self.__parse_literal_terminal
+        # nested operands by their first token
+        self.__operands: List[Union[Callable[[], Rule], None]] = \
+            [None] * KINDS
+        self.__operands[kinds.ID] = self.__parse_identifier_operand
+        self.__operands[kinds.LBRACKET] = self.__parse_bracket_expression
+        self.__operands[kinds.LARRAY] = self.__parse_array_expression
+
+    def __load(self, code: Source, diagnostics: Union[Diagnostics, None],
+               line: int = 1) -> None:
+        """Load program code to parse
+
+        Reset everything that belongs to the parse of one program code.
+
+        Args:
+            code: Vega program code (path, file object, bytes or string)
+            diagnostics: collector of all errors, None to raise the first
+            line: line number the code starts at
+        """
+        self.__diagnostics: Union[Diagnostics, None] = diagnostics
+        self.__panic: bool = False
+        lexer: Lexer = Lexer(code, line=line)
+        self.__token_stream: TokenStream = TokenStream(lexer.spans())
+        self.__line_index: LineIndex = lexer.line_index
         self.__current_token: TokenType
-        self.__table: SymbolTable = SymbolTable()
         self.__line: int = 0
+        self.__span: Tuple[int, int] = (-1, -1)
+        self.__tree: SyntaxTree = SyntaxTree()
+
+    @classmethod
+    def parse_many(cls, sources: Iterable[Source],
+                   mode: Mode = Mode.RECURSIVE,
+                   limit: int = DEFAULT_LIMIT) -> List[Parsed]:
+        """Parse many program codes with one parser
+
+        The dispatch tables of the parser and the symbol table with its pool
+        of scopes are set up once and reused for all codes. The symbol table
+        is reset in between, so codes do not see symbols of each other.
+
+        Args:
+            sources: program codes (paths, file objects, bytes or strings)
+            mode: how nested grammar rules are run
+            limit: number of errors of one code after which parsing stops
+
+        Returns:
+            syntax tree and diagnostics of every code, in order of sources
+        """
+        results: List[Parsed] = []
+        parser: Union[Parser, None] = None
+        table: SymbolTable = SymbolTable()
+        for code in sources:
+            diagnostics: Diagnostics = Diagnostics(limit)
+            table.reset()
+            if parser is None:
+                parser = cls(code, mode, diagnostics, table)
+            else:
+                parser.__load(code, diagnostics)
+            results.append(Parsed(parser.parse(), diagnostics))
+        return results
 
     @staticmethod
     def __create_symbol(**kwargs) -> Symbol:
@@ -67,75 +257,225 @@ class Parser:
         identifier_type: Union[Type, None] = kwargs.pop('type')
         return Symbol(name, const, call_able, identifier_type)
 
-    def parse(self) -> None:
+    def parse(self) -> SyntaxTree:
         """Call parse method to start parsing
 
         Returns:
+            syntax tree of the program code, its root is the block of all
+            functions
+        """
+        self.__run(self.__parse_program())
+        return self.__tree
+
+    @property
+    def mode(self) -> Mode:
+        """Mode property
+
+        Returns:
+            parsing mode of the parser
+        """
+        return self.__mode
+
+    def __run_recursive(self, rule: Rule) -> Any:
+        """Run grammar rule, nested rules are run by recursive calls
 
+        Args:
+            rule: grammar rule
+
+        Returns:
+            result of the rule
+        """
+        value: Any = None
+        try:
+            while True:
+                value = self.__run_recursive(rule.send(value))
+        except StopIteration as stop:
+            return stop.value
+
+    @staticmethod
+    def __run_stack(rule: Rule) -> Any:
+        """Run grammar rule, nested rules are run from a work stack
+
+        The stack holds the suspended rules from the outermost to the
+        currently running one, so nesting is only limited by memory.
+
+        Args:
+            rule: grammar rule
+
+        Returns:
+            result of the rule
         """
-        self.__parse_block()
+        stack: List[Rule] = [rule]
+        value: Any = None
+        while stack:
+            try:
+                nested: Rule = stack[-1].send(value)
+            except StopIteration as stop:
+                stack.pop()
+                value = stop.value
+                continue
+            stack.append(nested)
+            value = None
+        return value
 
     def __get_token(self) -> Tuple[TokenType, int]:
-        """Retrieve token from token stream"""
-        return self.__token_stream.remove()
+        """Retrieve token from token stream
 
-    def __match(self, tag: Union[Tag, str]) -> None:
-        """Match given tag
+        The buffer positions of the token are kept for error reports. Behind
+        the last token the ``EOF`` sentinel is returned, located right
+        behind the last token.
+        """
+        if self.__token_stream.is_empty():
+            self.__span = (self.__span[1], self.__span[1])
+            return EOF, self.__line
+        token, line, start, end = self.__token_stream.remove_span()
+        self.__span = (start, end)
+        return token, line
 
-        Retrieve next token from token stream and set current token and line.
-        Then match current token against given tag.
+    def __located(self, error: BaseError) -> BaseError:
+        """Locate error at the current token
 
         Args:
-            tag: to match for
+            error: error to locate
 
         Returns:
-            True if tag matches against current token tag, False otherwise
+            error with source snippet
+        """
+        start, end = self.__span
+        if start >= 0:
+            error.locate(self.__line_index, start, end)
+        return error
+
+    def __report(self, error: BaseError) -> None:
+        """Report error at the current token
+
+        Without diagnostics the error is raised. Otherwise it is collected
+        and parsing goes on. Once the diagnostics are full, the token stream
+        is closed, so parsing ends in panic mode without scanning the rest
+        of the code.
+
+        Args:
+            error: error to report
+
+        Raises:
+            BaseError: if errors are not collected
+        """
+        error = self.__located(error)
+        diagnostics: Union[Diagnostics, None] = self.__diagnostics
+        if diagnostics is None:
+            raise error
+        diagnostics.add(error)
+        if diagnostics.full:
+            self.__panic = True
+            self.__token_stream.close()
+
+    def __syntax_error(self) -> None:
+        """Report syntax error at the current token and enter panic mode
+
+        Tokens are skipped up to the next synchronizing token. A current
+        synchronizing token is put back, so it can end panic mode.
+
+        Raises:
+            VegaSyntaxError: if errors are not collected
         """
+        error: VegaSyntaxError = VegaSyntaxError(self.__current_token,
+                                                 self.__token_stream.peek(),
+                                                 self.__line)
+        token_stream: TokenStream = self.__token_stream
+        self.__panic = True
+        if SYNCHRONIZING[self.__current_token.kind] \
+                and self.__current_token is not EOF:
+            token_stream.restore()
+        self.__report(error)
+        while not SYNCHRONIZING[token_stream.peek_kind()]:
+            token_stream.remove_span()
+
+    def __synchronize(self, kind: int) -> int:
+        """Leave panic mode at a synchronizing token
+
+        A delimiter ends the erroneous statement, it is skipped. A closing
+        curly bracket is left to the enclosing scope. Func and end of file
+        are left to the block, panic mode goes on until then.
+
+        Args:
+            kind: kind of the next token, a synchronizing token
+
+        Returns:
+            kind of the next token after synchronizing, end of file while
+            still panicking, so no statement starts with it
+        """
+        if kind == kinds.DELIMITER:
+            self.__token_stream.remove_span()
+            self.__panic = False
+            return self.__token_stream.peek_kind()
+        if kind == kinds.RCURLY:
+            self.__panic = False
+            return kind
+        return kinds.EOF
+
+    def __match(self, kind: int) -> None:
+        """Match given token kind
+
+        Retrieve next token from token stream and set current token and line.
+        Then match current token against given kind. Nothing is matched in
+        panic mode.
+
+        Args:
+            kind: token kind to match for
+
+        Raises:
+            VegaSyntaxError: if the current token is of another kind
+        """
+        if self.__panic:
+            return
         self.__current_token, self.__line = self.__get_token()
-        if not self.__current_token.tag == tag:
-            raise VegaSyntaxError(self.__current_token,
-                                  self.__token_stream.head.data.token,
-                                  self.__line)
+        if self.__current_token.kind != kind:
+            self.__syntax_error()
 
-    def __lookahead(self, tag: Union[Tag, str]) -> bool:
-        """Look one token ahead on token stream
+    def __lookahead(self, kind: int, ahead: int = 0) -> bool:
+        """Look ahead on token stream
 
         Args:
-            tag: tag to look for
+            kind: token kind to look for
+            ahead: number of tokens to skip, 0 for the next token
 
         Returns:
-            True if tag is found, otherwise False
+            True if kind is found, otherwise False
         """
-        try:
-            return self.__token_stream.head.data.token.tag == tag
-        except AttributeError:
-            return False
+        return self.__token_stream.peek_kind(ahead) == kind
 
-    def __lookup_symbol(self, name: str) -> bool:
+    def __lookup_symbol(self, name: int) -> bool:
         """Lookup name in data_structs table
 
         Search for given identifier name in data_structs table
 
         Args:
-            name: identifier name
+            name: interned id of the identifier name
 
         Returns:
             True if identifier name is found, false otherwise
         """
         return self.__table.lookup(name)
 
-    def __retrieve_symbol(self, identifier: Word) -> Tuple[Symbol, str]:
+    def __retrieve_symbol(self, identifier: Word) -> Union[Symbol, None]:
         """Retrieve symbol from table
 
         Args:
             identifier: identifier
 
         Returns:
-            symbol or none if not found
+            symbol or none if not found or in panic mode
+
+        Raises:
+            VegaNotYetDefinedError: if not found and errors are not collected
         """
-        if self.__lookup_symbol(identifier.lexeme):
-            return self.__table.retrieve(identifier.lexeme)
-        raise VegaNotYetDefinedError(identifier.lexeme, self.__line)
+        if self.__panic:
+            return None
+        if self.__lookup_symbol(identifier.id):
+            symbol, _ = self.__table.retrieve(identifier.id)
+            return symbol
+        self.__report(VegaNotYetDefinedError(identifier.lexeme, self.__line))
+        return None
 
     def __new_scope(self, scope_name) -> None:
         """Create new scope in hashtable
@@ -163,7 +503,8 @@ class Parser:
             symbol: symbol to store
 
         """
-        self.__table.store(symbol)
+        if not self.__panic:
+            self.__table.store(symbol)
 
     def __identifier_declared(self, identifier: Word) -> Symbol:
         """Recognize identifier
@@ -176,86 +517,159 @@ class Parser:
 
         Returns:
             symbol to be stored in symbol table
+
+        Raises:
+            VegaAlreadyDefinedError: if declared and errors are not collected
         """
-        if not self.__lookup_symbol(identifier.lexeme):
-            symbol: Symbol = self.__create_symbol(
-                name=identifier.lexeme,
-                const=False,
-                callable=False,
-                type=None)
-            return symbol
-        raise VegaAlreadyDefinedError(identifier, self.__line)
+        if self.__panic:
+            return self.__create_symbol(name='', const=False, callable=False,
+                                        type=None)
+        if self.__lookup_symbol(identifier.id):
+            self.__report(VegaAlreadyDefinedError(identifier, self.__line))
+        symbol: Symbol = self.__create_symbol(
+            name=identifier.lexeme,
+            const=False,
+            callable=False,
+            type=None)
+        return symbol
+
+    def __token_index(self) -> int:
+        """Add current token to the token table of the syntax tree
+
+        Returns:
+            token index
+        """
+        start, end = self.__span
+        return self.__tree.add_token(self.__current_token, start, end)
+
+    def __parse_program(self) -> Rule:
+        """Parse program code
+
+        program
+            :   block EOF
+            ;
+
+        Tokens in front of or behind the functions are a syntax error.
+        While errors are collected, the tokens are skipped up to the next
+        func and the functions from there on are parsed into the same block.
 
-    def __parse_block(self) -> None:
+        Returns:
+            block node
+        """
+        token_stream: TokenStream = self.__token_stream
+        functions: List[int] = []
+        while True:
+            if self.__lookahead(kinds.FUNC) \
+                    or not functions and self.__lookahead(kinds.EOF):
+                self.__panic = False
+                functions.extend((yield self.__parse_functions()))
+            if self.__lookahead(kinds.EOF):
+                break
+            self.__match(kinds.EOF)
+            self.__panic = True
+            while token_stream.peek_kind() not in (kinds.FUNC, kinds.EOF):
+                token_stream.remove_span()
+        return self.__tree.add_node(Syntax.BLOCK, -1, functions)
+
+    def __parse_block(self) -> Rule:
         """Parse block statements
 
         block
             :   (FUNC ID LBRACKET functionParameterDeclaration? RBRACKET
-            RETURN_TYPE functionReturnType scopeStatement)+ EOF
+            RETURN_TYPE functionReturnType scopeStatement)+
         ;
 
         Returns:
-
+            block node
         """
+        functions: List[int] = yield self.__parse_functions()
+        return self.__tree.add_node(Syntax.BLOCK, -1, functions)
 
+    def __parse_functions(self) -> Rule:
+        """Parse the functions of a block
+
+        Returns:
+            function nodes
+        """
+        functions: List[int] = []
         loop_control: bool = True
         while loop_control:
 
-            self.__match(Tag.FUNC)
-            self.__match(Tag.ID)
+            self.__match(kinds.FUNC)
+            self.__match(kinds.ID)
+            name: int = self.__token_index()
             symbol: Symbol = self.__identifier_declared(
                 self.__current_token)
             symbol.callable = True
             self.__store_symbol(symbol)
             self.__new_scope(symbol.name)
-            self.__match('(')
-            if self.__lookahead(Tag.ID):
-                self.__parse_function_param_declaration()
-            self.__match(')')
-            self.__match(Tag.RETURN_TYPE)
-            self.__parse_function_return_type(symbol)
-            self.__parse_scope_statement(symbol.name)
+            parameters: List[int] = []
+            self.__match(kinds.LBRACKET)
+            if self.__lookahead(kinds.ID):
+                parameters = yield self.__parse_function_param_declaration()
+            self.__match(kinds.RBRACKET)
+            self.__match(kinds.RETURN_TYPE)
+            return_type: int = self.__parse_function_return_type(symbol)
+            scope: int = yield self.__parse_scope_statement(symbol.name)
             self.__leave_scope()
+            functions.append(self.__tree.add_node(
+                Syntax.FUNCTION, name, parameters + [return_type, scope]))
 
-            if not self.__lookahead(Tag.FUNC):
+            if self.__panic and self.__lookahead(kinds.FUNC):
+                self.__panic = False
+            if not self.__lookahead(kinds.FUNC):
                 loop_control = False
 
-    def __parse_function_param_declaration(self) -> None:
+        return functions
+
+    def __parse_function_param_declaration(self) -> Rule:
         """Parse function parameter declaration statements
 
         functionParameterDeclaration
             :   functionParameterDefinition (COMMA
             functionParameterDefinition)*
             ;
+
+        Returns:
+            parameter nodes
         """
+        parameters: List[int] = []
         loop_control: bool = True
         while loop_control:
-            self.__parse_function_param_definition()
+            parameters.append((yield self.__parse_function_param_definition()))
 
-            if self.__lookahead(','):
-                self.__match(',')
+            if self.__lookahead(kinds.COMMA):
+                self.__match(kinds.COMMA)
             else:
                 loop_control = False
+        return parameters
 
-    def __parse_function_param_definition(self) -> None:
+    def __parse_function_param_definition(self) -> Rule:
         """parse function parameter definitions
 
         functionParameterDefinition
             :   ID COLON variableTypes (ASSIGN expression)?
             ;
+
+        Returns:
+            parameter node
         """
         # ID COLON variableTypes
-        self.__match(Tag.ID)
+        self.__match(kinds.ID)
+        name: int = self.__token_index()
         symbol: Symbol = self.__identifier_declared(self.__current_token)
-        self.__match(':')
-        self.__parse_variable_type(symbol)
+        self.__match(kinds.COLON)
+        variable_type: int = self.__parse_variable_type(symbol)
 
         # (ASSIGN expression)?
-        if self.__lookahead('='):
-            self.__match('=')
-            self.__parse_expression()
-
-    def __parse_variable_type(self, symbol: Symbol) -> None:
+        value: int = -1
+        if self.__lookahead(kinds.ASSIGN):
+            self.__match(kinds.ASSIGN)
+            value = yield self.__parse_expression()
+        return self.__tree.add_node(Syntax.PARAMETER, name,
+                                    (variable_type, value))
+
+    def __parse_variable_type(self, symbol: Symbol) -> int:
         """parse terminal variable types for variable definition
 
         variableTypes
@@ -268,20 +682,25 @@ class Parser:
             symbol: identifier symbol
 
         Returns:
-
+            type node
         """
-        symbol: Symbol = self.__parse_terminal_variable_types(symbol)
-
-        while self.__lookahead('['):
-            self.__match('[')
-            self.__match(Tag.NUM)
-            self.__match(']')
-            array: Array = Array(symbol.type)
-            symbol.type = array
+        type_token: int = self.__parse_terminal_variable_types(symbol)
+
+        dimensions: List[int] = []
+        while self.__lookahead(kinds.LARRAY):
+            self.__match(kinds.LARRAY)
+            self.__match(kinds.NUM)
+            dimensions.append(self.__tree.add_node(Syntax.DIMENSION,
+                                                   self.__token_index()))
+            self.__match(kinds.RARRAY)
+            if not self.__panic and symbol.type is not None:
+                array: Array = Array(symbol.type)
+                symbol.type = array
 
         self.__store_symbol(symbol)
+        return self.__tree.add_node(Syntax.TYPE, type_token, dimensions)
 
-    def __parse_function_return_type(self, symbol: Symbol) -> None:
+    def __parse_function_return_type(self, symbol: Symbol) -> int:
         """Parse fucntion return types
 
         functionReturnType
@@ -292,20 +711,24 @@ class Parser:
             symbol: identifier symbol
 
         Returns:
-
+            type node
         """
 
-        symbol: Symbol = self.__parse_terminal_variable_types(symbol)
+        type_token: int = self.__parse_terminal_variable_types(symbol)
 
-        while self.__lookahead('['):
-            self.__match('[')
-            self.__match(']')
-            array: Array = Array(symbol.type)
-            symbol.type = array
+        dimensions: List[int] = []
+        while self.__lookahead(kinds.LARRAY):
+            self.__match(kinds.LARRAY)
+            self.__match(kinds.RARRAY)
+            dimensions.append(self.__tree.add_node(Syntax.DIMENSION))
+            if not self.__panic and symbol.type is not None:
+                array: Array = Array(symbol.type)
+                symbol.type = array
 
         self.__store_symbol(symbol)
+        return self.__tree.add_node(Syntax.TYPE, type_token, dimensions)
 
-    def __parse_terminal_variable_types(self, symbol) -> Symbol:
+    def __parse_terminal_variable_types(self, symbol) -> int:
         """Parse basic variable type terminal
 
         terminalVariableType
@@ -320,21 +743,23 @@ class Parser:
             symbol: symbol to set variable type for
 
         Returns:
-            symbol with defined basic variable type
+            token index of the variable type, -1 if there is none
         """
         # INT_TYPE | FLOAT_TYPE | CHAR_TYPE | BOOL_TYPE
-        if self.__lookahead(Tag.BASIC):
-            self.__match(Tag.BASIC)
+        if self.__lookahead(kinds.BASIC):
+            self.__match(kinds.BASIC)
             symbol.type = self.__current_token
         # STRING_TYPE
-        elif self.__lookahead(Tag.TYPE):
-            self.__match(Tag.TYPE)
+        elif self.__lookahead(kinds.TYPE):
+            self.__match(kinds.TYPE)
             if self.__current_token.lexeme == 'str':
                 symbol.type = String()
+        else:
+            return -1
 
-        return symbol
+        return self.__token_index()
 
-    def __parse_scope_statement(self, scope_name: str) -> None:
+    def __parse_scope_statement(self, scope_name: str) -> Rule:
         """Enter new scope
 
         Create new scope for statements
@@ -344,15 +769,17 @@ class Parser:
             ;
 
         Returns:
-
+            scope node
         """
-        self.__match('{')
+        self.__match(kinds.LCURLY)
+        scope: int = self.__token_index()
         self.__new_scope(scope_name)
-        self.__parse_statement()
-        self.__match('}')
+        statements: List[int] = yield self.__parse_statement()
+        self.__match(kinds.RCURLY)
         self.__leave_scope()
+        return self.__tree.add_node(Syntax.SCOPE, scope, statements)
 
-    def __parse_statement(self) -> None:
+    def __parse_statement(self) -> Rule:
         """Parse statements
 
         statement
@@ -366,48 +793,57 @@ class Parser:
         |   PASS DELIMITER
         ;
 
-        Returns:
+        The kind of the next token selects the only statement which can
+        start with it. Statements end at the first token no statement
+        starts with, which is left to the enclosing scope.
 
+        Returns:
+            statement nodes
         """
 
-        loop_control: bool = True
-
-        if self.__lookahead(Tag.PASS):
-            self.__match(Tag.PASS)
-            self.__match(';')
-            loop_control = False
-
-        while loop_control:
-
-            self.__parse_identifier_statement()
-            self.__parse_return_statement()
-            self.__parse_loop_control_statements(Tag.BREAK)
-            self.__parse_loop_control_statements(Tag.CONTINUE)
-            self.__parse_while_statement()
-            self.__parse_if_statement()
-
-            if self.__lookahead(Tag.FUNC):
-                self.__parse_block()
-
-            elif self.__lookahead('}'):
-                loop_control = False
-
-    def __parse_loop_control_statements(self, tag: Tag) -> None:
+        if self.__lookahead(kinds.PASS):
+            self.__match(kinds.PASS)
+            statement_pass: int = self.__tree.add_node(Syntax.PASS,
+                                                       self.__token_index())
+            self.__match(kinds.DELIMITER)
+            return [statement_pass]
+
+        nodes: List[int] = []
+        statements: List[Union[Callable[[], Rule], None]] = \
+            self.__statements
+        loop_controls: List[bool] = self.__loop_controls
+        peek_kind: Callable[[], int] = self.__token_stream.peek_kind
+        kind: int = peek_kind()
+        if self.__panic:
+            kind = self.__synchronize(kind)
+        statement: Union[Callable[[], Rule], None] = statements[kind]
+        while statement is not None or loop_controls[kind]:
+            if statement is None:
+                nodes.append(self.__parse_loop_control_statement())
+            else:
+                nodes.append((yield statement()))
+            kind = peek_kind()
+            if self.__panic:
+                kind = self.__synchronize(kind)
+            statement = statements[kind]
+        return nodes
+
+    def __parse_loop_control_statement(self) -> int:
         """Utility function for loop control statements
 
         Parse loop control statements like continue or break
 
-        Args:
-            tag: to lookahead for decision making on statements
-
         Returns:
-
+            break or continue node
         """
-        if self.__lookahead(tag):
-            self.__match(tag)
-            self.__match(';')
-
-    def __parse_identifier_statement(self) -> None:
+        self.__match(self.__token_stream.peek_kind())
+        node: int = self.__tree.add_node(
+            Syntax.BREAK if self.__current_token.kind == kinds.BREAK
+            else Syntax.CONTINUE, self.__token_index())
+        self.__match(kinds.DELIMITER)
+        return node
+
+    def __parse_identifier_statement(self) -> Rule:
         """Identifier statement
 
         Declare a one or multiple identifiers, assign to a identifier
@@ -418,24 +854,21 @@ class Parser:
         ;
 
         Returns:
-
+            declaration, assignment or call node
         """
-        if self.__lookahead(Tag.ID):
-            self.__match(Tag.ID)
-            # declarationStatement
-            if self.__lookahead(',') or self.__lookahead(':'):
-                self.__parse_declaration_statement()
-            # assignStatement
-            elif self.__lookahead('[') or self.__lookahead('='):
-                self.__parse_assign_statement()
-            # funcCall
-            elif self.__lookahead('('):
-                self.__parse_func_call()
-            else:
-                return
-            self.__match(';')
-
-    def __parse_declaration_statement(self) -> None:
+        # the token behind the identifier decides the statement
+        statement: Union[Callable[[int], int], None] = \
+            self.__id_statements[self.__token_stream.peek_kind(1)]
+        self.__match(kinds.ID)
+        if statement is None:
+            self.__syntax_error()
+            return -1
+        node: int = yield statement(self.__tree.add_node(
+            Syntax.NAME, self.__token_index()))
+        self.__match(kinds.DELIMITER)
+        return node
+
+    def __parse_declaration_statement(self, name: int) -> Rule:
         """Declare new variables
 
         Can be declaration statement or declaration and assignment.
@@ -450,34 +883,44 @@ class Parser:
         :   (COMMA ID)* COLON (CONST)? variableType (ASSIGN expression)?
         ;
 
-        Returns:
+        Args:
+            name: name node of the first identifier
 
+        Returns:
+            declaration node
         """
 
         symbol_queue: Queue = Queue()
         const_flag: bool = False
         first_identifier: Word = self.__current_token
         symbol_queue.add(self.__identifier_declared(first_identifier))
+        children: List[int] = [name]
 
         # (COMMA ID)*
-        while self.__lookahead(','):
-            self.__match(',')
-            self.__match(Tag.ID)
+        while self.__lookahead(kinds.COMMA):
+            self.__match(kinds.COMMA)
+            self.__match(kinds.ID)
+            children.append(self.__tree.add_node(Syntax.NAME,
+                                                 self.__token_index()))
             symbol_queue.add(self.__identifier_declared(
                 self.__current_token))
 
         # COLON (CONST)?
-        self.__match(':')
-        if self.__lookahead(Tag.CONST):
-            self.__match(Tag.CONST)
+        self.__match(kinds.COLON)
+        declaration: int = self.__token_index()
+        if self.__lookahead(kinds.CONST):
+            self.__match(kinds.CONST)
+            children.append(self.__tree.add_node(Syntax.CONST,
+                                                 self.__token_index()))
             const_flag = True
 
         symbol: Symbol = symbol_queue.remove()
         symbol.const = const_flag
-        self.__parse_variable_type(symbol)
+        children.append(self.__parse_variable_type(symbol))
 
-        symbol, _ = self.__retrieve_symbol(first_identifier)
-        symbol_type: Type = symbol.type
+        symbol = self.__retrieve_symbol(first_identifier)
+        symbol_type: Union[Type, None] = \
+            symbol.type if symbol is not None else None
 
         # variableType
         while not symbol_queue.is_empty():
@@ -487,48 +930,64 @@ class Parser:
             self.__store_symbol(symbol)
 
         # (ASSIGN expression)?
-        if self.__lookahead('='):
-            self.__match('=')
-            self.__parse_expression()
+        if self.__lookahead(kinds.ASSIGN):
+            self.__match(kinds.ASSIGN)
+            children.append((yield self.__parse_expression()))
+
+        return self.__tree.add_node(Syntax.DECLARATION, declaration,
+                                    children)
 
-    def __parse_assign_statement(self) -> None:
+    def __parse_assign_statement(self, name: int) -> Rule:
         """Assign expression to identifier or array element
 
         assignStatement
             :   (arrayAccess)? ASSIGN expression
             ;
 
-        Returns:
+        Args:
+            name: name node of the identifier
 
+        Returns:
+            assignment node
         """
 
-        symbol: Symbol
-        symbol, _ = self.__retrieve_symbol(self.__current_token)
-
-        if symbol.callable or symbol.const:
-            raise VegaNotAssignError(self.__current_token, self.__line)
+        symbol: Union[Symbol, None] = self.__retrieve_symbol(
+            self.__current_token)
+        if symbol is not None and (symbol.callable or symbol.const):
+            self.__report(VegaNotAssignError(self.__current_token,
+                                             self.__line))
 
-        self.__parse_array_access()
+        target: int = yield self.__parse_array_access(name)
 
-        self.__match('=')
-        self.__parse_expression()
+        self.__match(kinds.ASSIGN)
+        assignment: int = self.__token_index()
+        value: int = yield self.__parse_expression()
+        return self.__tree.add_node(Syntax.ASSIGNMENT, assignment,
+                                    (target, value))
 
-    def __parse_array_access(self) -> None:
+    def __parse_array_access(self, name: int) -> Rule:
         """Access element in array
 
         arrayAccess
             :   LARRAY expression RARRAY
             ;
 
-        Returns:
+        Args:
+            name: name node of the array
 
+        Returns:
+            index node, the name node without array access
         """
-        if self.__lookahead('['):
-            self.__match('[')
-            self.__parse_expression()
-            self.__match(']')
-
-    def __parse_func_call(self) -> None:
+        if self.__lookahead(kinds.LARRAY):
+            self.__match(kinds.LARRAY)
+            index: int = self.__token_index()
+            position: int = yield self.__parse_expression()
+            self.__match(kinds.RARRAY)
+            return self.__tree.add_node(Syntax.INDEX, index,
+                                        (name, position))
+        return name
+
+    def __parse_func_call(self, name: int) -> Rule:
         """Call function
 
         Verify if identifier is declared and callable
@@ -537,25 +996,32 @@ class Parser:
             :   LBRACKET ( expression (COMMA expression)*)? RBRACKET
             ;
 
-        Returns:
+        Args:
+            name: name node of the function
 
+        Returns:
+            call node
         """
 
-        symbol: Symbol
-        symbol, _ = self.__retrieve_symbol(self.__current_token)
-        if not symbol.callable:
-            raise VegaNoCallableError(self.__current_token, self.__line)
-        self.__match('(')
-        if not self.__lookahead(')'):
-            self.__parse_expression()
+        symbol: Union[Symbol, None] = self.__retrieve_symbol(
+            self.__current_token)
+        if symbol is not None and not symbol.callable:
+            self.__report(VegaNoCallableError(self.__current_token,
+                                              self.__line))
+        self.__match(kinds.LBRACKET)
+        call: int = self.__token_index()
+        children: List[int] = [name]
+        if not self.__lookahead(kinds.RBRACKET):
+            children.append((yield self.__parse_expression()))
 
             # (COMMA expression)*
-            while self.__lookahead(','):
-                self.__match(',')
-                self.__parse_expression()
-        self.__match(')')
+            while self.__lookahead(kinds.COMMA):
+                self.__match(kinds.COMMA)
+                children.append((yield self.__parse_expression()))
+        self.__match(kinds.RBRACKET)
+        return self.__tree.add_node(Syntax.CALL, call, children)
 
-    def __parse_return_statement(self) -> None:
+    def __parse_return_statement(self) -> Rule:
         """Return expression to caller
 
         returnStatement
@@ -563,14 +1029,16 @@ class Parser:
             ;
 
         Returns:
-
+            return node
         """
-        if self.__lookahead(Tag.RETURN):
-            self.__match(Tag.RETURN)
-            self.__parse_expression()
-            self.__match(';')
-
-    def __parse_while_statement(self) -> None:
+        self.__match(kinds.RETURN)
+        statement_return: int = self.__token_index()
+        value: int = yield self.__parse_expression()
+        self.__match(kinds.DELIMITER)
+        return self.__tree.add_node(Syntax.RETURN, statement_return,
+                                    (value,))
+
+    def __parse_while_statement(self) -> Rule:
         """while loop
 
         whileStatement
@@ -578,13 +1046,15 @@ class Parser:
             ;
 
         Returns:
-
+            while node
         """
-        if self.__lookahead(Tag.WHILE):
-            self.__match(Tag.WHILE)
-            self.__parse_conditional_scope('WHILE')
+        self.__match(kinds.WHILE)
+        statement_while: int = self.__token_index()
+        condition, scope = yield self.__parse_conditional_scope('WHILE')
+        return self.__tree.add_node(Syntax.WHILE, statement_while,
+                                    (condition, scope))
 
-    def __parse_if_statement(self) -> None:
+    def __parse_if_statement(self) -> Rule:
         """if clause
 
         ifStatement
@@ -594,25 +1064,35 @@ class Parser:
             ;
 
         Returns:
-
+            if node with the elif and else nodes following condition and
+            scope
         """
 
         #  IF conditionalScope
-        if self.__lookahead(Tag.IF):
-            self.__match(Tag.IF)
-            self.__parse_conditional_scope('IF')
+        self.__match(kinds.IF)
+        statement_if: int = self.__token_index()
+        children: List[int] = list((yield self.__parse_conditional_scope(
+            'IF')))
 
         # (ELIF conditionalScope)*
-        while self.__lookahead(Tag.ELIF):
-            self.__match(Tag.ELIF)
-            self.__parse_conditional_scope('ELIF')
+        while self.__lookahead(kinds.ELIF):
+            self.__match(kinds.ELIF)
+            statement_elif: int = self.__token_index()
+            condition, scope = yield self.__parse_conditional_scope('ELIF')
+            children.append(self.__tree.add_node(
+                Syntax.ELIF, statement_elif, (condition, scope)))
 
         #  (ELSE scopeStatement)?
-        if self.__lookahead(Tag.ELSE):
-            self.__match(Tag.ELSE)
-            self.__parse_scope_statement('ELSE')
+        if self.__lookahead(kinds.ELSE):
+            self.__match(kinds.ELSE)
+            statement_else: int = self.__token_index()
+            scope = yield self.__parse_scope_statement('ELSE')
+            children.append(self.__tree.add_node(Syntax.ELSE,
+                                                 statement_else, (scope,)))
+
+        return self.__tree.add_node(Syntax.IF, statement_if, children)
 
-    def __parse_conditional_scope(self, scope_name: str) -> None:
+    def __parse_conditional_scope(self, scope_name: str) -> Rule:
         """conditional scope
 
         conditionalScope
@@ -620,139 +1100,91 @@ class Parser:
             ;
 
         Returns:
-
+            condition and scope node
         """
-        self.__match('(')
-        self.__parse_expression()
-        self.__match(')')
-        self.__parse_scope_statement(scope_name)
+        self.__match(kinds.LBRACKET)
+        condition: int = yield self.__parse_expression()
+        self.__match(kinds.RBRACKET)
+        scope: int = yield self.__parse_scope_statement(scope_name)
+        return condition, scope
 
-    def __parse_expression(self) -> None:
+    def __parse_expression(self, power: int = 0) -> Rule:
         """expressions
 
         expression
             :   term (PLUS term | MINUS term | OR term)*
             ;
-
-        Returns:
-
-        """
-
-        # term
-        self.__parse_term()
-
-        # (PLUS term | MINUS term | OR term)*
-        while self.__parse_expression_operands():
-            self.__parse_term()
-
-    def __parse_expression_operands(self) -> bool:
-        """parse expression operands
-
-        Returns:
-            true on match, false otherwise
-        """
-        if self.__lookahead('+'):
-            self.__match('+')
-            return True
-        if self.__lookahead('-'):
-            self.__match('-')
-            return True
-        if self.__lookahead(Tag.OR):
-            self.__match(Tag.OR)
-            return True
-        if self.__lookahead(Tag.BOOL_OR):
-            self.__match(Tag.BOOL_OR)
-            return True
-        return False
-
-    def __parse_term(self) -> None:
-        """terms
-
         term
             :	factor (MULT factor | DIV factor| AND factor)*
             ;
-
-        Returns:
-
-        """
-        # factor
-        self.__parse_factor()
-
-        # (MULT factor | DIV factor| AND factor)*
-        while self.__parse_term_operands():
-            self.__parse_factor()
-
-    def __parse_term_operands(self) -> bool:
-        """parse term operands
-
-        Returns:
-            true if operand matches, false otherwise
-
-        """
-        if self.__lookahead('*'):
-            self.__match('*')
-            return True
-        if self.__lookahead('/'):
-            self.__match('/')
-            return True
-        if self.__lookahead(Tag.AND):
-            self.__match(Tag.AND)
-            return True
-        if self.__lookahead(Tag.BOOL_AND):
-            self.__match(Tag.BOOL_AND)
-            return True
-        return False
-
-    def __parse_factor(self) -> None:
-        """factors
-
         factor
             :   NOT? MINUS? unary (comparisonOperator unary)*
             ;
 
-        Returns:
-
-        """
+        Operator precedence parsing: binary operators bind by their entry
+        in ``BINDING_POWERS``. Operators binding tighter than ``power`` are
+        parsed here, all others are left to the caller. Every call starts a
+        factor, comparisons are followed by a plain unary.
 
-        # (MINUS | NOT) unary
-        if self.__lookahead(Tag.NOT):
-            self.__match(Tag.NOT)
-        if self.__lookahead('-'):
-            self.__match('-')
-        self.__parse_unary()
+        MINUS negates the unary, NOT the comparisons of the factor.
 
-        # unary (comparisonOperator unary)*
-        while self.__parse_unary_operands():
-            self.__parse_unary()
-
-    # pylint: disable=R0911
-    def __parse_unary_operands(self) -> bool:
-        """parse unary operands
+        Args:
+            power: binding power of the operator in front of the expression
 
         Returns:
-            true on match, false otherwise
+            expression node, -1 for an empty expression
         """
-        if self.__lookahead(Tag.EQ):
-            self.__match(Tag.EQ)
-            return True
-        if self.__lookahead(Tag.NE):
-            self.__match(Tag.NE)
-            return True
-        if self.__lookahead(Tag.GE):
-            self.__match(Tag.GE)
-            return True
-        if self.__lookahead(Tag.LE):
-            self.__match(Tag.LE)
-            return True
-        if self.__lookahead('>'):
-            self.__match('>')
-            return True
-        if self.__lookahead('<'):
-            self.__match('<')
-            return True
-        return False
-
-    def __parse_unary(self) -> None:
+        tree: SyntaxTree = self.__tree
+        peek_kind: Callable[[], int] = self.__token_stream.peek_kind
+        terminals: List[Union[Callable[[], int], None]] = self.__terminals
+
+        # NOT? MINUS?
+        negation: int = -1
+        if peek_kind() == kinds.NOT:
+            self.__match(kinds.NOT)
+            negation = self.__token_index()
+        minus: int = -1
+        if peek_kind() == kinds.MINUS:
+            self.__match(kinds.MINUS)
+            minus = self.__token_index()
+
+        # unary, terminals are parsed right away
+        kind: int = peek_kind()
+        terminal: Union[Callable[[], int], None] = terminals[kind]
+        if terminal is None:
+            left: int = yield self.__parse_unary()
+        else:
+            left = terminal()
+        if minus >= 0:
+            left = tree.add_node(Syntax.UNARY, minus, (left,))
+
+        # (comparisonOperator unary)*
+        kind = peek_kind()
+        right: int = BINDING_POWERS[kind]
+        while right == COMPARISON:
+            self.__match(kind)
+            operator: int = self.__token_index()
+            terminal = terminals[peek_kind()]
+            if terminal is None:
+                operand: int = yield self.__parse_unary()
+            else:
+                operand = terminal()
+            left = tree.add_node(Syntax.BINARY, operator, (left, operand))
+            kind = peek_kind()
+            right = BINDING_POWERS[kind]
+        if negation >= 0:
+            left = tree.add_node(Syntax.UNARY, negation, (left,))
+
+        while right > power:
+            self.__match(kind)
+            operator = self.__token_index()
+            operand = yield self.__parse_expression(right)
+            left = tree.add_node(Syntax.BINARY, operator, (left, operand))
+            kind = peek_kind()
+            right = BINDING_POWERS[kind]
+        return left
+
+    def __parse_unary(self) -> Rule:
         """unaries
 
         unary
@@ -763,75 +1195,83 @@ class Parser:
             |   LARRAY (expression (COMMA expression)*)? RARRAY
             ;
 
+        The next token selects the operand. A token no operand starts with
+        is left to the caller.
+
         Returns:
+            operand node, -1 if there is no operand
         """
+        kind: int = self.__token_stream.peek_kind()
+        terminal: Union[Callable[[], int], None] = self.__terminals[kind]
+        if terminal is not None:
+            return terminal()
+        operand: Union[Callable[[], Rule], None] = self.__operands[kind]
+        if operand is None:
+            return -1
+        return (yield operand())
+
+    def __parse_identifier_operand(self) -> Rule:
+        """parse identifiers with optional array access or function call
 
-        # terminal
-        if self.__parse_word_terminals():
-            return
-        if self.__parse_literal_terminal():
-            return
+        Returns:
+            name, index or call node
+        """
+        self.__match(kinds.ID)
+        name: int = self.__tree.add_node(Syntax.NAME, self.__token_index())
+        # a function call looks up the identifier itself
+        if self.__lookahead(kinds.LBRACKET):
+            return (yield self.__parse_func_call(name))
+        self.__retrieve_symbol(self.__current_token)
+        if self.__lookahead(kinds.LARRAY):
+            return (yield self.__parse_array_access(name))
+        return name
+
+    def __parse_bracket_expression(self) -> Rule:
+        """parse expression in brackets
 
-        # ID (arrayAccess)? | ID funcCall
-        if self.__lookahead(Tag.ID):
-            self.__match(Tag.ID)
-            self.__retrieve_symbol(self.__current_token)
-            if self.__lookahead('['):
-                self.__parse_array_access()
-            elif self.__lookahead('('):
-                self.__parse_func_call()
-
-        # LBRACKET expression RBRACKET
-        elif self.__lookahead('('):
-            self.__match('(')
-            self.__parse_expression()
-            self.__match(')')
-
-        # LARRAY (expression (COMMA expression)*)? RARRAY
-        elif self.__lookahead('['):
-            self.__match('[')
-            self.__parse_expression()
-            while self.__lookahead(','):
-                self.__match(',')
-                self.__parse_expression()
-            self.__match(']')
-
-    def __parse_word_terminals(self) -> bool:
+        Returns:
+            expression node
+        """
+        self.__match(kinds.LBRACKET)
+        expression: int = yield self.__parse_expression()
+        self.__match(kinds.RBRACKET)
+        return expression
+
+    def __parse_array_expression(self) -> Rule:
+        """parse array of expressions
+
+        Returns:
+            array node
+        """
+        self.__match(kinds.LARRAY)
+        array: int = self.__token_index()
+        elements: List[int] = [(yield self.__parse_expression())]
+        while self.__lookahead(kinds.COMMA):
+            self.__match(kinds.COMMA)
+            elements.append((yield self.__parse_expression()))
+        self.__match(kinds.RARRAY)
+        return self.__tree.add_node(Syntax.ARRAY, array, elements)
+
+    def __parse_word_terminal(self) -> int:
         """parse terminal words
 
         Parse booleans and numbers
 
         Returns:
-            true on terminal match, false otherwise
-        """
-        if self.__lookahead(Tag.NUM):
-            self.__match(Tag.NUM)
-            return True
-        if self.__lookahead(Tag.REAL):
-            self.__match(Tag.REAL)
-            return True
-        if self.__lookahead(Tag.TRUE):
-            self.__match(Tag.TRUE)
-            return True
-        if self.__lookahead(Tag.FALSE):
-            self.__match(Tag.FALSE)
-            return True
-        return False
-
-    def __parse_literal_terminal(self) -> bool:
-        """parse literals
-
-        Returns:
-            true on terminal match, false otherwise
-        """
-        if self.__lookahead('\''):
-            self.__match('\'')
-            self.__match(Tag.LITERAL)
-            self.__match('\'')
-            return True
-        if self.__lookahead('"'):
-            self.__match('"')
-            self.__match(Tag.LITERAL)
-            self.__match('"')
-            return True
-        return False
+            terminal node
+        """
+        self.__match(self.__token_stream.peek_kind())
+        return self.__tree.add_node(Syntax.TERMINAL, self.__token_index())
+
+    def __parse_literal_terminal(self) -> int:
+        """parse literals enclosed in single or double quotes
+
+        Returns:
+            literal node
+        """
+        quote: int = self.__token_stream.peek_kind()
+        self.__match(quote)
+        self.__match(kinds.LITERAL)
+        literal: int = self.__token_index()
+        self.__match(quote)
+        return self.__tree.add_node(Syntax.LITERAL, literal)
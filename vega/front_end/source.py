@@ -0,0 +1,114 @@
+"""Source buffer loading for the lexical scanner
+
+Vega program code can be handed to the compiler as a path, an open file
+object, raw bytes or an in memory string. Every variant is turned into one
+contiguous text buffer which the lexer walks with an integer cursor.
+
+Files are read through a memory map, so the operating system pages the code
+in directly and the buffer is decoded in one pass instead of being read char
+by char.
+
+"""
+from io import BufferedReader
+from io import FileIO
+from io import TextIOWrapper
+from mmap import ACCESS_READ
+from mmap import mmap
+from os import PathLike
+from typing import IO
+from typing import Union
+
+Source = Union[str, bytes, bytearray, memoryview, mmap, PathLike, IO]
+
+DEFAULT_ENCODING: str = 'utf-8'
+
+
+def _universal_newlines(text: str) -> str:
+    """Translate line endings like a file opened in text mode would
+
+    Args:
+        text: decoded program code
+
+    Returns:
+        program code with '\\r\\n' and '\\r' translated to '\\n'
+    """
+    if '\r' not in text:
+        return text
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _decode(buffer: Union[bytes, bytearray, memoryview, mmap],
+            encoding: str) -> str:
+    """Decode a byte buffer into program code
+
+    Args:
+        buffer: any object supporting the buffer protocol
+        encoding: encoding of the buffer
+
+    Returns:
+        decoded program code
+    """
+    return _universal_newlines(str(buffer, encoding))
+
+
+def _map_file(fileno: int, encoding: str) -> str:
+    """Decode a file through a read only memory map
+
+    Args:
+        fileno: file descriptor of the program code file
+        encoding: encoding of the file
+
+    Returns:
+        decoded program code
+    """
+    try:
+        mapped: mmap = mmap(fileno, 0, access=ACCESS_READ)
+    except ValueError:
+        # empty files cannot be mapped
+        return ''
+    with mapped:
+        return _decode(mapped, encoding)
+
+
+def _read_file(code: IO) -> str:
+    """Read an open file object
+
+    Real files are memory mapped, every other file like object (sockets,
+    pipes, in memory streams) is read in one call.
+
+    Args:
+        code: open file object
+
+    Returns:
+        program code
+    """
+    encoding: str = getattr(code, 'encoding', None) or DEFAULT_ENCODING
+    if isinstance(code, (TextIOWrapper, BufferedReader, FileIO)):
+        try:
+            return _map_file(code.fileno(), encoding)
+        except OSError:
+            pass
+    content: Union[str, bytes] = code.read()
+    if isinstance(content, str):
+        return content
+    return _decode(content, encoding)
+
+
+def load_source(code: Source, encoding: str = DEFAULT_ENCODING) -> str:
+    """Load program code into one text buffer
+
+    Args:
+        code: path to a file, open file object, bytes or program code string
+        encoding: encoding used for paths and byte buffers
+
+    Returns:
+        program code
+    """
+    if isinstance(code, str):
+        return code
+    if isinstance(code, (bytes, bytearray, memoryview, mmap)):
+        return _decode(code, encoding)
+    if isinstance(code, PathLike):
+        with open(code, 'rb') as code_file:
+            return _map_file(code_file.fileno(), encoding)
+    return _read_file(code)
@@ -0,0 +1,431 @@
+"""Table driven vega parser
+
+Check syntax of Vega program code with the LL(1) parse tables generated from
+``resources/grammar/Vega.g4``, see ``grammar``. A driver loop pops symbols
+from a work stack: a token kind is matched against the next token, a rule
+is replaced by the production the table selects for the next token.
+
+Semantic actions are called by rule name, like listeners of generated
+parsers:
+
+    (rule, 'enter'): when a production of the rule is selected
+    (rule, 'exit'): when all symbols of the production are done
+    (rule, TOKEN): when the grammar token TOKEN of the rule is matched
+
+Actions get the last matched token and its line. ``SymbolActions`` declare
+and look up identifiers like ``Parser`` does. No syntax tree is created and
+parsing stops at the first syntax error, error recovery is left to
+``Parser``.
+
+"""
+from functools import lru_cache
+from os import PathLike
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from vega.data_structs.line_index import LineIndex
+from vega.data_structs.symbol_table import Symbol
+from vega.data_structs.symbol_table import SymbolTable
+from vega.data_structs.token_stream import Span
+from vega.front_end.diagnostics import Diagnostics
+from vega.front_end.exception import BaseError
+from vega.front_end.exception import VegaAlreadyDefinedError
+from vega.front_end.exception import VegaNoCallableError
+from vega.front_end.exception import VegaNotAssignError
+from vega.front_end.exception import VegaNotYetDefinedError
+from vega.front_end.exception import VegaSyntaxError
+from vega.front_end.grammar import Tables
+from vega.front_end.grammar import load_tables
+from vega.front_end.lexer import Lexer
+from vega.front_end.source import Source
+from vega.language import kinds
+from vega.language.token import KINDS
+from vega.language.token import TokenType
+from vega.language.token import Word
+from vega.language.types import Array
+from vega.language.types import String
+from vega.language.types import Type
+from vega.language.vocabulary import EOF
+
+ENTER: str = 'enter'
+EXIT: str = 'exit'
+
+# semantic action called with the last matched token and its line
+Action = Callable[[TokenType, int], None]
+Actions = Dict[Tuple[str, str], Action]
+
+
+@lru_cache(maxsize=None)
+def default_tables(directory: Union[str, PathLike, None] = None) -> Tables:
+    """Parse tables of the vega grammar, loaded once per process
+
+    Without a cache directory the tables are generated in memory. A cache
+    directory which cannot be written falls back to generated tables.
+
+    Args:
+        directory: cache directory of the tables, None to keep them in memory
+
+    Returns:
+        parse tables
+    """
+    return load_tables(directory)
+
+
+def _compile(tables: Tables, actions: Actions
+             ) -> Tuple[List[int], List[Tuple[int, ...]],
+                        List[Union[Action, None]], List[Action]]:
+    """Encode parse tables and actions for the driver loop
+
+    A rule symbol is the position of its table row plus ``KINDS``, so the
+    table cell is the symbol plus the token kind. Matching a token with an
+    action pushes a marker behind the token kind, the exit action of a rule
+    is a marker behind the production. Markers are negative, -1 - index of
+    the handler.
+
+    Args:
+        tables: parse tables
+        actions: semantic actions
+
+    Returns:
+        table shifted by one row, symbols of every production in push order,
+        enter action of every production and marker handlers
+    """
+    handlers: List[Action] = []
+    markers: Dict[Tuple[str, str], int] = {}
+
+    def marker(key: Tuple[str, str]) -> Union[int, None]:
+        action: Union[Action, None] = actions.get(key)
+        if action is None:
+            return None
+        if key not in markers:
+            markers[key] = -1 - len(handlers)
+            handlers.append(action)
+        return markers[key]
+
+    pushes: List[Tuple[int, ...]] = []
+    enters: List[Union[Action, None]] = []
+    for rule, symbols, marks in tables.productions:
+        owner: str = tables.rules[rule].split(':')[0]
+        helper: bool = owner != tables.rules[rule]
+        stack: List[int] = []
+        exit_marker: Union[int, None] = None if helper \
+            else marker((owner, EXIT))
+        if exit_marker is not None:
+            stack.append(exit_marker)
+        for symbol, mark in reversed(list(zip(symbols, marks))):
+            if symbol >= KINDS:
+                stack.append((symbol - KINDS + 1) * KINDS)
+                continue
+            match_marker: Union[int, None] = marker((owner, mark))
+            if match_marker is not None:
+                stack.append(match_marker)
+            stack.append(symbol)
+        pushes.append(tuple(stack))
+        enters.append(None if helper else actions.get((owner, ENTER)))
+    return [-1] * KINDS + tables.table, pushes, enters, handlers
+
+
+class TableParser:
+    """Table driven parser
+
+    Checks syntax and symbols of vega code.
+
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, code: Source,
+                 diagnostics: Union[Diagnostics, None] = None,
+                 table: Union[SymbolTable, None] = None,
+                 line: int = 1,
+                 tables: Union[Tables, None] = None) -> None:
+        """Init method
+
+        Args:
+            code: Vega program code (path, file object, bytes or string)
+            diagnostics: collector of errors, None to raise the first
+            table: symbol table to start with, a new one if None
+            line: line number the code starts at
+            tables: parse tables, those of the vega grammar if None
+        """
+        self.__diagnostics: Union[Diagnostics, None] = diagnostics
+        self.__lexer: Lexer = Lexer(code, line=line)
+        self.__line: int = line
+        self.__line_index: LineIndex = self.__lexer.line_index
+        self.__tables: Tables = tables if tables is not None \
+            else default_tables()
+        self.__table: SymbolTable = table if table is not None \
+            else SymbolTable()
+        self.__span: Tuple[int, int] = (-1, -1)
+        self.__stopped: bool = False
+
+    @property
+    def table(self) -> SymbolTable:
+        """Table property
+
+        Returns:
+            symbol table of the checked code
+        """
+        return self.__table
+
+    def report(self, error: BaseError) -> None:
+        """Report error at the last matched token
+
+        Without diagnostics the error is raised, otherwise it is collected.
+        Parsing stops once the diagnostics are full.
+
+        Args:
+            error: error to report
+
+        Raises:
+            BaseError: if errors are not collected
+        """
+        start, end = self.__span
+        if start >= 0:
+            error.locate(self.__line_index, start, end)
+        if self.__diagnostics is None:
+            raise error
+        self.__diagnostics.add(error)
+        if self.__diagnostics.full:
+            self.__stopped = True
+
+    def parse(self, actions: Union[Actions, None] = None) -> None:
+        """Check program code
+
+        Args:
+            actions: semantic actions, ``SymbolActions`` if None
+
+        Raises:
+            BaseError: first error if errors are not collected
+        """
+        if actions is None:
+            actions = SymbolActions(self.__table, self.report).actions()
+        table, pushes, enters, handlers = _compile(self.__tables, actions)
+        spans: Iterator[Span] = self.__lexer.spans()
+        stack: List[int] = [KINDS]
+        pop: Callable[[], int] = stack.pop
+        extend: Callable[[Tuple[int, ...]], None] = stack.extend
+
+        matched: TokenType = EOF
+        matched_line: int = self.__line
+        span: Union[Span, None] = next(spans, None)
+        token, line, start, end = span if span is not None \
+            else (EOF, matched_line, 0, 0)
+        kind: int = token.kind
+        while stack:
+            symbol: int = pop()
+            if symbol >= KINDS:
+                production: int = table[symbol + kind]
+                if production < 0:
+                    self.__syntax_error(matched, token, line, start, end)
+                    return
+                extend(pushes[production])
+                enter: Union[Action, None] = enters[production]
+                if enter is not None:
+                    enter(matched, matched_line)
+                    if self.__stopped:
+                        return
+            elif symbol >= 0:
+                if symbol != kind:
+                    self.__syntax_error(matched, token, line, start, end)
+                    return
+                matched, matched_line = token, line
+                self.__span = (start, end)
+                span = next(spans, None)
+                if span is None:
+                    token, line, start = EOF, matched_line, end
+                else:
+                    token, line, start, end = span
+                kind = token.kind
+            else:
+                handlers[-1 - symbol](matched, matched_line)
+                if self.__stopped:
+                    return
+
+    # pylint: disable=too-many-arguments
+    def __syntax_error(self, matched: TokenType, token: TokenType,
+                       line: int, start: int, end: int) -> None:
+        """Report syntax error at the next token
+
+        Args:
+            matched: last matched token
+            token: next token, no production or token kind expects it
+            line: line of the next token
+            start: buffer position of the next token
+            end: buffer position behind the next token
+
+        Raises:
+            VegaSyntaxError: if errors are not collected
+        """
+        self.__span = (start, end)
+        self.report(VegaSyntaxError(matched, token, line))
+
+
+class SymbolActions:
+    """Semantic actions declaring and looking up identifiers
+
+    Function names are declared in the enclosing scope, parameters in the
+    scope of the function and variables in the scope of the statement.
+    Identifiers must be declared before they are used, declared only once,
+    functions are the only callables and neither functions nor constants
+    can be assigned.
+
+    """
+
+    def __init__(self, table: SymbolTable,
+                 report: Callable[[BaseError], None]) -> None:
+        """Init method
+
+        Args:
+            table: symbol table
+            report: callback reporting errors
+        """
+        self.__table: SymbolTable = table
+        self.__report: Callable[[BaseError], None] = report
+        # declared symbols stored once their type is complete
+        self.__pending: List[Symbol] = []
+        self.__type: Union[Type, TokenType, None] = None
+        self.__const: bool = False
+        # declared function stored once its return type is complete
+        self.__function: Union[Symbol, None] = None
+        # identifier operand looked up by its array access, call or at the
+        # end of the operand
+        self.__operand: Union[Word, None] = None
+        self.__operand_line: int = 0
+        # number of scopes up to the scope of each function
+        self.__functions: List[int] = []
+
+    def actions(self) -> Actions:
+        """Actions by rule name and grammar token
+
+        Returns:
+            semantic actions
+        """
+        actions: Actions = {
+            ('block', 'ID'): self.__declare_function,
+            ('functionReturnType', 'LARRAY'): self.__array_type,
+            ('functionReturnType', EXIT): self.__store_function,
+            ('functionParameterDefinition', 'ID'): self.__declare_parameter,
+            ('variableType', 'LARRAY'): self.__array_type,
+            ('variableType', EXIT): self.__store_variables,
+            ('scopeStatement', 'LCURLY'): self.__enter_scope,
+            ('scopeStatement', EXIT): self.__leave_scope,
+            ('declarationStatement', ENTER): self.__declare_first,
+            ('declarationStatement', 'ID'): self.__declare_variable,
+            ('declarationStatement', 'CONST'): self.__constant,
+            ('assignStatement', ENTER): self.__assign,
+            ('funcCall', ENTER): self.__call,
+            ('unary', 'ID'): self.__operand_identifier,
+            ('unary', EXIT): self.__resolve_operand,
+            ('arrayAccess', ENTER): self.__resolve_operand,
+        }
+        for token in ('INT_TYPE', 'FLOAT_TYPE', 'CHAR_TYPE', 'BOOL_TYPE',
+                      'STRING_TYPE'):
+            actions[('terminalVariableType', token)] = self.__basic_type
+        return actions
+
+    def __declared(self, identifier: Word, line: int) -> Symbol:
+        """Create symbol of an identifier which must not be declared yet
+
+        Args:
+            identifier: identifier
+            line: line of the identifier
+
+        Returns:
+            symbol to store
+        """
+        if self.__table.lookup(identifier.id):
+            self.__report(VegaAlreadyDefinedError(identifier, line))
+        return Symbol(identifier.lexeme, False, False, None)
+
+    def __retrieved(self, identifier: Word, line: int
+                    ) -> Union[Symbol, None]:
+        """Retrieve symbol of an identifier which must be declared
+
+        Args:
+            identifier: identifier
+            line: line of the identifier
+
+        Returns:
+            symbol, None if not declared
+        """
+        symbol: Union[Symbol, None]
+        symbol, _ = self.__table.retrieve(identifier.id)
+        if symbol is None:
+            self.__report(VegaNotYetDefinedError(identifier.lexeme, line))
+        return symbol
+
+    def __declare_function(self, identifier: Word, line: int) -> None:
+        symbol: Symbol = self.__declared(identifier, line)
+        symbol.callable = True
+        self.__table.store(symbol)
+        self.__table.enter_scope(symbol.name)
+        self.__functions.append(len(self.__table))
+        self.__function = symbol
+
+    def __declare_parameter(self, identifier: Word, line: int) -> None:
+        self.__pending = [self.__declared(identifier, line)]
+        self.__const = False
+
+    def __basic_type(self, token: TokenType, _: int) -> None:
+        self.__type = String() if token.kind == kinds.TYPE else token
+
+    def __array_type(self, *_) -> None:
+        self.__type = Array(self.__type)
+
+    def __store_function(self, *_) -> None:
+        if self.__function is not None:
+            self.__function.type = self.__type
+            self.__table.store(self.__function)
+            self.__function = None
+
+    def __store_variables(self, *_) -> None:
+        for symbol in self.__pending:
+            symbol.const = self.__const
+            symbol.type = self.__type
+            self.__table.store(symbol)
+        self.__pending = []
+
+    def __enter_scope(self, *_) -> None:
+        self.__table.enter_scope('scope')
+
+    def __leave_scope(self, *_) -> None:
+        self.__table.leave_scope()
+        if self.__functions and len(self.__table) == self.__functions[-1]:
+            self.__table.leave_scope()
+            self.__functions.pop()
+
+    def __declare_first(self, identifier: Word, line: int) -> None:
+        self.__pending = [self.__declared(identifier, line)]
+        self.__const = False
+
+    def __declare_variable(self, identifier: Word, line: int) -> None:
+        self.__pending.append(self.__declared(identifier, line))
+
+    def __constant(self, *_) -> None:
+        self.__const = True
+
+    def __assign(self, identifier: Word, line: int) -> None:
+        symbol: Union[Symbol, None] = self.__retrieved(identifier, line)
+        if symbol is not None and (symbol.callable or symbol.const):
+            self.__report(VegaNotAssignError(identifier, line))
+
+    def __call(self, identifier: Word, line: int) -> None:
+        if self.__operand is not None:
+            identifier, line = self.__operand, self.__operand_line
+            self.__operand = None
+        symbol: Union[Symbol, None] = self.__retrieved(identifier, line)
+        if symbol is not None and not symbol.callable:
+            self.__report(VegaNoCallableError(identifier, line))
+
+    def __operand_identifier(self, identifier: Word, line: int) -> None:
+        self.__operand = identifier
+        self.__operand_line = line
+
+    def __resolve_operand(self, *_) -> None:
+        if self.__operand is not None:
+            self.__retrieved(self.__operand, self.__operand_line)
+            self.__operand = None
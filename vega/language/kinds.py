@@ -0,0 +1,64 @@
+"""Token kinds of vega language
+
+Every token has a dense integer kind: one char tokens are identified by their
+code point below 256, all other tokens by their tag id from 256 on. Kinds
+index flat lists of ``token.KINDS`` entries, so parser tables need no hashing.
+
+One char kinds are named after the tokens of the vega grammar.
+
+"""
+from vega.language.token import Tag
+
+# one char tokens
+PLUS: int = ord('+')
+MINUS: int = ord('-')
+MULT: int = ord('*')
+DIV: int = ord('/')
+LBRACKET: int = ord('(')
+RBRACKET: int = ord(')')
+LCURLY: int = ord('{')
+RCURLY: int = ord('}')
+LARRAY: int = ord('[')
+RARRAY: int = ord(']')
+COLON: int = ord(':')
+COMMA: int = ord(',')
+ASSIGN: int = ord('=')
+LESS: int = ord('<')
+GREATER: int = ord('>')
+DELIMITER: int = ord(';')
+DQUOTE: int = ord('"')
+SQUOTE: int = ord("'")
+
+# words, numbers and literals
+EQ: int = Tag.EQ.value
+LE: int = Tag.LE.value
+GE: int = Tag.GE.value
+NE: int = Tag.NE.value
+CONST: int = Tag.CONST.value
+FUNC: int = Tag.FUNC.value
+WHILE: int = Tag.WHILE.value
+IF: int = Tag.IF.value
+ELIF: int = Tag.ELIF.value
+ELSE: int = Tag.ELSE.value
+RETURN_TYPE: int = Tag.RETURN_TYPE.value
+RETURN: int = Tag.RETURN.value
+PASS: int = Tag.PASS.value
+CONTINUE: int = Tag.CONTINUE.value
+BREAK: int = Tag.BREAK.value
+TRUE: int = Tag.TRUE.value
+FALSE: int = Tag.FALSE.value
+NOT: int = Tag.NOT.value
+AND: int = Tag.AND.value
+BOOL_AND: int = Tag.BOOL_AND.value
+OR: int = Tag.OR.value
+BOOL_OR: int = Tag.BOOL_OR.value
+INDEX: int = Tag.INDEX.value
+ID: int = Tag.ID.value
+BASIC: int = Tag.BASIC.value
+FUNCTION: int = Tag.FUNCTION.value
+TYPE: int = Tag.TYPE.value
+NUM: int = Tag.NUM.value
+REAL: int = Tag.REAL.value
+LITERAL: int = Tag.LITERAL.value
+EOF: int = Tag.EOF.value
+CHAR: int = Tag.CHAR.value
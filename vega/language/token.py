@@ -6,8 +6,11 @@ Define Tokens lexical scanner creates from vega program code
 from enum import Enum
 from enum import auto
 from typing import Any
+from typing import Tuple
 from typing import Union
 
+from vega.data_structs.intern_pool import POOL
+
 
 class AutoID(Enum):
     """Create new ``Enum`` element for Token IDs"""
@@ -65,6 +68,31 @@ class Tag(AutoID):
     NUM = auto()  # normal numbers
     REAL = auto()  # real numbers
     LITERAL = auto()  # literals '/"
+    EOF = auto()  # end of program code
+    CHAR = auto()  # one char tokens outside of latin-1
+
+
+# number of token kinds: code points of one char tokens below 256 followed
+# by the tag ids
+KINDS: int = 256 + len(Tag)
+
+
+def kind_of(tag: Union[Tag, str]) -> int:
+    """Get integer kind of a token tag
+
+    One char tags are identified by their code point, one char tags outside of
+    latin-1 share the ``CHAR`` kind. All other tags by their tag id.
+
+    Args:
+        tag: token tag
+
+    Returns:
+        token kind
+    """
+    if isinstance(tag, Tag):
+        return tag.value
+    code: int = ord(tag)
+    return code if code < 256 else Tag.CHAR.value
 
 
 class Token:
@@ -76,6 +104,8 @@ class Token:
 
     """
 
+    __slots__ = ('__tag', '__kind')
+
     def __init__(self, tag: Union[Tag, str]) -> None:
         """Create new token with its tag
 
@@ -83,6 +113,7 @@ class Token:
             tag: token tag
         """
         self.__tag = tag
+        self.__kind: int = kind_of(tag)
 
     @property
     def tag(self) -> Union[Tag, str]:
@@ -93,6 +124,15 @@ class Token:
         """
         return self.__tag
 
+    @property
+    def kind(self) -> int:
+        """Kind property
+
+        Returns:
+            dense integer kind of the token tag
+        """
+        return self.__kind
+
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({self.tag!r})'
 
@@ -100,19 +140,70 @@ class Token:
         return f'{self.tag}'
 
 
-class Num(Token):
+class SpanToken(Token):
+    """Base class of tokens with a value taken from program code
+
+    The lexer only records the span of the lexeme in the code buffer. The
+    value is created from the span the first time it is read, so scanning
+    never copies the lexeme of a token nobody looks at.
+
+    """
+
+    __slots__ = ('__source', '__start', '__end')
+
+    def __init__(self, tag: Tag, source: str, start: int, end: int) -> None:
+        """Create token from a span of program code
+
+        Args:
+            tag: token tag
+            source: code buffer
+            start: buffer position of the lexeme
+            end: buffer position behind the lexeme
+        """
+        super().__init__(tag)
+        self.__source = source
+        self.__start = start
+        self.__end = end
+
+    @property
+    def span(self) -> Tuple[int, int]:
+        """Span property
+
+        Returns:
+            start and end position of the lexeme in the code buffer
+        """
+        return self.__start, self.__end
+
+    def _lexeme(self) -> str:
+        """Copy lexeme out of the code buffer and release the buffer
+
+        Returns:
+            lexeme
+        """
+        lexeme: str = self.__source[self.__start:self.__end]
+        self.__source = ''
+        return lexeme
+
+
+class Num(SpanToken):
     """Number tokens
 
     Represent integer numbers
     """
 
-    def __init__(self, value: int) -> None:
+    __slots__ = ('__value',)
+
+    def __init__(self, value: Union[int, None] = None, source: str = '',
+                 start: int = 0, end: int = 0) -> None:
         """Create number token with number id and store integer value
 
         Args:
-            value: integer value
+            value: integer value, None to read it from the span
+            source: code buffer
+            start: buffer position of the digits
+            end: buffer position behind the digits
         """
-        super().__init__(Tag.NUM)
+        super().__init__(Tag.NUM, source, start, end)
         self.__value = value
 
     @property
@@ -122,6 +213,8 @@ class Num(Token):
         Returns:
             integer value
         """
+        if self.__value is None:
+            self.__value = int(self._lexeme())
         return self.__value
 
     def __repr__(self) -> str:
@@ -137,8 +230,13 @@ class Word(Token):
     Words can be keywords like while, if, func or identifiers like i, var1,
     var2 or combined tokens like ==, <=, ->
 
+    Every lexeme is interned in the process wide ``POOL``, the resulting id
+    can be used as key instead of the lexeme.
+
     """
 
+    __slots__ = ('__lexeme', '__id')
+
     def __init__(self, lexeme: str, tag: Tag) -> None:
         """Create word token
 
@@ -148,6 +246,7 @@ class Word(Token):
         """
         super().__init__(tag)
         self.__lexeme = lexeme
+        self.__id = POOL.intern(lexeme)
 
     @property
     def lexeme(self) -> str:
@@ -158,6 +257,15 @@ class Word(Token):
         """
         return self.__lexeme
 
+    @property
+    def id(self) -> int:
+        """Id property
+
+        Returns:
+            interned id of the lexeme
+        """
+        return self.__id
+
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({self.lexeme!r})'
 
@@ -165,19 +273,25 @@ class Word(Token):
         return f'{self.lexeme}'
 
 
-class Real(Token):
+class Real(SpanToken):
     """Real token
 
     Token for real numbers
     """
 
-    def __init__(self, value: float) -> None:
+    __slots__ = ('__value',)
+
+    def __init__(self, value: Union[float, None] = None, source: str = '',
+                 start: int = 0, end: int = 0) -> None:
         """Create token with real tag and store real number value
 
         Args:
-            value: real(floating) number value
+            value: real(floating) number value, None to read it from the span
+            source: code buffer
+            start: buffer position of the number
+            end: buffer position behind the number
         """
-        super().__init__(Tag.REAL)
+        super().__init__(Tag.REAL, source, start, end)
         self.__value = value
 
     @property
@@ -187,6 +301,8 @@ class Real(Token):
         Returns:
             floating number value
         """
+        if self.__value is None:
+            self.__value = float(self._lexeme())
         return self.__value
 
     def __repr__(self) -> str:
@@ -196,7 +312,7 @@ class Real(Token):
         return f'{self.value}'
 
 
-class Literal(Token):
+class Literal(SpanToken):
     """Literal Token
 
     Token for literals e.g. strings or characters, everything enclosed in
@@ -204,13 +320,19 @@ class Literal(Token):
 
     """
 
-    def __init__(self, content: str) -> None:
+    __slots__ = ('__content',)
+
+    def __init__(self, content: Union[str, None] = None, source: str = '',
+                 start: int = 0, end: int = 0) -> None:
         """Create token with literal tag and literal content
 
         Args:
-            content: literal content
+            content: literal content, None to read it from the span
+            source: code buffer
+            start: buffer position of the content
+            end: buffer position behind the content
         """
-        super().__init__(Tag.LITERAL)
+        super().__init__(Tag.LITERAL, source, start, end)
         self.__content = content
 
     @property
@@ -220,6 +342,8 @@ class Literal(Token):
         Returns:
             literal content
         """
+        if self.__content is None:
+            self.__content = self._lexeme()
         return self.__content
 
     def __repr__(self) -> str:
@@ -229,4 +353,8 @@ class Literal(Token):
         return f'{self.content}'
 
 
+# span token class of every tag value
+SPAN_TOKENS = {Tag.NUM.value: Num, Tag.REAL.value: Real,
+               Tag.LITERAL.value: Literal}
+
 TokenType = Union[Token, Word, Num, Real, Literal, str]
@@ -25,6 +25,8 @@ class Type(Word):
 
     """
 
+    __slots__ = ('__width',)
+
     def __init__(self, var_type: str, tag: Tag, width: int) -> None:
         """Create new variable type
 
@@ -61,6 +63,8 @@ class Array(Type):
 
     """
 
+    __slots__ = ('__size', '__dimensions', '__type')
+
     def __init__(self, var_type: Type, **kwargs) -> None:
         """Create new array
 
@@ -117,6 +121,8 @@ class String(Array):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         """Create char array"""
         super().__init__(CHAR, **kwargs)
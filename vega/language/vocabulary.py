@@ -2,10 +2,21 @@
 
 Define keywords and words for lexical scanning
 
+The vocabulary fingerprint hashes all tags, keywords and operators, files
+holding data derived from the vocabulary store it to detect changes.
+
+One char language elements like punctuation and operators are preallocated
+as flyweight tokens, every occurrence in program code shares the same token.
+
 """
+import hashlib
+from typing import Dict
 from typing import List
 
+from vega.data_structs.intern_pool import POOL
+from vega.data_structs.intern_pool import InternPool
 from vega.language.token import Tag
+from vega.language.token import Token
 from vega.language.token import Word
 from vega.language.types import BOOL
 from vega.language.types import CHAR
@@ -13,13 +24,26 @@ from vega.language.types import FLOAT
 from vega.language.types import INT
 
 RETURN_TYPE = Word("->", Tag.RETURN_TYPE)
-EQ = Word("<=", Tag.EQ)
+EQ = Word("==", Tag.EQ)
 NE = Word("!=", Tag.NE)
 LE = Word("<=", Tag.LE)
 GE = Word(">=", Tag.GE)
 BOOL_AND = Word("&&", Tag.BOOL_AND)
 BOOL_OR = Word("||", Tag.BOOL_OR)
 
+# sentinel returned when looking ahead behind the last token
+EOF = Word("end of file", Tag.EOF)
+
+operators: List = [
+    BOOL_AND,
+    BOOL_OR,
+    EQ,
+    NE,
+    LE,
+    GE,
+    RETURN_TYPE
+]
+
 keywords: List = [
     INT,
     FLOAT,
@@ -42,3 +66,61 @@ keywords: List = [
     Word("or", Tag.OR),
     Word("not", Tag.NOT)
 ]
+
+for keyword in keywords + operators:
+    POOL.put(keyword.lexeme, keyword)
+
+
+def _fingerprint() -> bytes:
+    """Hash the vocabulary tokens are created from
+
+    Returns:
+        fingerprint of tags, keywords and operators
+    """
+    vocabulary_hash = hashlib.blake2b(digest_size=16)
+    vocabulary_hash.update(repr((
+        [(tag.name, tag.value) for tag in Tag],
+        [(word.lexeme, word.tag.name) for word in keywords + operators],
+    )).encode('utf-8'))
+    return vocabulary_hash.digest()
+
+
+FINGERPRINT: bytes = _fingerprint()
+
+PUNCTUATION: str = '()[]{};:,.=+-*/<>!&|\'"'
+
+punctuation: Dict[str, Token] = {char: Token(char) for char in PUNCTUATION}
+
+
+def token(char: str) -> Token:
+    """Get token of a one char language element
+
+    Args:
+        char: one char language element
+
+    Returns:
+        flyweight token for punctuation and operators, new token otherwise
+    """
+    flyweight: Token = punctuation.get(char)
+    if flyweight is None:
+        return Token(char)
+    return flyweight
+
+
+def word(lexeme: str, pool: InternPool = POOL) -> Word:
+    """Get keyword, operator or identifier
+
+    New identifiers are stored in the interning pool.
+
+    Args:
+        lexeme: lexeme of the word
+        pool: interning pool of keywords and identifiers
+
+    Returns:
+        word of the lexeme
+    """
+    found: Word = pool.get(lexeme)
+    if found is None:
+        found = Word(lexeme, Tag.ID)
+        pool.put(lexeme, found)
+    return found
@@ -3,6 +3,8 @@
 A hash table is used in meany places in the compiler. Mainly as a storage for
 symbols in the symbol table for lookups on variables.
 
+Keys can be strings or integers like the interned ids of lexemes.
+
 """
 
 from random import sample
@@ -10,6 +12,8 @@ from typing import Any
 from typing import List
 from typing import Union
 
+Key = Union[str, int]
+
 
 class Bucket:
     """Bucket
@@ -22,19 +26,21 @@ class Bucket:
 
     """
 
-    def __init__(self, key: str, data: Any) -> None:
+    __slots__ = ('__key', '__data', '__next')
+
+    def __init__(self, key: Key, data: Any) -> None:
         """Create new bucket with a name and data to be stored
 
         Args:
             key: name or identifier for the data
             data: data to be stored
         """
-        self.__key: str = key
+        self.__key: Key = key
         self.__data: Any = data
         self.__next: Union['Bucket', None] = None
 
     @property
-    def key(self) -> str:
+    def key(self) -> Key:
         """Key property
 
         Returns:
@@ -43,7 +49,7 @@ class Bucket:
         return self.__key
 
     @key.setter
-    def key(self, key: str) -> None:
+    def key(self, key: Key) -> None:
         self.__key = key
 
     @property
@@ -167,7 +173,7 @@ class HashTable:
     def __len__(self) -> int:
         return self.__count
 
-    def __gen_hash(self, key: str) -> int:
+    def __gen_hash(self, key: Key) -> int:
         """Generate hash of a given key
 
         The hash function works as follows:
@@ -181,6 +187,9 @@ class HashTable:
             set this number to new hash_code
         Iterate through key till the end
 
+        Integer keys are hashed the same way byte by byte, starting with the
+        lowest byte.
+
         Args:
             key: key to generate hash for
 
@@ -188,11 +197,18 @@ class HashTable:
             hash of the key
         """
         hash_code = 0
+        if isinstance(key, int):
+            hash_code = self.__rand8[key & 0xff]
+            key >>= 8
+            while key > 0:
+                hash_code = self.__rand8[hash_code ^ (key & 0xff)]
+                key >>= 8
+            return hash_code
         for char in key:
             hash_code = self.__rand8[hash_code ^ ord(char)]
         return hash_code
 
-    def get(self, key: str) -> Union[Any, None]:
+    def get(self, key: Key) -> Union[Any, None]:
         """Get element from hash table by key
 
         Args:
@@ -210,7 +226,7 @@ class HashTable:
                     return bucket.data
         return None
 
-    def put(self, key: str, data: Any) -> None:
+    def put(self, key: Key, data: Any) -> None:
         """Store element in hash table
 
         Args:
@@ -235,6 +251,44 @@ class HashTable:
 
         self.__count += 1
 
+    def delete(self, key: Key) -> bool:
+        """Delete element from hash table
+
+        Deleting an element which shares its slot with others takes back one
+        collision, so the count follows the chains left in the table.
+
+        Args:
+            key: key to identify element in hash table
+
+        Returns:
+            True if an element has been deleted, False if none was found
+        """
+        hash_code = self.__gen_hash(key)
+        previous: Union[Bucket, None] = None
+        bucket: Union[Bucket, None] = self.__data[hash_code]
+        while bucket is not None:
+            if bucket.key == key:
+                if previous is None:
+                    self.__data[hash_code] = bucket.next
+                else:
+                    previous.next = bucket.next
+                if previous is not None or bucket.next is not None:
+                    self.__collisions -= 1
+                self.__count -= 1
+                return True
+            previous, bucket = bucket, bucket.next
+        return False
+
+    def clear(self) -> None:
+        """Delete all elements from hash table
+
+        The seed of the hash function is kept, so a cleared hash table can
+        be reused without drawing a new one.
+        """
+        self.__data = [None] * self.__size
+        self.__count = 0
+        self.__collisions = 0
+
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({self.size!r})'
 
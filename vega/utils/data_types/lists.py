@@ -6,6 +6,8 @@ from typing import Union
 class Node:
     """Single element in any list"""
 
+    __slots__ = ('__data', '__prev', '__next')
+
     def __init__(self, data: Any) -> None:
         """
 